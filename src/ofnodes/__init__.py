@@ -2,9 +2,27 @@ __docformat__ = "restructuredtext"
 
 import logging
 from ofnodes.nodes.singlynode import SinglyNode
-from ofnodes.structures.singlylinkedlist import SinglyLinkedList
+from ofnodes.structures.singlylinkedlist import SinglyLinkedList, kway_merge
 from ofnodes.structures.randomaccessarray import RandomAccessArray
+from ofnodes.structures.arrayview import RandomAccessArrayView
+from ofnodes.structures.sharedrandomaccessarray import SharedRandomAccessArray
+from ofnodes.structures.ndrandomaccessarray import NDRandomAccessArray
+from ofnodes.structures.sparserandomaccessarray import SparseRandomAccessArray
+from ofnodes.structures.bitarray import BitArray
+from ofnodes.structures.rangeindex import FenwickTree, SegmentTree
+from ofnodes.structures.binaryheap import BinaryHeap, PriorityQueue
+from ofnodes.nodes.skipnode import SkipNode
+from ofnodes.structures.skiplist import SkipList
 from ofnodes.structures.stack import Stack
+from ofnodes.structures.concurrentstack import ConcurrentStack
+from ofnodes.structures.asyncstack import AsyncStack
+from ofnodes.structures.asyncqueue import AsyncQueue
+from ofnodes.structures.queue import Queue
+from ofnodes.nodes.doublynode import DoublyNode
+from ofnodes.structures.deque import Deque
+from ofnodes.structures.ringbuffer import RingBuffer
+from ofnodes.nodes.frozensinglynode import FrozenSinglyNode
+from ofnodes.structures.persistentlinkedlist import PersistentLinkedList, to_singly_linked_list, from_singly_linked_list
 
 
 
@@ -23,6 +41,8 @@ Here is what ofnodes can do:
     - implement a node object with a unidirectional pointer
     - implement and manipulate a linked list object of unidirectional,
     i.e., 'singly linked' nodes.
+    - implement a persistent linked list of immutable nodes whose versions
+    share their tails.
 
 Included in the library is a Tail descriptor designed to manage the tail attribute of
 linked data structures. While the primary purpose of the Tail descriptor is to
@@ -32,4 +52,4 @@ structures. By adhering to these design principles, the library promotes safe an
 reliable usage of linked data structures, reducing the risk of unintended cyclic
 references and associated issues.
 """
-__all__ = ['SinglyNode','SinglyLinkedList', 'RandomAccessArray', 'Stack']
\ No newline at end of file
+__all__ = ['SinglyNode','SinglyLinkedList', 'kway_merge', 'RandomAccessArray', 'RandomAccessArrayView', 'SharedRandomAccessArray', 'NDRandomAccessArray', 'SparseRandomAccessArray', 'BitArray', 'FenwickTree', 'SegmentTree', 'BinaryHeap', 'PriorityQueue', 'SkipNode', 'SkipList', 'Stack', 'ConcurrentStack', 'AsyncStack', 'AsyncQueue', 'Queue', 'DoublyNode', 'Deque', 'RingBuffer', 'FrozenSinglyNode', 'PersistentLinkedList', 'to_singly_linked_list', 'from_singly_linked_list']
\ No newline at end of file
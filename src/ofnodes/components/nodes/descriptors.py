@@ -72,3 +72,43 @@ class Next:
         raise AttributeError(
             f"{type(instance).__name__}'s `next` attribute cannot be deleted."
         )
+
+
+class Prev:
+    """Descriptor for managing prev attribute in doubly linked nodes.
+
+    This descriptor restricts direct setting and deletion of the prev attribute
+    to enforce proper modification of linked structures.
+
+    Attributes:
+        None
+
+    Methods:
+        __get__(self, instance, owner): Getter method for retrieving the value of the prev attribute.
+        __set__(self, instance, value): Setter method for setting the value of the prev attribute.
+        __delete__(self, instance): Deleter method for deleting the prev attribute.
+
+    """
+    __slots__ = ()
+    def __get__(self, instance, owner):
+        """Getter property for the previous node in the doubly linked structure.
+
+        Note:
+            Modifying the previous node should be done using the structure's methods
+            for consistency and to maintain the integrity of the linked structure.
+        """
+        return instance._prev
+
+    def __set__(self, instance, value):
+        """Setter method for setting the value of the prev attribute."""
+        raise AttributeError("Cannot set 'prev' attribute directly. Use linked structure methods for modification.")
+
+    def __delete__(self, instance):
+        """Deleter property for the prev attribute of the doubly node.
+
+        Raises:
+            AttributeError: Deleting the `prev` attribute is not allowed.
+        """
+        raise AttributeError(
+            f"{type(instance).__name__}'s `prev` attribute cannot be deleted."
+        )
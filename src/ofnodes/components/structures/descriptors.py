@@ -60,7 +60,7 @@ class Head:
             node = SinglyNode(value)
 
         match instance.__class__.__name__:
-            case 'Stack':
+            case 'Stack' | 'ConcurrentStack' | 'AsyncStack':
                 if instance._head is None:
                     instance._head = node
                     #instance._tail = node
@@ -74,6 +74,7 @@ class Head:
                 else:
                     setattr(node, '_next', instance._head)
                     instance._head = node
+                instance._invalidate_index()
 
     def __delete__(self, instance):
         """Deleter method for the head/top of the data structure.
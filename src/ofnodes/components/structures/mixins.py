@@ -1,3 +1,8 @@
+import asyncio
+import sys
+from collections import deque
+from copy import deepcopy
+from math import isqrt
 from typing import Any, Optional
 from ofnodes.nodes.singlynode import SinglyNode
 
@@ -155,6 +160,8 @@ class RemoveMixin:
             if current_node.next.data == self._target:
                 node = current_node.next
                 setattr(current_node, '_next', current_node.next.next)
+                if hasattr(self, '_invalidate_index'):
+                    self._invalidate_index()
                 return node
             current_node = current_node.next
 
@@ -192,7 +199,7 @@ class RemoveMixin:
                 LinkedStructure(head=None, tail=None)
         """
         match self.__class__.__name__:
-            case 'Stack':
+            case 'Stack' | 'ConcurrentStack' | 'AsyncStack':
                 if self._head and self._head._next:
                     node = self._head
                     self._head = self._head._next
@@ -203,6 +210,18 @@ class RemoveMixin:
                     return  node
                 raise ValueError("Cannot remove head from empty linked structure")
             case 'SinglyLinkedList':
+                self._invalidate_index()
+                if self._head and self._head is self._tail:
+                    node = self._head
+                    self._head = None
+                    self._tail = None
+                    return  node
+                if self._head and self._head is not self._tail:
+                    node = self._head
+                    self._head = self._head._next
+                    return node
+                raise ValueError("Cannot remove head from empty linked structure")
+            case 'Queue' | 'AsyncQueue':
                 if self._head and self._head is self._tail:
                     node = self._head
                     self._head = None
@@ -224,6 +243,8 @@ class RemoveMixin:
             case None:
                 raise ValueError("Cannot remove tail from empty list")
             case self._head:
+                if hasattr(self, '_invalidate_index'):
+                    self._invalidate_index()
                 if not getattr(self._head, "_next"):
                     # it's a one node list
                     node = self._tail
@@ -246,8 +267,81 @@ class RemoveMixin:
                 return old_tail
 
 class PrintMixin:
-    """Mixin class providing node data print functionality"""
+    """Mixin class providing node data print functionality
+
+    The representations of large structures are truncated: when a structure holds more
+    than twice `repr_edge_items` nodes, only the first and last `repr_edge_items` data
+    are formatted, followed by the node count. Set `repr_edge_items` to None on a class
+    or subclass to always format every node, or use `write_to` to stream all of them.
+    """
     __slots__ = ()
+
+    repr_edge_items = 10
+
+    def _format_edges(self, formatter, separator) -> tuple[str, Optional[int]]:
+        """Traverses the structure once, formatting only the data shown in a representation.
+
+        Args:
+            formatter (Callable): Formats one node's data, e.g., `repr` or `str`.
+            separator (str): Joins the formatted data.
+
+        Returns:
+            tuple[str, Optional[int]]: The joined data and, if it was truncated, the
+                node count; otherwise None.
+        """
+        edge = self.repr_edge_items
+        leading, trailing = [], deque(maxlen=edge)
+        count = 0
+        current_node = self._head
+        while current_node:
+            if edge is None or count < 2 * edge:
+                leading.append(current_node._data)
+            else:
+                trailing.append(current_node._data)
+            count += 1
+            current_node = current_node._next
+        if edge is None or count <= 2 * edge:
+            return separator.join(formatter(data) for data in leading), None
+        trailing = (leading[edge:] + list(trailing))[-edge:]
+        shown = [formatter(data) for data in leading[:edge]]
+        shown.append('...')
+        shown.extend(formatter(data) for data in trailing)
+        return separator.join(shown), count
+
+    def write_to(self, stream, fmt: str = "{}\n", chunk_size: int = 1024) -> None:
+        """Streams the data of every node to a text stream in bounded-size writes.
+
+        The formatted data of `chunk_size` nodes is joined and written at once, so memory
+        stays proportional to `chunk_size` and the stream is called once per chunk instead
+        of once per node.
+
+        Args:
+            stream: A text stream, e.g., `sys.stdout` or a file opened in text mode.
+            fmt (str): A `str.format` template applied to each node's data. Defaults to
+                one `str()` per line.
+            chunk_size (int): The number of nodes formatted per write. Defaults to 1024.
+
+        Raises:
+            ValueError: If `chunk_size` is less than one.
+
+        Examples:
+            >>> import sys
+            >>> SinglyLinkedList(['foo', 42]).write_to(sys.stdout, fmt="{!r},")
+            'foo',42,
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        chunk = []
+        current_node = self._head
+        while current_node:
+            chunk.append(fmt.format(current_node._data))
+            if len(chunk) == chunk_size:
+                stream.write(''.join(chunk))
+                chunk.clear()
+            current_node = current_node._next
+        if chunk:
+            stream.write(''.join(chunk))
+
     def print_node_data(self) -> None:
         """Traverse the linked data structure and print the data attribute of each node.
 
@@ -256,7 +350,8 @@ class PrintMixin:
 
         Notes:
             This method iterates through the linked data structure starting from the head node and prints the data attribute of each node
-            until the end of the linked structure is reached.
+            until the end of the linked structure is reached. The output is written to
+            `sys.stdout` in chunks through `write_to`.
 
         Examples:
             >>> sllist = SinglyLinkedList()
@@ -272,10 +367,7 @@ class PrintMixin:
             3 node
             4 node
         """
-        current_node = self._head
-        while current_node:
-            print(current_node.data)
-            current_node = current_node.next
+        self.write_to(sys.stdout)
 
 class InsertHeadMixin:
     """Mixin providing functionality to insert a node at the beginning of a linked structure."""
@@ -420,6 +512,8 @@ class InsertAfterTargetMixin:
                 new_node = SinglyNode(data_to_insert)  # SinglyNode() will validate input
                 setattr(new_node, '_next', current_node.next)  # insert after()
                 setattr(current_node, '_next', new_node)  # insert after()
+                if hasattr(self, '_invalidate_index'):
+                    self._invalidate_index()
                 return True
             current_node = current_node.next  # traversal
         # check tail
@@ -484,6 +578,374 @@ class InsertBeforeTargetMixin:
                 new_node = SinglyNode(data_to_insert)  # SinglyNode() will validate data_to_insert
                 setattr(new_node, '_next', current_node.next)  # insert_before()
                 setattr(current_node, '_next', new_node)  # insert before()
+                if hasattr(self, '_invalidate_index'):
+                    self._invalidate_index()
                 return True
             current_node = getattr(current_node, 'next')  # traversal
-        return False
\ No newline at end of file
+        return False
+class IndexAccessMixin:
+    """Mixin providing index-based access to the nodes of a linked structure.
+
+    A linked structure has no random access, so reaching position ``i`` means
+    walking ``i`` references from the head. This mixin softens that cost in two ways:
+
+    - a *finger*, i.e., the ``(index, node)`` pair of the last visited position,
+      lets sequential index loops advance one node per access instead of
+      restarting from the head;
+    - an optional square-root decomposition *skip index* keeps a reference to every
+      ``isqrt(n)``-th node so any position is at most ``isqrt(n)`` steps away.
+
+    Both caches are dropped by the structure's mutating methods and the skip index
+    is rebuilt lazily on the next access. Appending at the tail keeps both caches
+    valid because no existing node changes position; the skip index is extended
+    over the appended nodes as they are reached, and rebuilt with a longer step
+    once it holds more than twice as many blocks as its step.
+
+    The host class must define the ``_head``, ``_tail``, ``_finger``, ``_skips`` and
+    ``_skip_index`` slots.
+
+    Examples:
+        >>> sllist = SinglyLinkedList([8, 2, 6, 4, 5])
+        >>> sllist[1], sllist[-1]
+        (2, 5)
+        >>> sllist[1:4]
+        SinglyLinkedList([2, 6, 4])
+        >>> sllist[0] = 42
+        >>> sllist[1:3] = ['foo']
+        >>> sllist
+        SinglyLinkedList([42, 'foo', 4, 5])
+    """
+    __slots__ = ()
+    def __len__(self) -> int:
+        count = 0
+        current_node = self._head
+        while current_node:
+            count += 1
+            current_node = current_node._next
+        return count
+
+    def __iter__(self):
+        current_node = self._head
+        while current_node:
+            yield current_node._data
+            current_node = current_node._next
+
+    def __getitem__(self, index):
+        """Returns the data at `index`, or a new structure holding the data of a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+            TypeError: If the index is neither an integer nor a slice.
+        """
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            values = [self._locate(i)._data for i in sorted(positions)]
+            if positions.step < 0:
+                values.reverse()
+            return type(self)(values)
+        return self._locate(index)._data
+
+    def __setitem__(self, index, value) -> None:
+        """Replaces the data at `index`, or the nodes of a slice with new nodes.
+
+        A contiguous slice may be replaced by any number of values, which relinks
+        the structure. An extended slice must be replaced by exactly as many values
+        as it selects, which only rewrites node data.
+
+        Raises:
+            IndexError: If the index is out of range.
+            ValueError: If an extended slice is assigned a sequence of another size.
+        """
+        if not isinstance(index, slice):
+            self._locate(index)._data = value
+            return
+
+        values = list(value)
+        n = len(self)
+        start, stop, step = index.indices(n)
+        if step != 1:
+            positions = range(start, stop, step)
+            if len(values) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} "
+                    f"to extended slice of size {len(positions)}"
+                )
+            for i, data in sorted(zip(positions, values), key=lambda pair: pair[0]):
+                self._locate(i)._data = data
+            return
+
+        stop = max(start, stop)
+        before = self._locate(start - 1) if start > 0 else None
+        after = self._locate(stop) if stop < n else None
+        first = last = None
+        for data in values:
+            node = SinglyNode(data)
+            if first is None:
+                first = node
+            else:
+                last._next = node
+            last = node
+        if first is None:  # the slice is deleted
+            first = last = before
+            if before is None:
+                self._head = after
+            else:
+                before._next = after
+        else:
+            last._next = after
+            if before is None:
+                self._head = first
+            else:
+                before._next = first
+        if after is None:
+            self._tail = last
+        self._invalidate_index()
+
+    def _invalidate_index(self) -> None:
+        """Drops the finger and the skip index after the node order changed."""
+        self._finger = None
+        self._skips = None
+
+    def _locate(self, index: int) -> SinglyNode:
+        """Returns the node at `index`, starting from the closest known node."""
+        if not isinstance(index, int):
+            raise TypeError(
+                f"{type(self).__name__} indices must be integers or slices, not {type(index).__name__}"
+            )
+        if index == -1:  # the tail is kept, so the last node needs no walk
+            if self._tail is None:
+                raise IndexError(f"{type(self).__name__} index out of range")
+            return self._tail
+        if index < 0:
+            index += len(self)
+        if index < 0:
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        position, current_node = 0, self._head
+        if self._finger is not None and self._finger[0] <= index:
+            position, current_node = self._finger
+        if self._skip_index:
+            if self._skips is not None and len(self._skips[1]) > 2 * self._skips[0] + 2:
+                self._skips = None  # outgrown by appends at the tail
+            if self._skips is None:  # rebuild lazily after a mutation
+                step = max(1, isqrt(len(self)))
+                nodes = []
+                node = self._head
+                i = 0
+                while node:
+                    if i % step == 0:
+                        nodes.append(node)
+                    node = node._next
+                    i += 1
+                self._skips = (step, nodes)
+            step, nodes = self._skips
+            node = nodes[-1] if nodes else None
+            while node is not None and len(nodes) <= index // step:
+                # extend over the nodes appended since the index was built
+                for _ in range(step):
+                    node = node._next
+                    if node is None:
+                        break
+                else:
+                    nodes.append(node)
+            block = min(index // step, len(nodes) - 1)
+            if block >= 0 and block * step > position:
+                position, current_node = block * step, nodes[block]
+
+        while position < index and current_node is not None:
+            current_node = current_node._next
+            position += 1
+        if current_node is None:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        self._finger = (index, current_node)
+        return current_node
+
+class SerializationMixin:
+    """Mixin providing recursion-free pickling and copying of linked structures.
+
+    By default `pickle` and `copy.deepcopy` follow each node's `_next` reference
+    recursively, so a structure of roughly a thousand nodes exceeds the recursion limit.
+    This mixin flattens the node data into a single list, head to tail, and rebuilds
+    the chain with a loop, so the cost is one list regardless of the structure's length.
+
+    Examples:
+        >>> import copy, pickle
+        >>> sllist = SinglyLinkedList(range(100000))
+        >>> pickle.loads(pickle.dumps(sllist)).tail
+        SinglyNode(data=99999)
+        >>> copy.deepcopy(Stack([1, [2]]))
+        Stack([[2], 1])
+    """
+    __slots__ = ()
+    def __getstate__(self) -> dict:
+        """Returns the node data from head to tail, plus any non-node settings.
+
+        A target that is a node instance refers to the original chain and is not kept.
+        """
+        values = []
+        current_node = self._head
+        while current_node:
+            values.append(current_node._data)
+            current_node = current_node._next
+        state = {'values': values}
+        if hasattr(self, '_target'):
+            state['target'] = None if isinstance(self._target, SinglyNode) else self._target
+        if hasattr(self, '_skip_index'):
+            state['skip_index'] = self._skip_index
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Rebuilds the chain of nodes iteratively, keeping the head-to-tail order."""
+        head = tail = None
+        for value in state['values']:
+            node = SinglyNode(value)
+            if head is None:
+                head = node
+            else:
+                tail._next = node
+            tail = node
+        self._head = head
+        if hasattr(type(self), '_tail'):
+            self._tail = tail
+        if 'target' in state:
+            self._target = state['target']
+        if 'skip_index' in state:
+            self._skip_index = state['skip_index']
+        if hasattr(self, '_invalidate_index'):
+            self._invalidate_index()
+
+    def __reduce__(self):
+        return (type(self), (), self.__getstate__())
+
+    def __copy__(self):
+        """Returns a new structure with new nodes holding the same data objects."""
+        new = type(self)()
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __deepcopy__(self, memo):
+        """Returns a new structure with new nodes holding deep copies of the data."""
+        new = type(self)()
+        memo[id(self)] = new
+        new.__setstate__(deepcopy(self.__getstate__(), memo))
+        return new
+
+class AsyncBufferMixin:
+    """Mixin providing an asyncio-native, optionally bounded, buffer interface.
+
+    `get` awaits until the structure holds a node and `put` awaits while a bounded
+    structure is full, so coroutines suspend instead of polling. Waiters are woken in
+    FIFO order, as in `asyncio.Queue`, and the `asyncio.QueueEmpty` and
+    `asyncio.QueueFull` exceptions signal that a `*_nowait` call cannot proceed.
+
+    The host class decides where data enters through `_insert` and always removes
+    the head node, and must define the `_head`, `_size`, `_maxsize`, `_getters` and
+    `_putters` slots.
+
+    Examples:
+        >>> import asyncio
+        >>> async def main():
+        ...     queue = AsyncQueue(maxsize=2)
+        ...     await queue.put('foo')
+        ...     queue.put_nowait('bar')
+        ...     return await queue.get_many(5)
+        >>> asyncio.run(main())
+        ['foo', 'bar']
+    """
+    __slots__ = ()
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def empty(self) -> bool:
+        return self._head is None
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= self._size
+
+    def put_nowait(self, data) -> None:
+        """Puts `data` into the structure without waiting.
+
+        Raises:
+            asyncio.QueueFull: If the structure is bounded and full.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._insert(data)
+        self._size += 1
+        self._wakeup_next(self._getters)
+
+    async def put(self, data) -> None:
+        """Puts `data` into the structure, waiting while it is bounded and full."""
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:  # e.g., CancelledError; re-raised below
+                putter.cancel()  # just in case putter is not done yet
+                try:
+                    self._putters.remove(putter)
+                except ValueError:  # already removed by _wakeup_next
+                    pass
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(data)
+
+    def get_nowait(self):
+        """Removes and returns the data of the head node without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If the structure is empty.
+        """
+        if self._head is None:
+            raise asyncio.QueueEmpty
+        node = self.remove_head()
+        self._size -= 1
+        self._wakeup_next(self._putters)
+        return node._data
+
+    async def get(self):
+        """Removes and returns the data of the head node, waiting while the structure is empty."""
+        await self._wait_for_nodes()
+        return self.get_nowait()
+
+    async def get_many(self, n: int) -> list:
+        """Waits until the structure holds a node, then removes up to `n` nodes' data at once."""
+        await self._wait_for_nodes()
+        data = []
+        while self._head is not None and len(data) < n:
+            data.append(self.remove_head()._data)
+        self._size -= len(data)
+        for _ in data:
+            self._wakeup_next(self._putters)
+        return data
+
+    async def _wait_for_nodes(self) -> None:
+        while self._head is None:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:  # e.g., CancelledError; re-raised below
+                getter.cancel()  # just in case getter is not done yet
+                try:
+                    self._getters.remove(getter)
+                except ValueError:  # already removed by _wakeup_next
+                    pass
+                if self._head is not None and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+
+    @staticmethod
+    def _wakeup_next(waiters) -> None:
+        """Wakes up the first waiter that isn't cancelled."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
@@ -0,0 +1,39 @@
+"""Defines a node for a doubly linked structure.
+
+This module contains the definition for the `DoublyNode` class, which represents
+a node with references to both the next and the previous node.
+
+Example:
+    Typical usage example:
+
+        bi_node = DoublyNode("a string of characters")
+"""
+from typing import Any, Optional
+from ofnodes.components.nodes.descriptors import Prev
+from ofnodes.nodes.singlynode import SinglyNode
+
+
+class DoublyNode(SinglyNode):
+    """Represents a node in a doubly linked structure.
+
+    Attributes:
+        data: The data stored in the node.
+        next: Reference to the next node. Defaults to None.
+        prev: Reference to the previous node. Defaults to None.
+    """
+
+    __slots__ = ('_prev',)
+
+    prev = Prev()
+
+    def __init__(self, data: Any) -> None:
+        super().__init__(data)
+        self._prev: Optional[DoublyNode] = None
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        parent_dir = {attr for attr in parent_dir if attr not in {'_prev',}}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
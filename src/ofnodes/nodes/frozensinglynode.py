@@ -0,0 +1,45 @@
+"""Defines an immutable node for persistent singly linked structures.
+
+This module contains the definition for the `FrozenSinglyNode` class, a `SinglyNode`
+whose data and next reference are fixed at construction. Because a frozen node can
+never be relinked, any number of structures may share it as part of their tail.
+
+Example:
+    Typical usage example:
+
+        tail = FrozenSinglyNode("tail")
+        head = FrozenSinglyNode("head", tail)
+"""
+from typing import Any, Optional
+from ofnodes.nodes.singlynode import SinglyNode
+
+
+class FrozenSinglyNode(SinglyNode):
+    """Represents an immutable node in a persistent singly linked list.
+
+    Attributes:
+        data: The data stored in the node.
+        next: Reference to the next frozen node. Defaults to None.
+
+    Examples:
+        >>> node = FrozenSinglyNode(42)
+        >>> node.data = 43
+        Traceback (most recent call last):
+        ...
+        AttributeError: FrozenSinglyNode is immutable.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, data: Any, next_node: Optional['FrozenSinglyNode'] = None) -> None:
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_next', next_node)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __add__(self, other):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
@@ -0,0 +1,69 @@
+"""Defines a multi-level node for a skip list.
+
+This module contains the definition for the `SkipNode` class, which represents
+a node linked into several levels of a skip list at once. Level 0 links every
+node in order, like a singly linked list; each higher level links a sparser
+subset of the nodes, so a search can skip long runs of the levels below.
+
+Example:
+    Typical usage example:
+
+        skip_node = SkipNode("a string of characters", level=3)
+"""
+from typing import Any, Optional
+
+
+class SkipNode:
+    """Represents a node in a skip list.
+
+    Attributes:
+        data: The data stored in the node. Read-only, since changing it could break
+            the order of the skip list.
+        next: Reference to the next node at level 0. Defaults to None.
+        level: The number of levels the node is linked into.
+        _forward (list[Optional[SkipNode]]): The next node at each level.
+        _widths (list[int]): The number of level 0 steps each forward link spans.
+
+    Examples:
+        >>> node = SkipNode(42, level=3)
+        >>> node, node.level, node.next
+        (SkipNode(data=42, level=3), 3, None)
+    """
+
+    __slots__ = ('_data', '_forward', '_widths')
+
+    def __init__(self, data: Any, level: int = 1) -> None:
+        if level < 1:
+            raise ValueError("level must be at least 1.")
+        self._data: Any = data
+        self._forward: list[Optional[SkipNode]] = [None] * level
+        self._widths: list[int] = [1] * level
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        parent_dir = {attr for attr in parent_dir if attr not in {'_data', '_forward', '_widths',}}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(data={self._data!r}, level={len(self._forward)})"
+
+    def __str__(self) -> str:
+        return str(self._data)
+
+    @property
+    def data(self) -> Any:
+        """The data stored in the node."""
+        return self._data
+
+    @property
+    def next(self) -> Optional['SkipNode']:
+        """The next node at level 0."""
+        return self._forward[0]
+
+    @property
+    def level(self) -> int:
+        """The number of levels the node is linked into."""
+        return len(self._forward)
@@ -1,6 +1,7 @@
 #src/ofnodes/sorting/mixins.py
 
 import logging
+import random
 from ofnodes.nodes.singlynode import SinglyNode
 
 logger = logging.getLogger(__name__)
@@ -216,6 +217,8 @@ class InsertionSortMixin:
                         raise ValueError(f"Unexpected value: {ascending}. Only True or False are allowed.")
                 j = j._next
             _sorted, unsorted = unsorted, unsorted._next
+        if hasattr(self, '_invalidate_index'):
+            self._invalidate_index()
 
 
     def index_based_insertion_sort(self, ascending=True, key=None):
@@ -250,37 +253,42 @@ class InsertionSortMixin:
         if len(self) in (0, 1):  # no need to sort
             return
 
+        debug = logger.isEnabledFor(logging.DEBUG)  # avoid slicing the array when not logging
         for unsorted in range(1, len(self)):
             value = self[unsorted]  # persist the value found using the first key, `i`.
             key_value = key(value) if key else value
             j = unsorted - 1  # compute the first index of the sorted subarray
 
-            logger.debug("Array state: %s", self._data)
-            logger.debug("The value %s found at index %s will be inserted at a new position", value, unsorted)
-            logger.debug("Sorted portion: %s", self._data[:unsorted])
-            logger.debug("Unsorted portion: %s", self._data[unsorted:])
+            if debug:
+                logger.debug("Array state: %s", self[:])
+                logger.debug("The value %s found at index %s will be inserted at a new position", value, unsorted)
+                logger.debug("Sorted portion: %s", self[:unsorted])
+                logger.debug("Unsorted portion: %s", self[unsorted:])
 
             while j >= 0 and self[j] is not None:
                 key_j = key(self[j]) if key else self[j]
                 if (ascending and key_value < key_j) or (not ascending and key_value > key_j):
                     self[j + 1] = self[j]  # shift the value of the sorted subarray one to the right
                     j -= 1  # compute the next index of the sorted subarray
-                    logger.debug("Array state: %s", self._data)
-                    logger.debug("Moved value %s to position %s", self[j + 1], j + 1)
-                    logger.debug("Sorted portion: %s", self._data[:unsorted])
-                    logger.debug("Unsorted portion: %s", self._data[unsorted:])
+                    if debug:
+                        logger.debug("Array state: %s", self[:])
+                        logger.debug("Moved value %s to position %s", self[j + 1], j + 1)
+                        logger.debug("Sorted portion: %s", self[:unsorted])
+                        logger.debug("Unsorted portion: %s", self[unsorted:])
                 else:
-                    logger.debug("j>=0: %s", j>=0)
-                    logger.debug("self[j] is not None: %s", self[j] is not None)
+                    if debug:
+                        logger.debug("j>=0: %s", j>=0)
+                        logger.debug("self[j] is not None: %s", self[j] is not None)
                     break
 
             self[j + 1] = value  # insert the value one to the right of the minimum value
 
 
-        logger.debug("Array state: %s", self._data)
-        logger.debug("The value %s found at index %s will be inserted at a new position", value, unsorted)
-        logger.debug("Sorted portion: %s", self._data[:unsorted])
-        logger.debug("Unsorted portion: %s", self._data[unsorted:])
+        if debug:
+            logger.debug("Array state: %s", self[:])
+            logger.debug("The value %s found at index %s will be inserted at a new position", value, unsorted)
+            logger.debug("Sorted portion: %s", self[:unsorted])
+            logger.debug("Unsorted portion: %s", self[unsorted:])
 
 class ReverseOrderMixin:
     """Mixin class supporting node order reversal for linked node structures."""
@@ -338,4 +346,281 @@ class ReverseOrderMixin:
         n = len(self)
         for i in range(n // 2):
             # Swap elements symmetrically across the middle
-            self[i], self[n - i - 1] = self[n - i - 1], self[i]
\ No newline at end of file
+            self[i], self[n - i - 1] = self[n - i - 1], self[i]
+
+class HeapSortMixin:
+    """Mixin class providing heapify and heap sort functionality for index-based data structures."""
+    __slots__ = ()
+    def _index_based_sift_down(self, index, end, max_heap, key):
+        """Moves the element at `index` down the heap `self[:end]` until it is in heap order.
+
+        The element is held aside while the children that should come before it move
+        up into the hole, so each level costs one write instead of a swap.
+        """
+        value = self[index]
+        key_value = key(value) if key else value
+        child = 2 * index + 1
+        while child < end:
+            child_value = self[child]
+            key_child = key(child_value) if key else child_value
+            if child + 1 < end:
+                right_value = self[child + 1]
+                key_right = key(right_value) if key else right_value
+                if (max_heap and key_right > key_child) or (not max_heap and key_right < key_child):
+                    child, child_value, key_child = child + 1, right_value, key_right
+            if not ((max_heap and key_child > key_value) or (not max_heap and key_child < key_value)):
+                break
+            self[index] = child_value  # move the child up into the hole
+            index, child = child, 2 * child + 1
+        self[index] = value
+
+    def index_based_heapify(self, max_heap=False, key=None):
+        """Rearranges the elements in place into a binary heap.
+
+        Element `i` has children `2i + 1` and `2i + 2`, and no child comes before
+        its parent, so the first element is the smallest, or the largest for a
+        max-heap. Every internal element is sifted down once, from the last to the
+        first.
+
+        Args:
+            max_heap (bool): If True, builds a max-heap instead of a min-heap. Defaults to False.
+            key (Callable, optional): A function computing the key each element is ordered by.
+
+        Raises:
+            TypeError: If the data structure does not support index-based access.
+
+        Examples:
+            >>> raarray = RandomAccessArray(5)
+            >>> [raarray.__setitem__(i, val) for i, val in enumerate([8, 2, 6, 4, 5])]
+            [None, None, None, None, None]
+            >>> raarray.index_based_heapify()
+            >>> raarray
+            RandomAccessArray([2, 4, 6, 8, 5])
+
+        Notes:
+            - Time Complexity: O(n), where n is the number of elements in the data structure.
+            - Space Complexity: O(1).
+        """
+        if not hasattr(self, '__getitem__'):
+            raise TypeError("index_based_heapify can only be used on data structures that support index-based access.")
+        n = len(self)
+        for index in range(n // 2 - 1, -1, -1):
+            self._index_based_sift_down(index, n, max_heap, key)
+
+    def index_based_heap_sort(self, ascending=True, key=None):
+        """Sorts the elements of the index-based data structure in place using heap sort.
+
+        The elements are first heapified so the one that sorts last is at the front.
+        It is swapped with the last element of the heap, the heap shrinks by one, and
+        the new front is sifted down, until the heap is empty.
+
+        Unlike insertion and bubble sort, heap sort is O(n log n) even in the worst
+        case, and unlike `sorted` it needs no extra memory. It is not stable: equal
+        elements may change order.
+
+        Args:
+            ascending (bool): If True, sorts the elements in ascending order.
+                If False, sorts the elements in descending order. Defaults to True.
+            key (Callable, optional): A function computing the sort key of each element.
+
+        Raises:
+            TypeError: If the data structure does not support index-based access.
+
+        Examples:
+            >>> raarray = RandomAccessArray(5)
+            >>> [raarray.__setitem__(i, val) for i, val in enumerate([8, 2, 6, 4, 5])]
+            [None, None, None, None, None]
+            >>> raarray.index_based_heap_sort()
+            >>> raarray
+            RandomAccessArray([2, 4, 5, 6, 8])
+            >>> raarray.index_based_heap_sort(ascending=False)
+            >>> raarray
+            RandomAccessArray([8, 6, 5, 4, 2])
+
+        Notes:
+            - Time Complexity: O(n log n) in the best, average and worst case.
+            - Space Complexity: O(1).
+        """
+        if not hasattr(self, '__getitem__'):
+            raise TypeError("index_based_heap_sort can only be used on data structures that support index-based access.")
+        n = len(self)
+        if n in (0, 1):  # no need to sort
+            return
+        # an ascending sort pops the largest element to the back first, so it needs a max-heap
+        self.index_based_heapify(max_heap=ascending, key=key)
+        for end in range(n - 1, 0, -1):
+            self[0], self[end] = self[end], self[0]
+            self._index_based_sift_down(0, end, ascending, key)
+
+
+def _split_chain(node, classify):
+    """Relinks a None-terminated node chain into three chains in one pass.
+
+    Each node is appended to chain `classify(node._data)`, 0, 1 or 2, so every
+    chain keeps the original relative order of its nodes.
+
+    Returns:
+        list[list]: The `[head, tail, length]` of each chain; empty chains have a
+            None head and tail.
+    """
+    chains = [[None, None, 0], [None, None, 0], [None, None, 0]]
+    while node:
+        chain = chains[classify(node._data)]
+        if chain[1] is None:
+            chain[0] = node
+        else:
+            chain[1]._next = node
+        chain[1] = node
+        chain[2] += 1
+        node = node._next
+    for chain in chains:
+        if chain[1] is not None:
+            chain[1]._next = None
+    return chains
+
+
+def _pivot_classifier(pivot_key, key):
+    """Returns a classifier of node data into less (0), equal (1) and greater (2) than `pivot_key`."""
+    def classify(data):
+        data_key = key(data) if key else data
+        if data_key < pivot_key:
+            return 0
+        return 2 if data_key > pivot_key else 1
+    return classify
+
+
+class QuickSortMixin:
+    """Mixin class providing partitioning and 3-way quicksort for reference-based data structures.
+
+    Both relink the existing nodes and never allocate new ones.
+    """
+    __slots__ = ()
+    def reference_based_partition(self, pivot=None, predicate=None, key=None):
+        """Stably partitions the nodes of the singly linked data structure in one pass.
+
+        Given a pivot, the nodes are relinked into those whose key is less than the
+        pivot, then those equal to it, then those greater. Given a predicate, the
+        nodes for which it is true come first, then the others. Nodes keep their
+        relative order within each part.
+
+        Args:
+            pivot (Any, optional): The key the node keys are compared with.
+            predicate (Callable, optional): Selects the nodes that come first.
+            key (Callable, optional): A function computing the key of each node's data.
+                Only used with a pivot.
+
+        Returns:
+            tuple[int, ...]: The lengths of the less, equal and greater parts, or of
+                the matching and remaining parts for a predicate.
+
+        Raises:
+            TypeError: If the data structure is not reference-based.
+            ValueError: If neither or both of a pivot and a predicate are given.
+
+        Examples:
+            >>> sllist = SinglyLinkedList([8, 2, 6, 4, 5, 4])
+            >>> sllist.reference_based_partition(pivot=5)
+            (3, 1, 2)
+            >>> sllist
+            SinglyLinkedList([2, 4, 4, 5, 8, 6])
+            >>> sllist.reference_based_partition(predicate=lambda x: x % 4 == 0)
+            (3, 3)
+            >>> sllist
+            SinglyLinkedList([4, 4, 8, 2, 5, 6])
+
+        Notes:
+            - Time Complexity: O(n), where n is the number of nodes.
+        """
+        if not hasattr(self, '_head'):
+            raise TypeError("reference_based_partition can only be used on reference-based data structures like linked lists.")
+        if (pivot is None) == (predicate is None):
+            raise ValueError("Pass either a pivot or a predicate.")
+        if predicate is not None:
+            classify = lambda data: 0 if predicate(data) else 2
+        else:
+            classify = _pivot_classifier(pivot, key)
+        chains = _split_chain(self._head, classify)
+        head = tail = None
+        for first, last, _ in chains:
+            if first is None:
+                continue
+            if head is None:
+                head = first
+            else:
+                tail._next = first
+            tail = last
+        self._head, self._tail = head, tail
+        if hasattr(self, '_invalidate_index'):
+            self._invalidate_index()
+        lengths = tuple(length for _, _, length in chains)
+        return lengths if predicate is None else (lengths[0], lengths[2])
+
+    def reference_based_quicksort(self, ascending=True, key=None):
+        """Sorts the nodes of the singly linked data structure using 3-way quicksort.
+
+        Each pass partitions a chain around the key of a randomly chosen node into
+        less, equal and greater chains. The equal chain is final, and the other two
+        go on an explicit stack, so deep recursion cannot overflow the call stack.
+        Chains are taken off the stack in output order and appended to the result.
+
+        Because equal keys are settled in the pass that finds them, a list with k
+        distinct keys is sorted in O(n log k), i.e., O(n) for a few status codes or
+        tags. Partitioning is stable, so the sort is stable too.
+
+        Args:
+            ascending (bool): If True, sorts the nodes in ascending order.
+                If False, sorts them in descending order. Defaults to True.
+            key (Callable, optional): A function computing the sort key of each node's data.
+
+        Raises:
+            TypeError: If the data structure is not reference-based.
+
+        Examples:
+            >>> sllist = SinglyLinkedList([8, 2, 6, 4, 5, 2])
+            >>> sllist.reference_based_quicksort()
+            >>> sllist
+            SinglyLinkedList([2, 2, 4, 5, 6, 8])
+            >>> sllist.reference_based_quicksort(ascending=False)
+            >>> sllist
+            SinglyLinkedList([8, 6, 5, 4, 2, 2])
+
+        Notes:
+            - Time Complexity: O(n log n) expected, O(n log k) for k distinct keys,
+            and O(n^2) in the unlikely worst case.
+            - Space Complexity: O(log n) expected for the stack; no nodes are allocated.
+        """
+        if not hasattr(self, '_head'):
+            raise TypeError("reference_based_quicksort can only be used on reference-based data structures like linked lists.")
+        if not self._head or not self._head._next:  # it's a zero node or one node list
+            return
+
+        length, node = 0, self._head
+        while node:
+            length += 1
+            node = node._next
+        head = tail = None
+        stack = [(self._head, self._tail, length, False)]  # (first, last, length, sorted)
+        while stack:
+            first, last, length, done = stack.pop()
+            if not done and length > 1:
+                pivot = first
+                for _ in range(random.randrange(length)):
+                    pivot = pivot._next
+                less, equal, greater = _split_chain(first, _pivot_classifier(key(pivot._data) if key else pivot._data, key))
+                if not ascending:
+                    less, greater = greater, less
+                # push in reverse output order so the first chain is popped first
+                stack.append((*greater, False))
+                stack.append((*equal, True))
+                stack.append((*less, False))
+                continue
+            if first is None:
+                continue
+            if head is None:
+                head = first
+            else:
+                tail._next = first
+            tail = last
+        self._head, self._tail = head, tail
+        if hasattr(self, '_invalidate_index'):
+            self._invalidate_index()
@@ -0,0 +1,181 @@
+from ofnodes.sorting.mixins import BubbleSortMixin, HeapSortMixin, InsertionSortMixin, ReverseOrderMixin
+
+
+def _highest(positions):
+    """Returns the highest index of a non-empty range in O(1), from its endpoints."""
+    return positions[-1] if positions.step > 0 else positions[0]
+
+
+class RandomAccessArrayView(BubbleSortMixin, InsertionSortMixin, HeapSortMixin, ReverseOrderMixin):
+    """A strided window onto the storage of a RandomAccessArray.
+
+    A view shares the storage of its base array instead of copying it: element `i`
+    of the view is element `start + i * step` of the base. Writes, sorts and
+    reversals through the view therefore happen in place on the base array.
+
+    Args:
+        base (RandomAccessArray): The array whose storage is shared.
+        start (int): The base index of the first element of the view.
+        step (int): The stride between consecutive elements, may be negative.
+        length (int): The number of elements in the view.
+
+    Attributes:
+        _base (RandomAccessArray): The array whose storage is shared.
+        _start (int): The base index of the first element of the view.
+        _step (int): The stride between consecutive elements.
+        _length (int): The number of elements in the view.
+
+    Note:
+        The view reads `_base._data` on every access, so it follows a dynamic base
+        that reallocates. Shrinking the base below the view leaves it dangling:
+        reading or writing elements past the end of the base raises IndexError,
+        even where the base keeps spare capacity.
+
+    Examples:
+        >>> from ofnodes.structures.randomaccessarray import RandomAccessArray
+        >>> raarray = RandomAccessArray(6)
+        >>> for i, val in enumerate([8, 2, 6, 4, 5, 1]):
+        ...     raarray[i] = val
+        >>> evens = raarray.view(step=2)
+        >>> evens
+        RandomAccessArrayView([8, 6, 5])
+        >>> evens.bubble_sort()
+        >>> raarray
+        RandomAccessArray([5, 2, 6, 4, 8, 1])
+    """
+    __slots__ = ('_base', '_start', '_step', '_length')
+
+    def __init__(self, base, start, step, length):
+        self._base = base
+        self._start = start
+        self._step = step
+        self._length = length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._base._data[i] for i in self._within_base(self._positions(index))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RandomAccessArrayView index out of range")
+        return self._base._data[self._within_base(self._start + index * self._step)]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            positions = self._within_base(self._positions(index))
+            values = list(value)
+            if len(values) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} to view slice of size {len(positions)}"
+                )
+            data = self._base._data
+            for i, val in zip(positions, values):
+                if self._base._indexes:
+                    self._base._update_indexes(i, data[i], val)
+                data[i] = val
+            self._base._sort_state = None
+            if positions:
+                self._base._len_used = max(self._base._len_used, _highest(positions) + 1)
+            return
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RandomAccessArrayView assignment index out of range")
+        index = self._within_base(self._start + index * self._step)
+        if self._base._indexes:
+            self._base._update_indexes(index, self._base._data[index], value)
+        self._base._data[index] = value
+        self._base._sort_state = None
+        if index >= self._base._len_used:
+            self._base._len_used = index + 1
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        data = self._base._data
+        for i in self._within_base(self._positions(slice(None))):
+            yield data[i]
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        excluded = {'_base', '_start', '_step', '_length', '_positions', '_within_base', 'reference_based_reverse_order', 'reference_based_bubble_sort', 'reference_based_insertion_sort', 'index_based_bubble_sort', 'index_based_reverse_order', 'index_based_insertion_sort', 'index_based_heap_sort', 'index_based_heapify', '_index_based_sift_down'}
+        parent_dir = {attr for attr in parent_dir if attr not in excluded}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __repr__(self):
+        return f"RandomAccessArrayView({list(self)})"
+
+    def __str__(self):
+        return f"[{', '.join(str(item) for item in self)}]"
+
+    def _positions(self, index):
+        """Maps an index or slice of the view onto the matching base indices."""
+        return range(self._start, self._start + self._length * self._step, self._step)[index]
+
+    def _within_base(self, positions):
+        """Returns base `positions`, an index or a range, if the base still holds them all."""
+        if isinstance(positions, int):
+            last = positions
+        else:
+            last = _highest(positions) if positions else -1
+        if last >= self._base._length:
+            raise IndexError("RandomAccessArrayView refers past the end of its base")
+        return positions
+
+    @property
+    def base(self):
+        """The RandomAccessArray whose storage the view shares."""
+        return self._base
+
+    def view(self, start=None, stop=None, step=None):
+        """Returns a view of a slice of this view, sharing the same base storage.
+
+        Examples:
+            >>> from ofnodes.structures.randomaccessarray import RandomAccessArray
+            >>> raarray = RandomAccessArray(6)
+            >>> for i in range(6):
+            ...     raarray[i] = i
+            >>> raarray.view(1).view(step=2)
+            RandomAccessArrayView([1, 3, 5])
+        """
+        positions = self._positions(slice(start, stop, step))
+        return RandomAccessArrayView(self._base, positions.start, positions.step, len(positions))
+
+    def to_memoryview(self):
+        """Returns a strided memoryview of the viewed elements without copying.
+
+        Raises:
+            TypeError: If the base array does not use typed storage.
+        """
+        stop = self._start + self._length * self._step
+        if stop < 0:
+            stop = None
+        return self._base.to_memoryview()[self._start:stop:self._step]
+
+    def tolist(self):
+        """Returns a copy of the viewed elements as a list."""
+        return list(self)
+
+    def bubble_sort(self, ascending=True):
+        """Sorts the viewed elements in place on the base array using bubble sort."""
+        return super().index_based_bubble_sort(ascending)
+
+    def insertion_sort(self, ascending=True, key=None):
+        """Sorts the viewed elements in place on the base array using insertion sort."""
+        return super().index_based_insertion_sort(ascending, key)
+
+    def heap_sort(self, ascending=True, key=None):
+        """Sorts the viewed elements in place on the base array using heap sort."""
+        return super().index_based_heap_sort(ascending, key)
+
+    def heapify(self, max_heap=False, key=None):
+        """Rearranges the viewed elements in place on the base array into a binary heap."""
+        return super().index_based_heapify(max_heap, key)
+
+    def reverse_order(self):
+        """Reverses the viewed elements in place on the base array."""
+        return super().index_based_reverse_order()
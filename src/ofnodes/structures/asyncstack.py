@@ -0,0 +1,66 @@
+from collections import deque
+from typing import Optional
+
+from ofnodes.nodes.singlynode import SinglyNode
+from ofnodes.components.structures.mixins import RemoveMixin, PrintMixin, AsyncBufferMixin
+
+class AsyncStack(RemoveMixin, PrintMixin, AsyncBufferMixin):
+    """Support for an asyncio-native, optionally bounded, reference-based LIFO object.
+
+    Like `Stack`, data is put at the head and the head is removed, both in O(1).
+    `await get()` suspends while the stack is empty and, with a positive `maxsize`,
+    `await put()` suspends while it is full.
+
+    Args:
+        values (Iterable, optional): The data to put, in order.
+        maxsize (int): The maximum number of nodes. Zero or less means unbounded.
+            Defaults to 0.
+
+    Examples:
+        >>> import asyncio
+        >>> async def main():
+        ...     stack = AsyncStack([1, 2])
+        ...     await stack.put(3)
+        ...     return await stack.get(), stack.get_nowait()
+        >>> asyncio.run(main())
+        (3, 2)
+    """
+
+    __slots__ = ('_head', '_size', '_maxsize', '_getters', '_putters')
+
+    def __init__(self, values=None, maxsize=0) -> None:
+        self._head: Optional[SinglyNode] = None
+        self._size = 0
+        self._maxsize = maxsize
+        self._getters = deque()
+        self._putters = deque()
+        if values:
+            for value in values:
+                self.put_nowait(value)
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        excluded = {'_head', '_tail', '_target', '_size', '_maxsize', '_getters', '_putters', '_format_edges', '_insert', '_wait_for_nodes', '_wakeup_next'}
+        parent_dir = {attr for attr in parent_dir if attr not in excluded}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __repr__(self) -> str:
+        if not self._head:
+            return f"{type(self).__name__}()"
+        body, count = self._format_edges(repr, ', ')
+        if count is None:
+            return f"{type(self).__name__}([{body}])"
+        return f"{type(self).__name__}([{body}], len={count})"
+
+    @property
+    def head(self) -> Optional[SinglyNode]:
+        """The top node, next to be removed. Use `put` and `get` to modify the stack."""
+        return self._head
+
+    def _insert(self, data) -> None:
+        node = data if isinstance(data, SinglyNode) else SinglyNode(data)
+        node._next = self._head
+        self._head = node
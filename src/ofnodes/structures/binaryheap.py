@@ -0,0 +1,326 @@
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+
+
+class HeapHandle:
+    """A reference to an entry of a BinaryHeap, returned by `push`.
+
+    The handle tracks the entry's position in the heap array, so the heap can
+    find it in O(1) for `decrease_key` and `remove`.
+
+    Attributes:
+        value (Any): The stored value.
+        priority (Any): The value's priority, e.g., `key(value)`.
+        _seq (int): The insertion sequence number, which breaks priority ties FIFO.
+        _index (int): The position in the heap array, or -1 once removed.
+    """
+    __slots__ = ('value', 'priority', '_seq', '_index')
+
+    def __init__(self, value, priority, seq, index):
+        self.value = value
+        self.priority = priority
+        self._seq = seq
+        self._index = index
+
+    def __repr__(self):
+        return f"HeapHandle({self.value!r}, priority={self.priority!r})"
+
+    @property
+    def in_heap(self):
+        """Whether the entry is still in its heap."""
+        return self._index >= 0
+
+
+class BinaryHeap:
+    """A binary heap over a dynamic RandomAccessArray.
+
+    Entry `i` has children `2i + 1` and `2i + 2` and comes before both. Pushing
+    and popping sift one entry along one root-to-leaf path, in O(log n), and
+    heapifying sifts down each internal entry once, in O(n). Entries with equal
+    priorities come out in insertion order.
+
+    Args:
+        values (Iterable, optional): The initial values, heapified in O(n).
+        key (Callable, optional): Computes each value's priority. Defaults to the value.
+        max_heap (bool): If True, the largest priority comes out first. Defaults to False.
+
+    Attributes:
+        _heap (RandomAccessArray): The dynamic array of HeapHandles in heap order.
+        _key (Optional[Callable]): Computes each value's priority.
+        _max_heap (bool): Whether the largest priority comes out first.
+        _seq (int): The next insertion sequence number.
+
+    Examples:
+        >>> heap = BinaryHeap([8, 2, 6])
+        >>> handle = heap.push(4)
+        >>> heap.pop(), heap.peek()
+        (2, 4)
+        >>> heap.decrease_key(heap.push(9), 1)
+        >>> [heap.pop() for _ in range(len(heap))]
+        [1, 4, 6, 8]
+    """
+    __slots__ = ('_heap', '_key', '_max_heap', '_seq')
+
+    def __init__(self, values=(), key=None, max_heap=False):
+        self._heap = RandomAccessArray(0, dynamic=True)
+        self._key = key
+        self._max_heap = max_heap
+        self._seq = 0
+        self.push_many(values)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        """Yields the values in heap order, which is not sorted order."""
+        return (handle.value for handle in self._heap)
+
+    def __contains__(self, handle):
+        heap = self._heap
+        return isinstance(handle, HeapHandle) and 0 <= handle._index < len(heap) and heap[handle._index] is handle
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+    def _priority(self, value):
+        return self._key(value) if self._key else value
+
+    def _before(self, a, b):
+        """Whether handle `a` comes out before handle `b`."""
+        if a.priority == b.priority:
+            return a._seq < b._seq
+        return a.priority > b.priority if self._max_heap else a.priority < b.priority
+
+    def _sift_up(self, index):
+        """Moves the entry at `index` towards the root until its parent comes first."""
+        data = self._heap._data
+        handle = data[index]
+        while index:
+            parent = (index - 1) >> 1
+            if not self._before(handle, data[parent]):
+                break
+            data[index] = data[parent]
+            data[index]._index = index
+            index = parent
+        data[index] = handle
+        handle._index = index
+
+    def _sift_down(self, index):
+        """Moves the entry at `index` towards the leaves until it comes before its children."""
+        data, n = self._heap._data, len(self._heap)
+        handle = data[index]
+        child = 2 * index + 1
+        while child < n:
+            if child + 1 < n and self._before(data[child + 1], data[child]):
+                child += 1
+            if not self._before(data[child], handle):
+                break
+            data[index] = data[child]
+            data[index]._index = index
+            index, child = child, 2 * child + 1
+        data[index] = handle
+        handle._index = index
+
+    def _new_handle(self, value, priority):
+        handle = HeapHandle(value, priority, self._seq, len(self._heap))
+        self._seq += 1
+        return handle
+
+    def _push(self, value, priority):
+        handle = self._new_handle(value, priority)
+        self._heap.append(handle)
+        self._sift_up(handle._index)
+        return handle
+
+    def _pop_handle(self):
+        if not len(self._heap):
+            raise IndexError(f"pop from an empty {type(self).__name__}")
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        if len(heap):
+            heap._data[0] = last
+            self._sift_down(0)
+        top._index = -1
+        return top
+
+    def _replace_top(self, handle):
+        """Puts `handle` at the root in place of the current top and returns the top."""
+        top = self._heap[0]
+        self._heap._data[0] = handle
+        handle._index = 0
+        self._sift_down(0)
+        top._index = -1
+        return top
+
+    def push(self, value):
+        """Adds `value` in O(log n).
+
+        Returns:
+            HeapHandle: A handle for `decrease_key` and `remove`.
+        """
+        return self._push(value, self._priority(value))
+
+    def push_many(self, values):
+        """Adds every value, heapifying in O(n + k) when that beats k pushes.
+
+        Returns:
+            list[HeapHandle]: The handles of the values, in order.
+        """
+        values = list(values)
+        if len(values) < len(self._heap):
+            return [self.push(value) for value in values]
+        handles = [self._new_handle(value, self._priority(value)) for value in values]
+        self._heap.extend(handles)
+        for index, handle in enumerate(self._heap):
+            handle._index = index
+        self._heapify()
+        return handles
+
+    def _heapify(self):
+        for index in range(len(self._heap) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def peek(self):
+        """Returns the first value without removing it.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not len(self._heap):
+            raise IndexError(f"peek at an empty {type(self).__name__}")
+        return self._heap[0].value
+
+    def pop(self):
+        """Removes and returns the first value in O(log n).
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        return self._pop_handle().value
+
+    def push_pop(self, value):
+        """Pushes `value`, then pops and returns the first value, in one sift.
+
+        Faster than `push` followed by `pop`; returns `value` itself at once if it
+        would come out first.
+        """
+        handle = self._new_handle(value, self._priority(value))
+        if not len(self._heap) or not self._before(self._heap[0], handle):
+            return value
+        return self._replace_top(handle).value
+
+    def replace(self, value):
+        """Pops and returns the first value, then pushes `value`, in one sift.
+
+        Unlike `push_pop`, the returned value is never `value` itself.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if not len(self._heap):
+            raise IndexError(f"replace in an empty {type(self).__name__}")
+        return self._replace_top(self._new_handle(value, self._priority(value))).value
+
+    def _check_handle(self, handle):
+        if handle not in self:
+            raise ValueError(f"The handle is not in this {type(self).__name__}.")
+
+    def _move(self, handle, value, priority):
+        """Gives `handle` a new value and priority that must come out no later."""
+        self._check_handle(handle)
+        old_priority = handle.priority
+        improves = priority > old_priority if self._max_heap else priority < old_priority
+        if not improves and priority != old_priority:
+            raise ValueError("decrease_key cannot move an entry further from the top.")
+        handle.value, handle.priority = value, priority
+        self._sift_up(handle._index)
+
+    def decrease_key(self, handle, value):
+        """Replaces the value of `handle` with one that comes out no later, in O(log n).
+
+        For a max-heap the new priority must be no smaller instead.
+
+        Raises:
+            ValueError: If the handle is not in the heap, or the new value would come out later.
+        """
+        self._move(handle, value, self._priority(value))
+
+    def remove(self, handle):
+        """Removes the entry of `handle` in O(log n) and returns its value.
+
+        Raises:
+            ValueError: If the handle is not in the heap.
+        """
+        self._check_handle(handle)
+        heap, index = self._heap, handle._index
+        last = heap.pop()
+        if index < len(heap):
+            heap._data[index] = last
+            last._index = index
+            self._sift_up(index)
+            self._sift_down(last._index)
+        handle._index = -1
+        return handle.value
+
+
+class PriorityQueue(BinaryHeap):
+    """A BinaryHeap of items with explicit priorities.
+
+    Examples:
+        >>> queue = PriorityQueue()
+        >>> task = queue.push('write', priority=3)
+        >>> _ = queue.push('read', priority=2)
+        >>> queue.decrease_key(task, 1)
+        >>> queue.pop(), queue.pop()
+        ('write', 'read')
+    """
+    __slots__ = ()
+
+    def __init__(self, items=(), max_heap=False):
+        super().__init__(max_heap=max_heap)
+        self.push_many(items)
+
+    def push(self, item, priority):
+        """Adds `item` with `priority` in O(log n) and returns its handle."""
+        return self._push(item, priority)
+
+    def push_many(self, items):
+        """Adds every `(item, priority)` pair, heapifying when that beats pushing.
+
+        Returns:
+            list[HeapHandle]: The handles of the items, in order.
+        """
+        items = list(items)
+        if len(items) < len(self._heap):
+            return [self._push(item, priority) for item, priority in items]
+        handles = [self._new_handle(item, priority) for item, priority in items]
+        self._heap.extend(handles)
+        for index, handle in enumerate(self._heap):
+            handle._index = index
+        self._heapify()
+        return handles
+
+    def push_pop(self, item, priority):
+        """Pushes `item`, then pops and returns the first item, in one sift."""
+        handle = self._new_handle(item, priority)
+        if not len(self._heap) or not self._before(self._heap[0], handle):
+            return item
+        return self._replace_top(handle).value
+
+    def replace(self, item, priority):
+        """Pops and returns the first item, then pushes `item`, in one sift.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        if not len(self._heap):
+            raise IndexError("replace in an empty PriorityQueue")
+        return self._replace_top(self._new_handle(item, priority)).value
+
+    def decrease_key(self, handle, priority):
+        """Moves the item of `handle` to a priority that comes out no later, in O(log n).
+
+        Raises:
+            ValueError: If the handle is not in the queue, or the priority would come out later.
+        """
+        self._move(handle, handle.value, priority)
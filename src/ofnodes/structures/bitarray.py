@@ -0,0 +1,192 @@
+import operator
+import re
+
+CHUNK_SIZE = 1 << 12  # bytes combined as one integer at a time
+# the first byte holding a set flag, or a clear one
+_SET_BYTE = re.compile(rb'[^\x00]')
+_CLEAR_BYTE = re.compile(rb'[^\xff]')
+
+
+class BitArray:
+    """A RandomAccessArray of booleans packed eight to a byte in a `bytearray`.
+
+    Bit `i` is bit `i % 8` of byte `i // 8`, least significant first, so the
+    whole buffer read as a little-endian integer has bit `i` set exactly when
+    flag `i` is. Bulk operations read `CHUNK_SIZE` bytes at a time as such an
+    integer, or use the C-level `bytearray` methods, working a machine word at a
+    time instead of a flag at a time without converting the whole buffer at once.
+    Unused bits of the last byte are kept clear.
+
+    Args:
+        size (int): The number of flags.
+        fill (bool): The initial value of every flag. Defaults to False.
+
+    Attributes:
+        _size (int): The number of flags.
+        _bits (bytearray): The packed flags.
+
+    Examples:
+        >>> flags = BitArray(10)
+        >>> flags[3] = flags[7] = True
+        >>> flags
+        BitArray.from_bits('0001000100')
+        >>> flags.count(), flags.any(), flags.all(), flags.find_first()
+        (2, True, False, 3)
+        >>> (flags | BitArray(10, fill=True)).all()
+        True
+    """
+    __slots__ = ('_size', '_bits')
+
+    def __init__(self, size, fill=False):
+        if size < 0:
+            raise ValueError("size must be non-negative.")
+        self._size = size
+        self._bits = bytearray(b'\xff' if fill else b'\x00') * ((size + 7) // 8)
+        if fill:
+            self._clear_padding()
+
+    @classmethod
+    def from_bits(cls, bits):
+        """Creates a BitArray from an iterable of truthy values or a string of '0' and '1'.
+
+        Examples:
+            >>> BitArray.from_bits([1, 0, True]).count()
+            2
+        """
+        if isinstance(bits, str):
+            bits = [bit == '1' for bit in bits]
+        else:
+            bits = list(bits)
+        bitarray = cls(len(bits))
+        for i, bit in enumerate(bits):
+            if bit:
+                bitarray._bits[i >> 3] |= 1 << (i & 7)
+        return bitarray
+
+    def _clear_padding(self):
+        if self._size & 7:
+            self._bits[-1] &= (1 << (self._size & 7)) - 1
+
+    def _chunks(self):
+        """Yields the start of each chunk and its bytes as a little-endian integer."""
+        with memoryview(self._bits) as bits:
+            for start in range(0, len(bits), CHUNK_SIZE):
+                yield start, int.from_bytes(bits[start:start + CHUNK_SIZE], 'little')
+
+    def _combine(self, other, op, target=None):
+        """Writes `op` of the chunks of both operands into `target`, a new BitArray by default."""
+        self._check_other(other)
+        if target is None:
+            target = BitArray(self._size)
+        bits = target._bits
+        for (start, left), (_, right) in zip(self._chunks(), other._chunks()):
+            stop = min(start + CHUNK_SIZE, len(bits))
+            bits[start:stop] = op(left, right).to_bytes(stop - start, 'little')
+        return target
+
+    def _check_index(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("BitArray index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [bool(self._bits[i >> 3] >> (i & 7) & 1) for i in range(self._size)[index]]
+        index = self._check_index(index)
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __setitem__(self, index, value):
+        index = self._check_index(index)
+        if value:
+            self._bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xff
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        bits = self._bits
+        return (bool(bits[i >> 3] >> (i & 7) & 1) for i in range(self._size))
+
+    def __eq__(self, other):
+        if not isinstance(other, BitArray):
+            return NotImplemented
+        return self._size == other._size and self._bits == other._bits
+
+    def __repr__(self):
+        return f"BitArray.from_bits({str(self)!r})"
+
+    def __str__(self):
+        return ''.join('1' if bit else '0' for bit in self)
+
+    def _check_other(self, other):
+        if not isinstance(other, BitArray):
+            raise TypeError(f"unsupported operand type: {type(other).__name__!r}; expected a BitArray.")
+        if other._size != self._size:
+            raise ValueError(f"BitArray sizes differ: {self._size} and {other._size}.")
+
+    def __and__(self, other):
+        return self._combine(other, operator.and_)
+
+    def __or__(self, other):
+        return self._combine(other, operator.or_)
+
+    def __xor__(self, other):
+        return self._combine(other, operator.xor)
+
+    def __invert__(self):
+        inverted = BitArray(self._size)
+        bits = inverted._bits
+        for start, chunk in self._chunks():
+            stop = min(start + CHUNK_SIZE, len(bits))
+            bits[start:stop] = (chunk ^ ((1 << 8 * (stop - start)) - 1)).to_bytes(stop - start, 'little')
+        inverted._clear_padding()
+        return inverted
+
+    def __iand__(self, other):
+        return self._combine(other, operator.and_, self)
+
+    def __ior__(self, other):
+        return self._combine(other, operator.or_, self)
+
+    def __ixor__(self, other):
+        return self._combine(other, operator.xor, self)
+
+    @property
+    def nbytes(self):
+        """The number of bytes holding the flags."""
+        return len(self._bits)
+
+    def count(self, value=True):
+        """Returns the number of flags equal to `value`."""
+        ones = sum(chunk.bit_count() for _, chunk in self._chunks())
+        return ones if value else self._size - ones
+
+    def any(self):
+        """Returns True if any flag is set."""
+        return self._bits.count(0) != len(self._bits)
+
+    def all(self):
+        """Returns True if every flag is set, including for an empty BitArray."""
+        full = self._size >> 3
+        if self._bits.count(0xff, 0, full) != full:
+            return False
+        return not self._size & 7 or self._bits[-1] == (1 << (self._size & 7)) - 1
+
+    def find_first(self, value=True):
+        """Returns the index of the first flag equal to `value`, or -1 if there is none.
+
+        Finds the first byte not made entirely of the other value with a C-level
+        regular expression search over the buffer, which copies nothing, then
+        locates the bit within that byte.
+        """
+        match = (_SET_BYTE if value else _CLEAR_BYTE).search(self._bits)
+        if match is None:
+            return -1
+        byte_index = match.start()
+        byte = self._bits[byte_index] if value else ~self._bits[byte_index] & 0xff
+        index = (byte_index << 3) + (byte & -byte).bit_length() - 1
+        return index if index < self._size else -1
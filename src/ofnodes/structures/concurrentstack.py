@@ -0,0 +1,179 @@
+import threading
+from queue import Empty, Full
+from typing import Optional
+
+from ofnodes.nodes.singlynode import SinglyNode
+from ofnodes.components.structures.mixins import PrintMixin
+
+class ConcurrentStack(PrintMixin):
+    """Support for a thread-safe, optionally bounded, reference-based LIFO object.
+
+    Like `Stack`, the head is the last node: pushed nodes become the new head and
+    the head is popped. Every operation holds one lock, so the multi-step pointer
+    updates of `push` and `pop` are atomic. With a positive `maxsize`, `push` blocks
+    while the stack is full and `pop` blocks while it is empty, which applies
+    backpressure to producers. The `queue.Full` and `queue.Empty` exceptions signal
+    non-blocking and timed-out calls, as in the standard library's `queue` module.
+    The stack is only modified through `push` and `pop`, so `head` is read-only.
+
+    Args:
+        values (Iterable, optional): The data to push, in order.
+        maxsize (int): The maximum number of nodes. Zero or less means unbounded.
+            Defaults to 0.
+
+    Examples:
+        >>> stack = ConcurrentStack([1, 2], maxsize=2)
+        >>> stack.push_nowait(3)
+        Traceback (most recent call last):
+        ...
+        queue.Full
+        >>> [node.data for node in stack.pop_many(5)]
+        [2, 1]
+    """
+
+    __slots__ = ('_head', '_size', '_maxsize', '_lock', '_not_empty', '_not_full')
+
+    def __init__(self, values=None, maxsize=0) -> None:
+        self._head: Optional[SinglyNode] = None
+        self._size = 0
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        if values:
+            for value in values:
+                self.push_nowait(value)
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        excluded = {'_head', '_tail', '_target', '_size', '_maxsize', '_lock', '_not_empty', '_not_full', '_format_edges', '_wait_for_nodes', '_unlink_head'}
+        parent_dir = {attr for attr in parent_dir if attr not in excluded}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        with self._lock:
+            if not self._head:
+                return f"{type(self).__name__}()"
+            body, count = self._format_edges(repr, ', ')
+        if count is None:
+            return f"{type(self).__name__}([{body}])"
+        return f"{type(self).__name__}([{body}], len={count})"
+
+    def __str__(self) -> str:
+        with self._lock:
+            if not self._head:
+                return f"Empty {type(self).__name__}"
+            body, count = self._format_edges(str, ' -> ')
+        if count is None:
+            return body
+        return f"{body} ({count} nodes)"
+
+    @property
+    def head(self) -> Optional[SinglyNode]:
+        """The top node, next to be popped. Use `push` and `pop` to modify the stack."""
+        return self._head
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def push(self, data, block=True, timeout=None) -> None:
+        """Pushes `data` onto the stack, waiting for room if the stack is bounded and full.
+
+        Args:
+            data: The data, or node, to push.
+            block (bool): If False, raise `queue.Full` at once when there is no room.
+            timeout (float, optional): The maximum number of seconds to wait for room.
+
+        Raises:
+            queue.Full: If there is no room and `block` is False or `timeout` expired.
+        """
+        with self._not_full:
+            if self._maxsize > 0 and self._size >= self._maxsize:
+                if not block:
+                    raise Full
+                if not self._not_full.wait_for(lambda: self._size < self._maxsize, timeout):
+                    raise Full
+            node = data if isinstance(data, SinglyNode) else SinglyNode(data)
+            node._next = self._head
+            self._head = node
+            self._size += 1
+            self._not_empty.notify()
+
+    def push_nowait(self, data) -> None:
+        """Pushes `data` without waiting; equivalent to `push(data, block=False)`."""
+        self.push(data, block=False)
+
+    def pop(self, block=True, timeout=None) -> SinglyNode:
+        """Removes and returns the head node, waiting for one if the stack is empty.
+
+        Args:
+            block (bool): If False, raise `queue.Empty` at once when the stack is empty.
+            timeout (float, optional): The maximum number of seconds to wait for a node.
+
+        Raises:
+            queue.Empty: If the stack is empty and `block` is False or `timeout` expired.
+        """
+        with self._not_empty:
+            if not self._wait_for_nodes(block, timeout):
+                raise Empty
+            node = self._unlink_head()
+            self._not_full.notify()
+            return node
+
+    def pop_nowait(self) -> SinglyNode:
+        """Pops without waiting; equivalent to `pop(block=False)`."""
+        return self.pop(block=False)
+
+    def pop_many(self, n, block=True, timeout=None) -> list[SinglyNode]:
+        """Removes and returns up to `n` nodes, head first, under a single lock acquisition.
+
+        Waits like `pop` until at least one node is available, then takes as many
+        nodes as are present, up to `n`, without releasing the lock in between.
+
+        Raises:
+            queue.Empty: If the stack is empty and `block` is False or `timeout` expired.
+        """
+        with self._not_empty:
+            if not self._wait_for_nodes(block, timeout):
+                raise Empty
+            nodes = []
+            while self._head is not None and len(nodes) < n:
+                nodes.append(self._unlink_head())
+            self._not_full.notify(len(nodes))
+            return nodes
+
+    def _unlink_head(self) -> SinglyNode:
+        """Removes and returns the head node, with the lock held and the stack not empty."""
+        node = self._head
+        self._head = node._next
+        node._next = None
+        self._size -= 1
+        return node
+
+    def _wait_for_nodes(self, block, timeout) -> bool:
+        """Waits, with the lock held, until the stack holds a node. Returns False on failure."""
+        if self._head is not None:
+            return True
+        if not block:
+            return False
+        return self._not_empty.wait_for(lambda: self._head is not None, timeout)
+
+    def peek(self):
+        with self._lock:
+            if self._head:
+                return self._head.data
+        raise IndexError(f"{type(self).__name__} is empty, cannot peek at top element")
+
+    def display(self):
+        with self._lock:
+            self.print_node_data()
+
+    def is_empty(self):
+        return self._head is None
@@ -0,0 +1,172 @@
+from typing import Optional
+
+from ofnodes.nodes.doublynode import DoublyNode
+from ofnodes.components.structures.mixins import PrintMixin
+
+class Deque(PrintMixin):
+    """Support for a reference-based double-ended queue of doubly linked nodes.
+
+    Nodes are appended and popped at both ends in O(1). Popped nodes are unlinked
+    from their neighbours so they keep no part of the deque alive.
+
+    Examples:
+        >>> deque = Deque([2, 3])
+        >>> deque.appendleft(1)
+        >>> deque.append(4)
+        >>> deque.popleft(), deque.pop()
+        (DoublyNode(data=1), DoublyNode(data=4))
+        >>> deque
+        Deque([2, 3])
+    """
+
+    __slots__ = ('_head', '_tail', '_size')
+
+    def __init__(self, values=None) -> None:
+        self._head: Optional[DoublyNode] = None
+        self._tail: Optional[DoublyNode] = None
+        self._size = 0
+        if values:
+            self.extend(values)
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        parent_dir = {attr for attr in parent_dir if attr not in {'_head', '_tail', '_size', '_format_edges'}}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        current_node = self._head
+        while current_node:
+            yield current_node._data
+            current_node = current_node._next
+
+    def __reversed__(self):
+        current_node = self._tail
+        while current_node:
+            yield current_node._data
+            current_node = current_node._prev
+
+    def __repr__(self) -> str:
+        if not self._head:
+            return f"{type(self).__name__}()"
+        body, count = self._format_edges(repr, ', ')
+        if count is None:
+            return f"{type(self).__name__}([{body}])"
+        return f"{type(self).__name__}([{body}], len={count})"
+
+    def __str__(self) -> str:
+        if not self._head:
+            return f"Empty {type(self).__name__}"
+        body, count = self._format_edges(str, ' <-> ')
+        if count is None:
+            return body
+        return f"{body} ({count} nodes)"
+
+    @property
+    def head(self) -> Optional[DoublyNode]:
+        return self._head
+
+    @property
+    def tail(self) -> Optional[DoublyNode]:
+        return self._tail
+
+    def append(self, data) -> None:
+        node = data if isinstance(data, DoublyNode) else DoublyNode(data)
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail._next = node
+            node._prev = self._tail
+        self._tail = node
+        self._size += 1
+
+    def appendleft(self, data) -> None:
+        node = data if isinstance(data, DoublyNode) else DoublyNode(data)
+        if self._head is None:
+            self._tail = node
+        else:
+            self._head._prev = node
+            node._next = self._head
+        self._head = node
+        self._size += 1
+
+    def pop(self) -> DoublyNode:
+        node = self._tail
+        if node is None:
+            raise ValueError("Cannot remove tail from empty linked structure")
+        self._tail = node._prev
+        if self._tail is None:
+            self._head = None
+        else:
+            self._tail._next = None
+            node._prev = None
+        self._size -= 1
+        return node
+
+    def popleft(self) -> DoublyNode:
+        node = self._head
+        if node is None:
+            raise ValueError("Cannot remove head from empty linked structure")
+        self._head = node._next
+        if self._head is None:
+            self._tail = None
+        else:
+            self._head._prev = None
+            node._next = None
+        self._size -= 1
+        return node
+
+    def extend(self, values) -> None:
+        """Appends every value of an iterable at the tail, in order.
+
+        Examples:
+            >>> deque = Deque([1])
+            >>> deque.extend([2, 3])
+            >>> deque
+            Deque([1, 2, 3])
+        """
+        for value in values:
+            self.append(value)
+
+    def extendleft(self, values) -> None:
+        """Appends every value of an iterable at the head, which reverses their order.
+
+        Examples:
+            >>> deque = Deque([3])
+            >>> deque.extendleft([2, 1])
+            >>> deque
+            Deque([1, 2, 3])
+        """
+        for value in values:
+            self.appendleft(value)
+
+    def drain(self, n=None) -> list[DoublyNode]:
+        """Pops up to `n` nodes, or every node if `n` is None, from the head.
+
+        Examples:
+            >>> deque = Deque(range(5))
+            >>> [node.data for node in deque.drain(2)]
+            [0, 1]
+        """
+        nodes = []
+        while self._head is not None and (n is None or len(nodes) < n):
+            nodes.append(self.popleft())
+        return nodes
+
+    def peek(self):
+        if self._tail:
+            return self._tail.data
+        raise IndexError(f"{type(self).__name__} is empty, cannot peek at tail element")
+
+    def peekleft(self):
+        if self._head:
+            return self._head.data
+        raise IndexError(f"{type(self).__name__} is empty, cannot peek at head element")
+
+    def is_empty(self):
+        return self._head is None
@@ -0,0 +1,282 @@
+"""Defines a compact binary file format and memory-mapped, read-only structures.
+
+A file starts with a fixed 24-byte little-endian header followed by the typed
+payload block and, for linked lists, the next-index block::
+
+    offset  size  field
+    0       4     magic, b'OFND'
+    4       1     format version, 2
+    5       1     kind, 0 for an array and 1 for a linked list
+    6       1     `array` typecode of the payload items, e.g. b'q' or b'd'
+    7       1     byte order of the blocks, b'<' for little- or b'>' for big-endian
+    8       8     count, the number of payload items (unsigned)
+    16      8     head, the slot of the head node, -1 if empty (0 for arrays)
+    24      ...   payload block, `count` items of the typecode's size
+    ...     ...   padding to an 8-byte boundary (linked lists only)
+    ...     ...   next-index block, `count` int64 slots, -1 marks the tail
+
+Opening a file maps it with `mmap` and exposes the blocks through `memoryview`
+casts, so nothing is read until an item is accessed and the operating system
+pages the file in on demand. The blocks are therefore kept in the writing host's
+byte order, which the header records, and only typecodes of the same size on
+every platform are accepted; a file opens on any host of the same byte order
+and is rejected elsewhere.
+
+Example:
+    Typical usage example:
+
+        raarray.save(path)
+        with RandomAccessArray.open_mmap(path) as mapped:
+            mapped[1_000_000]
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from itertools import islice
+
+MAGIC = b'OFND'
+VERSION = 2
+ARRAY_KIND = 0
+LINKED_LIST_KIND = 1
+HEADER = struct.Struct('<4sBBccQq')
+BYTEORDER = b'<' if sys.byteorder == 'little' else b'>'
+TYPECODES = frozenset('bBhHiIqQfd')  # not 'l' or 'L', whose size varies by platform
+CHUNK_SIZE = 1 << 16  # items converted and written at a time
+
+
+def _infer_typecode(values) -> str:
+    """Returns 'q' for integer payloads and 'd' for float or mixed numeric payloads.
+
+    Iterates `values` once without storing them.
+    """
+    types = set(map(type, values))
+    if types <= {int}:
+        return 'q'
+    if types <= {int, float}:
+        return 'd'
+    raise TypeError(
+        "Only numeric payloads can be saved; pass a typecode for other numeric types."
+    )
+
+
+def _write(path, kind, values, typecode=None) -> None:
+    """Streams `values` to `path` in chunks of `CHUNK_SIZE` items.
+
+    The header is written last, once the count is known, so the values are never
+    held in memory all at once. Without a typecode, `values` is iterated twice, so
+    it must be re-iterable rather than an iterator.
+
+    The file is written under a temporary name and renamed over `path` on success,
+    so a failed write, e.g., a value the typecode cannot hold, leaves any existing
+    file untouched and no partial file behind.
+    """
+    if typecode is None:
+        typecode = _infer_typecode(values)
+    if typecode not in TYPECODES:
+        raise ValueError(f"Unsupported typecode: {typecode!r}")
+    temp_path = f"{os.fsdecode(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        _write_blocks(temp_path, kind, values, typecode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def _write_blocks(path, kind, values, typecode) -> None:
+    """Writes the header and blocks to the new file `path`."""
+    with open(path, 'xb') as file:
+        file.seek(HEADER.size)
+        count, items = 0, iter(values)
+        while chunk := array(typecode, islice(items, CHUNK_SIZE)):
+            chunk.tofile(file)
+            count += len(chunk)
+        head = 0
+        if kind == LINKED_LIST_KIND:
+            file.write(b'\0' * (-file.tell() % 8))
+            for start in range(1, count, CHUNK_SIZE):  # slot i links to slot i + 1
+                array('q', range(start, min(start + CHUNK_SIZE, count))).tofile(file)
+            if count:
+                array('q', [-1]).tofile(file)
+            else:
+                head = -1
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, kind, typecode.encode(), BYTEORDER, count, head))
+
+
+def save_array(path, values, typecode=None) -> None:
+    """Writes the items of an index-based structure to `path` in the ofnodes format.
+
+    Without a typecode, `values` must be re-iterable; see `_write`.
+    """
+    _write(path, ARRAY_KIND, values, typecode)
+
+
+def save_linked_list(path, values, typecode=None) -> None:
+    """Writes the node data of a linked structure to `path` in the ofnodes format.
+
+    Nodes are stored in traversal order, so slot ``i`` links to slot ``i + 1``.
+    Without a typecode, `values` must be re-iterable; see `_write`.
+    """
+    _write(path, LINKED_LIST_KIND, values, typecode)
+
+
+class _MappedStructure:
+    """Base class mapping an ofnodes file and validating its header."""
+
+    __slots__ = ('_file', '_mmap', '_buffer', '_data', '_count', '_head', '_typecode')
+
+    kind = None
+
+    def __init__(self, path) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError(f"{path!r} is not an ofnodes file.") from None
+        self._buffer = memoryview(self._mmap)
+        if len(self._buffer) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path!r} is not an ofnodes file.")
+        magic, version, kind, typecode, byteorder, count, head = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path!r} is not an ofnodes file.")
+        if kind != self.kind:
+            self.close()
+            raise ValueError(f"{path!r} does not hold a {type(self).__name__} payload.")
+        if byteorder != BYTEORDER:
+            self.close()
+            raise ValueError(f"{path!r} was written on a host of another byte order.")
+        self._typecode = typecode.decode('latin-1')
+        if self._typecode not in TYPECODES:
+            self.close()
+            raise ValueError(f"{path!r} has a corrupt ofnodes header.")
+        self._count = count
+        self._head = head
+        if len(self._buffer) < self._file_size():
+            self.close()
+            raise ValueError(f"{path!r} is truncated: its header records {count} items.")
+        stop = HEADER.size + count * array(self._typecode).itemsize
+        self._data = self._buffer[HEADER.size:stop].cast(self._typecode)
+
+    def _file_size(self) -> int:
+        """Returns the minimum size of a file holding the items its header records."""
+        return HEADER.size + self._count * array(self._typecode).itemsize
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def typecode(self) -> str:
+        return self._typecode
+
+    def close(self) -> None:
+        """Releases the views and unmaps the file."""
+        for name in ('_data', '_buffer'):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+class MappedRandomAccessArray(_MappedStructure):
+    """A read-only `RandomAccessArray` mapped from a file written by `RandomAccessArray.save`.
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "data.ofn")
+        >>> save_array(path, [8, 2, 6, 4, 5])
+        >>> with MappedRandomAccessArray(path) as mapped:
+        ...     mapped[0], len(mapped)
+        (8, 5)
+    """
+
+    __slots__ = ()
+
+    kind = ARRAY_KIND
+
+    def __getitem__(self, index):
+        """Returns the item at `index`, or a zero-copy `memoryview` of a slice."""
+        return self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(typecode={self._typecode!r}, len={self._count})"
+
+
+class MappedSinglyLinkedList(_MappedStructure):
+    """A read-only `SinglyLinkedList` mapped from a file written by `SinglyLinkedList.save`.
+
+    Traversal follows the next-index block from the head slot, reading payload items
+    on demand. Index access keeps the last visited position like `SinglyLinkedList`.
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "data.ofn")
+        >>> save_linked_list(path, [8, 2, 6, 4, 5])
+        >>> with MappedSinglyLinkedList(path) as mapped:
+        ...     list(mapped)
+        [8, 2, 6, 4, 5]
+    """
+
+    __slots__ = ('_next', '_finger')
+
+    kind = LINKED_LIST_KIND
+
+    def __init__(self, path) -> None:
+        super().__init__(path)
+        start = super()._file_size()
+        start += -start % 8
+        self._next = self._buffer[start:start + self._count * 8].cast('q')
+        self._finger = None
+
+    def _file_size(self) -> int:
+        # the payload is padded to 8 bytes and followed by one next slot per node
+        size = super()._file_size()
+        return size + -size % 8 + self._count * 8
+
+    def __iter__(self):
+        data, next_slots = self._data, self._next
+        slot = self._head
+        while slot != -1:
+            yield data[slot]
+            slot = next_slots[slot]
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        position, slot = 0, self._head
+        if self._finger is not None and self._finger[0] <= index:
+            position, slot = self._finger
+        while position < index:
+            slot = self._next[slot]
+            position += 1
+        self._finger = (index, slot)
+        return self._data[slot]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(typecode={self._typecode!r}, len={self._count})"
+
+    def close(self) -> None:
+        """Releases the views and unmaps the file."""
+        next_slots = getattr(self, '_next', None)
+        if next_slots is not None:
+            next_slots.release()
+        super().close()
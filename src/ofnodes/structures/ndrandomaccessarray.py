@@ -0,0 +1,218 @@
+from itertools import product
+from math import prod
+
+from ofnodes.structures.arrayview import RandomAccessArrayView
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+
+
+class NDRandomAccessArray:
+    """A row-major N-dimensional array over one flat RandomAccessArray.
+
+    Element `(i0, i1, ...)` lives at flat index `offset + i0 * s0 + i1 * s1 + ...`
+    of the backing array, where `(s0, s1, ...)` are the strides. Indexing with
+    slices or fewer indices than dimensions, and `transpose`, only compute a new
+    offset, shape and strides, so they return views sharing the backing array
+    rather than copies. One-dimensional results are RandomAccessArrayViews, which
+    bring the index-based sorting mixins to rows, columns and any other lane.
+
+    Args:
+        shape (int | tuple[int, ...]): The length of each dimension.
+        typecode (str, optional): An `array` module typecode for typed storage.
+        fill (Any, optional): The initial value of every element.
+
+    Attributes:
+        _base (RandomAccessArray): The flat backing array.
+        _shape (tuple[int, ...]): The length of each dimension.
+        _strides (tuple[int, ...]): The flat index step of each dimension.
+        _offset (int): The flat index of the first element.
+
+    Examples:
+        >>> grid = NDRandomAccessArray((2, 3), fill=0)
+        >>> for (i, j), val in zip(product(range(2), range(3)), [8, 2, 6, 4, 5, 1]):
+        ...     grid[i, j] = val
+        >>> grid
+        NDRandomAccessArray([[8, 2, 6], [4, 5, 1]])
+        >>> grid[:, 1]
+        RandomAccessArrayView([2, 5])
+        >>> grid.T
+        NDRandomAccessArray([[8, 4], [2, 5], [6, 1]])
+        >>> grid.sort(axis=1)
+        >>> grid
+        NDRandomAccessArray([[2, 6, 8], [1, 4, 5]])
+    """
+    __slots__ = ('_base', '_shape', '_strides', '_offset')
+
+    def __init__(self, shape, typecode=None, fill=None):
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        if not shape or any(n < 0 for n in shape):
+            raise ValueError(f"shape must be a non-empty tuple of non-negative lengths, not {shape!r}.")
+        strides = [1] * len(shape)
+        for axis in range(len(shape) - 2, -1, -1):
+            strides[axis] = strides[axis + 1] * shape[axis + 1]
+        self._base = RandomAccessArray(prod(shape), typecode=typecode, fill=fill)
+        self._shape = shape
+        self._strides = tuple(strides)
+        self._offset = 0
+
+    @classmethod
+    def _from_layout(cls, base, shape, strides, offset):
+        ndarray = cls.__new__(cls)
+        ndarray._base = base
+        ndarray._shape = shape
+        ndarray._strides = strides
+        ndarray._offset = offset
+        return ndarray
+
+    def _locate(self, key):
+        """Resolves an index key to a flat offset and the remaining shape and strides."""
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > len(self._shape):
+            raise IndexError(f"too many indices for a {len(self._shape)}-dimensional array")
+        offset, shape, strides = self._offset, [], []
+        for axis, index in enumerate(key):
+            n, stride = self._shape[axis], self._strides[axis]
+            if isinstance(index, slice):
+                positions = range(n)[index]
+                offset += positions.start * stride if positions else 0
+                shape.append(len(positions))
+                strides.append(positions.step * stride)
+            else:
+                if index < 0:
+                    index += n
+                if not 0 <= index < n:
+                    raise IndexError(f"index out of range for axis {axis} of length {n}")
+                offset += index * stride
+        shape.extend(self._shape[len(key):])
+        strides.extend(self._strides[len(key):])
+        return offset, tuple(shape), tuple(strides)
+
+    def __getitem__(self, key):
+        offset, shape, strides = self._locate(key)
+        if not shape:
+            return self._base._data[offset]
+        if len(shape) == 1:
+            return RandomAccessArrayView(self._base, offset, strides[0], shape[0])
+        return self._from_layout(self._base, shape, strides, offset)
+
+    def __setitem__(self, key, value):
+        offset, shape, strides = self._locate(key)
+        if shape:
+            raise TypeError("Assign to a single element; index every dimension.")
+        if self._base._indexes:
+            self._base._update_indexes(offset, self._base._data[offset], value)
+        self._base._data[offset] = value
+        self._base._sort_state = None
+        if offset >= self._base._len_used:
+            self._base._len_used = offset + 1
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __iter__(self):
+        for i in range(self._shape[0]):
+            yield self[i]
+
+    def __repr__(self):
+        return f"NDRandomAccessArray({self.tolist()})"
+
+    def __str__(self):
+        return str(self.tolist())
+
+    @property
+    def shape(self):
+        """The length of each dimension."""
+        return self._shape
+
+    @property
+    def strides(self):
+        """The flat index step of each dimension."""
+        return self._strides
+
+    @property
+    def ndim(self):
+        """The number of dimensions."""
+        return len(self._shape)
+
+    @property
+    def size(self):
+        """The number of elements."""
+        return prod(self._shape)
+
+    @property
+    def base(self):
+        """The flat RandomAccessArray the elements are stored in."""
+        return self._base
+
+    def tolist(self):
+        """Returns the elements as nested lists."""
+        if len(self._shape) == 1:
+            return list(self[:])
+        return [row.tolist() for row in self]
+
+    def transpose(self, *axes):
+        """Returns a view with the axes permuted, reversed by default, without copying.
+
+        Examples:
+            >>> cube = NDRandomAccessArray((2, 3, 4), fill=0)
+            >>> cube.transpose().shape, cube.transpose(1, 0, 2).strides
+            ((4, 3, 2), (4, 12, 1))
+        """
+        if len(axes) == 1 and not isinstance(axes[0], int):
+            axes = tuple(axes[0])
+        if not axes:
+            axes = tuple(range(len(self._shape) - 1, -1, -1))
+        if sorted(axes) != list(range(len(self._shape))):
+            raise ValueError(f"axes {axes!r} are not a permutation of the dimensions")
+        return self._from_layout(
+            self._base,
+            tuple(self._shape[axis] for axis in axes),
+            tuple(self._strides[axis] for axis in axes),
+            self._offset,
+        )
+
+    @property
+    def T(self):
+        """The transpose, see `transpose`."""
+        return self.transpose()
+
+    def lanes(self, axis=-1):
+        """Yields a RandomAccessArrayView of every 1-D lane along `axis`.
+
+        For a 2-D array, the lanes along axis 1 are the rows and those along axis 0
+        the columns.
+        """
+        axis = range(len(self._shape))[axis]
+        n, step = self._shape[axis], self._strides[axis]
+        others = [(self._shape[a], self._strides[a]) for a in range(len(self._shape)) if a != axis]
+        for index in product(*(range(length) for length, _ in others)):
+            start = self._offset + sum(i * stride for i, (_, stride) in zip(index, others))
+            yield RandomAccessArrayView(self._base, start, step, n)
+
+    def reverse_order(self, axis=-1):
+        """Reverses every lane along `axis` in place."""
+        for lane in self.lanes(axis):
+            lane.reverse_order()
+
+    def bubble_sort(self, axis=-1, ascending=True):
+        """Sorts every lane along `axis` in place using bubble sort."""
+        for lane in self.lanes(axis):
+            lane.bubble_sort(ascending)
+
+    def insertion_sort(self, axis=-1, ascending=True, key=None):
+        """Sorts every lane along `axis` in place using insertion sort."""
+        for lane in self.lanes(axis):
+            lane.insertion_sort(ascending, key)
+
+    def sort(self, axis=-1, ascending=True, key=None):
+        """Sorts every lane along `axis` in place with a stable Timsort.
+
+        Examples:
+            >>> grid = NDRandomAccessArray((2, 2), fill=0)
+            >>> grid[0, 0], grid[1, 0] = 9, 1
+            >>> grid.sort(axis=0)
+            >>> grid
+            NDRandomAccessArray([[1, 0], [9, 0]])
+        """
+        for lane in self.lanes(axis):
+            lane[:] = sorted(lane, key=key, reverse=not ascending)
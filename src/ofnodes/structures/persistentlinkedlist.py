@@ -0,0 +1,153 @@
+from typing import Optional
+
+from ofnodes.nodes.frozensinglynode import FrozenSinglyNode
+from ofnodes.structures.singlylinkedlist import SinglyLinkedList
+
+class PersistentLinkedList:
+    """An immutable singly linked list whose versions share their tails.
+
+    Every update returns a new version and leaves the original untouched. Because the
+    nodes are `FrozenSinglyNode` instances, a new version only allocates the nodes in
+    front of the shared tail: `push` and `pop` are O(1), `prepend` is O(k) for k values.
+    A version is therefore its own snapshot, and readers in other threads need no locks.
+
+    Args:
+        values (Iterable, optional): The data of the nodes, from head to tail.
+
+    Attributes:
+        _head (Optional[FrozenSinglyNode]): The head of the list.
+        _length (int): The number of nodes reachable from the head.
+
+    Examples:
+        >>> v1 = PersistentLinkedList([2, 3])
+        >>> v2 = v1.push(1)
+        >>> v1, v2
+        (PersistentLinkedList([2, 3]), PersistentLinkedList([1, 2, 3]))
+        >>> v2.head.next is v1.head
+        True
+        >>> v2.pop() is v1
+        False
+        >>> v2.pop().head is v1.head
+        True
+    """
+
+    __slots__ = ('_head', '_length',)
+
+    def __init__(self, values=None) -> None:
+        head: Optional[FrozenSinglyNode] = None
+        length = 0
+        if values:
+            for value in reversed(list(values)):
+                head = FrozenSinglyNode(value, head)
+                length += 1
+        object.__setattr__(self, '_head', head)
+        object.__setattr__(self, '_length', length)
+
+    @classmethod
+    def _from_chain(cls, head, length):
+        plist = cls.__new__(cls)
+        object.__setattr__(plist, '_head', head)
+        object.__setattr__(plist, '_length', length)
+        return plist
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        current_node = self._head
+        while current_node:
+            yield current_node._data
+            current_node = current_node._next
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        parent_dir = {attr for attr in parent_dir if attr not in {'_head', '_length', '_from_chain'}}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __repr__(self) -> str:
+        if not self._head:
+            return f"{type(self).__name__}()"
+        return f"{type(self).__name__}([" + ', '.join(repr(data) for data in self) + "])"
+
+    def __str__(self) -> str:
+        if not self._head:
+            return f"Empty {type(self).__name__}"
+        return ' -> '.join(str(data) for data in self)
+
+    @property
+    def head(self) -> Optional[FrozenSinglyNode]:
+        return self._head
+
+    def push(self, data) -> 'PersistentLinkedList':
+        """Returns a new version with `data` at the head, sharing this version's nodes.
+
+        Examples:
+            >>> PersistentLinkedList([2]).push(1)
+            PersistentLinkedList([1, 2])
+        """
+        return self._from_chain(FrozenSinglyNode(data, self._head), self._length + 1)
+
+    def pop(self) -> 'PersistentLinkedList':
+        """Returns a new version without the head node.
+
+        Raises:
+            ValueError: If the list is empty.
+
+        Examples:
+            >>> PersistentLinkedList([1, 2]).pop()
+            PersistentLinkedList([2])
+        """
+        if self._head is None:
+            raise ValueError("Cannot remove head from empty linked structure")
+        return self._from_chain(self._head._next, self._length - 1)
+
+    def prepend(self, values) -> 'PersistentLinkedList':
+        """Returns a new version with `values`, in order, in front of this version's nodes.
+
+        Examples:
+            >>> PersistentLinkedList([3]).prepend([1, 2])
+            PersistentLinkedList([1, 2, 3])
+        """
+        head = self._head
+        length = self._length
+        for value in reversed(list(values)):
+            head = FrozenSinglyNode(value, head)
+            length += 1
+        return self._from_chain(head, length)
+
+    def peek(self):
+        if self._head:
+            return self._head.data
+        raise IndexError(f"{type(self).__name__} is empty, cannot peek at head element")
+
+    def is_empty(self):
+        return self._head is None
+
+
+def to_singly_linked_list(plist: PersistentLinkedList) -> SinglyLinkedList:
+    """Copies the data of a persistent list into a new, mutable `SinglyLinkedList` in O(n).
+
+    Examples:
+        >>> to_singly_linked_list(PersistentLinkedList([1, 2, 3]))
+        SinglyLinkedList([1, 2, 3])
+    """
+    return SinglyLinkedList(plist)
+
+
+def from_singly_linked_list(sllist: SinglyLinkedList) -> PersistentLinkedList:
+    """Copies the data of a `SinglyLinkedList` into a new persistent list in O(n).
+
+    Examples:
+        >>> from_singly_linked_list(SinglyLinkedList([1, 2, 3]))
+        PersistentLinkedList([1, 2, 3])
+    """
+    return PersistentLinkedList(sllist)
@@ -0,0 +1,154 @@
+from typing import Optional
+
+from ofnodes.nodes.singlynode import SinglyNode
+from ofnodes.components.structures.mixins import PrintMixin
+
+class Queue(PrintMixin):
+    """Support for a reference-based FIFO object.
+
+    Nodes are enqueued at the tail and dequeued from the head, both in O(1).
+    The node count is tracked, so `len()` is O(1). The queue is only modified
+    through `enqueue`, `extend`, `dequeue` and `drain`, and dequeued nodes are
+    unlinked from it.
+
+    Examples:
+        >>> queue = Queue([1, 2])
+        >>> queue.enqueue(3)
+        >>> queue.dequeue()
+        SinglyNode(data=1)
+        >>> queue
+        Queue([2, 3])
+    """
+
+    __slots__ = ('_head', '_tail', '_size')
+
+    def __init__(self, values=None) -> None:
+        self._head: Optional[SinglyNode] = None
+        self._tail: Optional[SinglyNode] = None
+        self._size = 0
+        if values:
+            self.extend(values)
+
+    def __dir__(self) -> list[str]:
+        # Get the list of attributes and methods from the parent classes
+        parent_dir = set(super().__dir__())
+        # Filter out private attributes and methods
+        parent_dir = {attr for attr in parent_dir if attr not in {'_head', '_tail', '_target', '_size', '_format_edges'}}
+        # Return a sorted list of all attributes and methods
+        return sorted(parent_dir)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def head(self) -> Optional[SinglyNode]:
+        """The front node, next to be dequeued. Use `enqueue` and `dequeue` to modify the queue."""
+        return self._head
+
+    @property
+    def tail(self) -> Optional[SinglyNode]:
+        """The back node, the last enqueued. Use `enqueue` and `dequeue` to modify the queue."""
+        return self._tail
+
+    def __iter__(self):
+        current_node = self._head
+        while current_node:
+            yield current_node._data
+            current_node = current_node._next
+
+    def __repr__(self) -> str:
+        if not self._head:
+            return f"{type(self).__name__}()"
+        body, count = self._format_edges(repr, ', ')
+        if count is None:
+            return f"{type(self).__name__}([{body}])"
+        return f"{type(self).__name__}([{body}], len={count})"
+
+    def __str__(self) -> str:
+        if not self._head:
+            return f"Empty {type(self).__name__}"
+        body, count = self._format_edges(str, ' -> ')
+        if count is None:
+            return body
+        return f"{body} ({count} nodes)"
+
+    def enqueue(self, data) -> None:
+        node = data if isinstance(data, SinglyNode) else SinglyNode(data)
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail._next = node
+        self._tail = node
+        self._size += 1
+
+    def dequeue(self) -> SinglyNode:
+        """Removes and returns the head node.
+
+        Raises:
+            ValueError: If the queue is empty.
+        """
+        node = self._head
+        if node is None:
+            raise ValueError("Cannot remove head from empty linked structure")
+        self._head = node._next
+        if self._head is None:
+            self._tail = None
+        node._next = None  # unlink the node from the queue
+        self._size -= 1
+        return node
+
+    def extend(self, values) -> None:
+        """Enqueues every value of an iterable, in order, linking the nodes directly.
+
+        Examples:
+            >>> queue = Queue()
+            >>> queue.extend(range(3))
+            >>> queue
+            Queue([0, 1, 2])
+        """
+        tail = self._tail
+        count = 0
+        for value in values:
+            node = value if isinstance(value, SinglyNode) else SinglyNode(value)
+            if tail is None:
+                self._head = node
+            else:
+                tail._next = node
+            tail = node
+            count += 1
+        self._tail = tail
+        self._size += count
+
+    def drain(self, n=None) -> list[SinglyNode]:
+        """Dequeues up to `n` nodes, or every node if `n` is None, in FIFO order.
+
+        Examples:
+            >>> queue = Queue(range(5))
+            >>> [node.data for node in queue.drain(2)]
+            [0, 1]
+            >>> [node.data for node in queue.drain()]
+            [2, 3, 4]
+        """
+        nodes = []
+        current_node = self._head
+        while current_node and (n is None or len(nodes) < n):
+            nodes.append(current_node)
+            current_node = current_node._next
+        self._head = current_node
+        if current_node is None:
+            self._tail = None
+        self._size -= len(nodes)
+        for node in nodes:  # unlink the nodes from the queue
+            node._next = None
+        return nodes
+
+    def peek(self):
+        if self._head:
+            return self._head.data
+        raise IndexError(f"{type(self).__name__} is empty, cannot peek at front element")
+
+    def display(self):
+        self.print_node_data()
+
+    def is_empty(self):
+        return self._head is None
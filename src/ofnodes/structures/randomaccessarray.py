@@ -1,5 +1,21 @@
-from ofnodes.sorting.mixins import BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin
-class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from math import ceil
+
+from ofnodes.sorting.mixins import BubbleSortMixin, HeapSortMixin, InsertionSortMixin, ReverseOrderMixin
+from ofnodes.structures.arrayview import RandomAccessArrayView
+from ofnodes.structures.mapped import MappedRandomAccessArray, save_array
+
+try:
+    import numpy
+except ImportError:  # the pure-Python backend remains available
+    numpy = None
+
+BACKENDS = ('python', 'numpy')
+
+
+class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, HeapSortMixin, ReverseOrderMixin):
     """An array supporting random access with bubble sort and order reversal capabilities.
 
     This class represents an array that supports random access operations and also provides
@@ -8,13 +24,44 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
 
     Args:
         size (int): The size of the array.
+        typecode (str, optional): An `array` module typecode, e.g., 'd' or 'q'. When
+            given, elements are stored unboxed in an `array.array`, which takes about
+            an eighth of the memory of a list for numeric data. Defaults to None.
+        fill (Any, optional): The initial value of every slot. Defaults to None, or to
+            zero when a typecode is given.
+        dynamic (bool): If True, the array grows and shrinks through `append`, `extend`,
+            `insert` and `pop`, keeping spare capacity beyond its logical length so that
+            appends are amortized O(1). Defaults to False.
+        growth_factor (float): The factor by which a full dynamic array multiplies its
+            capacity. Must be greater than 1. Defaults to 2.0.
+        shrink_threshold (float, optional): The occupancy, i.e., length over capacity,
+            below which a dynamic array releases spare capacity after a `pop`. None
+            never shrinks. Defaults to 0.25.
+        backend (str): 'python' for list or `array.array` storage, or 'numpy' for an
+            ndarray whose sorts, reversal and reductions are vectorized. The 'numpy'
+            backend requires NumPy to be installed. Defaults to 'python'.
+        dtype (numpy.dtype, optional): The dtype of the 'numpy' backend, e.g.,
+            'float64'. Defaults to NumPy's choice for `fill`.
 
     Attributes:
-        _data (list): The underlying list to store array elements.
+        _data (list | array.array | memoryview | numpy.ndarray): The underlying
+            storage of the array elements.
+        _typecode (Optional[str]): The typecode of typed storage, None for a list.
+        _fill (Any): The initial value of every slot.
+        _length (int): The logical length, at most the capacity `len(self._data)`.
+        _len_used (int): The filled prefix, i.e., one past the highest index written,
+            or the logical length when every slot starts with a `fill` value.
+        _dynamic (bool): Whether the array may grow and shrink.
+        _growth_factor (float): The capacity multiplier of a full dynamic array.
+        _shrink_threshold (Optional[float]): The occupancy that triggers shrinking.
+        _reserved (int): The capacity floor set by `reserve`.
+        _backend (str): The storage backend, 'python' or 'numpy'.
+        _sort_state (Optional[tuple]): The `(key, ascending)` order the elements are
+            known to be sorted in, or None once a write may have broken it.
 
     Note:
-        This class inherits from BubbleSortMixin and ReverseOrderMixin to leverage the
-        bubble sort and order reversal functionalities.
+        This class inherits from BubbleSortMixin, InsertionSortMixin, HeapSortMixin and
+        ReverseOrderMixin to leverage the sorting and order reversal functionalities.
 
     Examples:
         >>> raarray = RandomAccessArray(5)
@@ -29,24 +76,107 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
         RandomAccessArray([8, 2, 6, 4, 5])
         >>> str(raarray)
         '[8, 2, 6, 4, 5]'
+        >>> RandomAccessArray(3, typecode='d')
+        RandomAccessArray([0.0, 0.0, 0.0], typecode='d')
+        >>> RandomAccessArray(2, fill='')
+        RandomAccessArray(['', ''])
+        >>> parray = RandomAccessArray(5)
+        >>> parray[0], parray[1] = 8, 2
+        >>> parray.bubble_sort()
+        >>> parray, parray.len_used, str(parray)
+        (RandomAccessArray([2, 8, None, None, None]), 2, '[2, 8]')
+        >>> darray = RandomAccessArray(0, dynamic=True)
+        >>> darray.extend([8, 2, 6])
+        >>> darray.append(4)
+        >>> darray, len(darray), darray.capacity
+        (RandomAccessArray([8, 2, 6, 4]), 4, 6)
     """
-    def __init__(self, size):
-        self._data = [None] * size
+    _indexes = ()  # the attached range indexes, see `attach_index`
+
+    def __init__(self, size, typecode=None, fill=None, dynamic=False, growth_factor=2.0, shrink_threshold=0.25,
+                 backend='python', dtype=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, not {backend!r}.")
+        if backend == 'numpy':
+            if numpy is None:
+                raise ImportError("The 'numpy' backend requires NumPy; install it or use backend='python'.")
+            if typecode is not None:
+                raise ValueError("typecode applies to the 'python' backend; use dtype with backend='numpy'.")
+            if fill is None:
+                fill = 0
+            self._data = numpy.full(size, fill, dtype=dtype)
+            fill = self._data.dtype.type(fill)
+        elif typecode is None:
+            self._data = [fill] * size
+        else:
+            if fill is None:
+                fill = 0
+            self._data = array(typecode, [fill]) * size
+        if dynamic and growth_factor <= 1:
+            raise ValueError("growth_factor must be greater than 1.")
+        self._typecode = typecode
+        self._fill = fill
+        self._length = size
+        self._len_used = 0 if fill is None else size
+        self._dynamic = dynamic
+        self._growth_factor = growth_factor
+        self._shrink_threshold = shrink_threshold
+        self._reserved = 0
+        self._backend = backend
+        self._sort_state = None
+
+    def _bounded_slice(self, index):
+        """Converts a slice of the logical array into the same slice of `_data`."""
+        start, stop, step = index.indices(self._length)
+        return slice(start, None if stop < 0 else stop, step)  # a negative stop means past the front
 
     def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._data[self._bounded_slice(index)]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RandomAccessArray index out of range")
         return self._data[index]
 
     def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            written = range(self._length)[index]
+            values = list(value)
+            if len(values) != len(written):  # the length is fixed, as with `array` and memoryview
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} to slice of size {len(written)}"
+                )
+            if self._typecode is not None and self._backend == 'python':
+                values = array(self._typecode, values)
+            self._data[self._bounded_slice(index)] = values
+            self._sort_state = None
+            if written:
+                self._len_used = max(self._len_used, max(written) + 1)
+            self._refresh_indexes()
+            return
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RandomAccessArray assignment index out of range")
+        if self._indexes:
+            self._update_indexes(index, self._data[index], value)
         self._data[index] = value
+        self._sort_state = None
+        if index >= self._len_used:
+            self._len_used = index + 1
 
     def __len__(self):
-        return len(self._data)
+        return self._length
+
+    def __iter__(self):
+        return islice(self._data, self._len_used)
 
     def __dir__(self) -> list[str]:
         # Get the list of attributes and methods from the parent classes
         parent_dir = set(super().__dir__())
         # Filter out private attributes and methods
-        excluded = {'_head', '_tail', '_target', 'reference_based_reverse_order', 'reference_based_bubble_sort','index_based_bubble_sort', 'index_based_reverse_order'}
+        excluded = {'_head', '_tail', '_target', '_typecode', '_fill', '_length', '_len_used', '_dynamic', '_growth_factor', '_shrink_threshold', '_reserved', '_resize', '_make_room', '_require_dynamic', '_backend', '_from_storage', '_assign_prefix', '_numpy_order', '_sort_state', '_search_key', '_bisect', '_key_bounds', '_indexes', '_update_indexes', '_refresh_indexes', '_bounded_slice', '_index_based_sift_down', 'reference_based_reverse_order', 'reference_based_bubble_sort','index_based_bubble_sort', 'index_based_reverse_order'}
         parent_dir = {attr for attr in parent_dir if attr not in excluded}
         # Return a sorted list of all attributes and methods
         return sorted(parent_dir)
@@ -64,7 +194,11 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
             RandomAccessArray([8, 2, 6, 4, 5])
 
         """
-        return f"RandomAccessArray({self._data})"
+        if self._backend == 'numpy':
+            return f"RandomAccessArray({self._data[:self._length].tolist()}, backend='numpy', dtype={str(self._data.dtype)!r})"
+        if self._typecode is None:
+            return f"RandomAccessArray({self._data[:self._length]})"
+        return f"RandomAccessArray({self._data[:self._length].tolist()}, typecode={self._typecode!r})"
 
     def __str__(self):
         """Returns a string representation of the array.
@@ -72,13 +206,233 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
         Returns:
             str: A string representation of the array.
 
+        Only the filled prefix, see `len_used`, is shown.
+
         Example:
             >>> raarray = RandomAccessArray(5)
             >>> [raarray.__setitem__(i, val) for i, val in enumerate([8, 2, 6, 4, 5])]
             >>> str(raarray)
             '[8, 2, 6, 4, 5]'
         """
-        return f"[{', '.join(str(item) for item in self._data)}]"
+        return f"[{', '.join(str(item) for item in self)}]"
+
+    @property
+    def typecode(self):
+        """The `array` typecode of typed storage, or None for list storage."""
+        return self._typecode
+
+    def view(self, start=None, stop=None, step=None):
+        """Returns a view of `self[start:stop:step]` that shares this array's storage.
+
+        Unlike slicing, which copies, reads and writes through the view, including
+        sorts and reversals, act on this array in place.
+
+        Examples:
+            >>> raarray = RandomAccessArray(5)
+            >>> for i, val in enumerate([8, 2, 6, 4, 5]):
+            ...     raarray[i] = val
+            >>> raarray.view(1, 4).insertion_sort()
+            >>> raarray
+            RandomAccessArray([8, 2, 4, 6, 5])
+        """
+        positions = range(self._length)[slice(start, stop, step)]
+        return RandomAccessArrayView(self, positions.start, positions.step, len(positions))
+
+    @classmethod
+    def from_buffer(cls, obj):
+        """Wraps any object exporting the buffer protocol without copying it.
+
+        The array stores a memoryview of `obj`, so writes go straight to its memory
+        and read-only buffers, e.g., `bytes`, give read-only arrays. Multi-dimensional
+        C-contiguous buffers are flattened. The result has a fixed size.
+
+        Examples:
+            >>> from array import array
+            >>> buffer = array('d', [3.0, 1.0, 2.0])
+            >>> raarray = RandomAccessArray.from_buffer(buffer)
+            >>> raarray.insertion_sort()
+            >>> buffer
+            array('d', [1.0, 2.0, 3.0])
+        """
+        data = memoryview(obj)
+        typecode = data.format.lstrip('@')
+        if data.ndim != 1:
+            data = data.cast('B').cast(typecode)
+        elif data.format != typecode:
+            data = data.cast(typecode)
+        return cls._from_storage(data, typecode)
+
+    @classmethod
+    def _from_storage(cls, data, typecode=None, backend='python'):
+        """Wraps existing storage in a fixed-size array without copying it."""
+        raarray = cls.__new__(cls)
+        raarray._data = data
+        raarray._typecode = typecode
+        raarray._fill = None if backend == 'python' and typecode is None else 0
+        raarray._length = raarray._len_used = len(data)
+        raarray._dynamic = False
+        raarray._growth_factor = 2.0
+        raarray._shrink_threshold = None
+        raarray._reserved = 0
+        raarray._backend = backend
+        raarray._sort_state = None
+        return raarray
+
+    def to_memoryview(self):
+        """Returns a memoryview of typed storage without copying.
+
+        Other libraries can consume the result directly, e.g., `numpy.asarray`.
+        While it is alive, a dynamic array cannot reallocate and raises BufferError.
+
+        Raises:
+            TypeError: If the array uses list storage, which holds object references.
+        """
+        if self._typecode is None and self._backend == 'python':
+            raise TypeError("Only typed storage exports a buffer; construct the array with a typecode.")
+        return memoryview(self._data)[:self._length]
+
+    @property
+    def backend(self):
+        """The storage backend, 'python' or 'numpy'."""
+        return self._backend
+
+    @property
+    def dtype(self):
+        """The dtype of the 'numpy' backend, or None for the 'python' backend."""
+        return self._data.dtype if self._backend == 'numpy' else None
+
+    @property
+    def len_used(self):
+        """The length of the filled prefix, one past the highest index written.
+
+        Slots of a list-backed array without a `fill` start empty, and iteration,
+        `str`, sorts, reversal and searches stop at the filled prefix instead of
+        tripping over the empty tail. Typed, NumPy and filled arrays start full.
+        """
+        return self._len_used
+
+    @property
+    def capacity(self):
+        """The number of allocated slots, at least the logical length."""
+        return len(self._data)
+
+    def _require_dynamic(self, operation):
+        if not self._dynamic:
+            raise TypeError(
+                f"{operation} requires a dynamic RandomAccessArray; construct it with dynamic=True."
+            )
+
+    def _resize(self, capacity):
+        """Grows or truncates the storage to `capacity` slots, never below the length."""
+        capacity = max(capacity, self._length)
+        current = len(self._data)
+        if self._backend == 'numpy':
+            if capacity != current:
+                data = numpy.full(capacity, self._fill, dtype=self._data.dtype)
+                data[:self._length] = self._data[:self._length]
+                self._data = data
+        elif capacity > current:
+            if self._typecode is None:
+                self._data.extend([self._fill] * (capacity - current))
+            else:
+                self._data.extend(array(self._typecode, [self._fill]) * (capacity - current))
+        elif capacity < current:
+            del self._data[capacity:]
+
+    def reserve(self, n):
+        """Ensures capacity for at least `n` elements, and never shrinks below it.
+
+        Examples:
+            >>> darray = RandomAccessArray(0, dynamic=True)
+            >>> darray.reserve(100)
+            >>> len(darray), darray.capacity
+            (0, 100)
+        """
+        self._require_dynamic('reserve')
+        self._reserved = n
+        if n > len(self._data):
+            self._resize(n)
+
+    def _make_room(self):
+        """Multiplies the capacity by `growth_factor` when every slot is in use."""
+        if self._length == len(self._data):
+            self._resize(max(self._length + 1, ceil(len(self._data) * self._growth_factor)))
+
+    def append(self, value):
+        """Appends `value`, multiplying the capacity by `growth_factor` when full."""
+        self._require_dynamic('append')
+        self._make_room()
+        self._data[self._length] = value
+        self._length += 1
+        self._len_used = self._length
+        self._sort_state = None
+        for range_index in self._indexes:
+            range_index.append(value)
+
+    def extend(self, values):
+        """Appends every value of an iterable, growing the capacity at most once if sized."""
+        self._require_dynamic('extend')
+        if hasattr(values, '__len__'):
+            needed = self._length + len(values)
+            if needed > len(self._data):
+                self._resize(max(needed, ceil(len(self._data) * self._growth_factor)))
+        for value in values:
+            self.append(value)
+
+    def insert(self, index, value):
+        """Inserts `value` before `index`, clamping the index like `list.insert`."""
+        self._require_dynamic('insert')
+        if index < 0:
+            index = max(0, index + self._length)
+        index = min(index, self._length)
+        if index == self._length:
+            self.append(value)
+            return
+        self._make_room()
+        data = self._data
+        data[index + 1:self._length + 1] = data[index:self._length]
+        data[index] = value
+        self._length += 1
+        # the filled prefix shifts with the insertion or reaches the new element
+        self._len_used = self._len_used + 1 if index < self._len_used else index + 1
+        self._sort_state = None
+        self._refresh_indexes()  # every later element moved
+
+    def pop(self, index=-1):
+        """Removes and returns the element at `index`, the last one by default.
+
+        Releases spare capacity when the occupancy falls below `shrink_threshold`.
+
+        Raises:
+            IndexError: If the array is empty or the index is out of range.
+        """
+        self._require_dynamic('pop')
+        if not self._length:
+            raise IndexError("pop from empty RandomAccessArray")
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("pop index out of range")
+        data = self._data
+        value = data[index]
+        data[index:self._length - 1] = data[index + 1:self._length]
+        self._length -= 1
+        if index < self._len_used:  # the filled prefix shifts left
+            self._len_used -= 1
+        data[self._length] = self._fill  # release the reference
+        if (
+            self._shrink_threshold is not None
+            and self._length < len(data) * self._shrink_threshold
+        ):
+            capacity = max(self._reserved, ceil(self._length * self._growth_factor))
+            if capacity < len(data):  # a threshold above 1 / growth_factor must not grow the array
+                self._resize(capacity)
+        if index == self._length:
+            for range_index in self._indexes:
+                range_index.pop()
+        else:
+            self._refresh_indexes()  # every later element moved
+        return value
 
     def bubble_sort(self, ascending=True):
         """Sorts the elements of the data structure using bubble sort.
@@ -101,7 +455,10 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
             >>> raarray
             RandomAccessArray([8, 6, 5, 4, 2])
         """
-        return super().index_based_bubble_sort(ascending)
+        if self._backend == 'numpy':
+            return self.sort(ascending)
+        self.view(stop=self._len_used).bubble_sort(ascending)
+        self._sort_state = (None, ascending)
 
     def reverse_order(self):
         """
@@ -112,7 +469,15 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
             >>> raarray.reverse_order()
             >>> raarray
             RandomAccessArray([5, 4, 6, 2, 8])"""
-        return super().index_based_reverse_order()
+        sort_state = self._sort_state
+        if self._backend == 'numpy':
+            prefix = self._data[:self._len_used]
+            prefix[:] = numpy.flip(prefix)
+            self._refresh_indexes()
+        else:
+            self.view(stop=self._len_used).reverse_order()
+        if sort_state is not None:  # a reversed sorted array is sorted the other way
+            self._sort_state = (sort_state[0], not sort_state[1])
 
     def insertion_sort(self, ascending=True, key=None):
         """
@@ -154,4 +519,390 @@ class RandomAccessArray(BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin):
         Returns:
             None
         """
-        return super().index_based_insertion_sort(ascending, key)
+        if self._backend == 'numpy':
+            return self.sort(ascending, key)
+        self.view(stop=self._len_used).insertion_sort(ascending, key)
+        self._sort_state = (key, ascending)
+
+    def heap_sort(self, ascending=True, key=None):
+        """Sorts the elements in place using heap sort.
+
+        Heap sort is O(n log n) in the worst case, unlike `insertion_sort` and
+        `bubble_sort`, and needs no extra memory, unlike `sort`, but is not stable.
+        The 'numpy' backend uses `sort` instead.
+
+        Args:
+            ascending (bool): Sorts in ascending order if True, else descending. Defaults to True.
+            key (Callable, optional): A function computing the sort key of each element.
+
+        Examples:
+            >>> raarray = RandomAccessArray(5, typecode='q')
+            >>> for i, val in enumerate([8, 2, 6, 4, 5]):
+            ...     raarray[i] = val
+            >>> raarray.heap_sort(ascending=False)
+            >>> raarray
+            RandomAccessArray([8, 6, 5, 4, 2], typecode='q')
+        """
+        if self._backend == 'numpy':
+            return self.sort(ascending, key)
+        self.view(stop=self._len_used).heap_sort(ascending, key)
+        self._sort_state = (key, ascending)
+
+    def heapify(self, max_heap=False, key=None):
+        """Rearranges the elements in place into a binary heap in O(n).
+
+        Afterwards element `i` comes no later than elements `2i + 1` and `2i + 2`,
+        so the first element is the smallest, or the largest for a max-heap.
+
+        Args:
+            max_heap (bool): If True, builds a max-heap instead of a min-heap. Defaults to False.
+            key (Callable, optional): A function computing the key each element is ordered by.
+        """
+        self.view(stop=self._len_used).heapify(max_heap, key)
+
+    def _assign_prefix(self, values):
+        """Overwrites the first `len(values)` elements in place."""
+        if self._typecode is None:
+            self._data[:len(values)] = values
+        else:
+            self._data[:len(values)] = array(self._typecode, values)
+
+    def _numpy_order(self, ascending, key):
+        """Returns the stable sorting permutation of the 'numpy' backend."""
+        keys = self._data[:self._len_used]
+        if key is not None:
+            keys = numpy.array([key(value) for value in self])
+        if ascending:
+            return numpy.argsort(keys, kind='stable')
+        # a stable ascending sort of the reversed keys, reversed, is stable descending
+        return self._len_used - 1 - numpy.argsort(keys[::-1], kind='stable')[::-1]
+
+    def sort(self, ascending=True, key=None):
+        """Sorts the elements in place with the fastest stable sort of the backend.
+
+        The 'python' backend uses Timsort through `sorted`, the 'numpy' backend
+        `numpy.sort` or, given a key, `numpy.argsort`. Equal elements keep their order.
+
+        Args:
+            ascending (bool): Sorts in ascending order if True, else descending. Defaults to True.
+            key (Callable, optional): A function computing the sort key of each element.
+
+        Examples:
+            >>> raarray = RandomAccessArray(4)
+            >>> for i, val in enumerate(['peach', 'fig', 'date', 'lime']):
+            ...     raarray[i] = val
+            >>> raarray.sort(key=len)
+            >>> raarray
+            RandomAccessArray(['fig', 'date', 'lime', 'peach'])
+        """
+        if self._backend == 'numpy':
+            prefix = self._data[:self._len_used]
+            if key is None and ascending:
+                prefix.sort(kind='stable')
+            else:
+                prefix[:] = prefix[self._numpy_order(ascending, key)]
+        else:
+            self._assign_prefix(sorted(self, key=key, reverse=not ascending))
+        self._sort_state = (key, ascending)
+        self._refresh_indexes()
+
+    def attach_index(self, index):
+        """Builds a range index over the elements and keeps it current on every write.
+
+        Element writes, `append`, `extend` and `pop` at the end update the index
+        incrementally in O(log n) per element; operations that move elements, i.e.,
+        slice assignment, `sort`, NumPy reversal, and `insert` and `pop` before the
+        end, rebuild it once in O(n). The index covers every slot, so they must all
+        hold combinable values, e.g., an array created with `fill=0`.
+
+        Args:
+            index (FenwickTree | SegmentTree): The index to attach.
+
+        Returns:
+            The attached index, for its `range_query`.
+
+        Examples:
+            >>> from ofnodes.structures.rangeindex import FenwickTree
+            >>> raarray = RandomAccessArray(5, fill=0)
+            >>> sums = raarray.attach_index(FenwickTree())
+            >>> raarray[1], raarray[3] = 8, 2
+            >>> sums.range_query(0, 4)
+            10
+        """
+        index.build(islice(self._data, self._length))
+        self._indexes = (*self._indexes, index)
+        return index
+
+    def detach_index(self, index):
+        """Stops keeping `index` current.
+
+        Raises:
+            ValueError: If the index is not attached.
+        """
+        if index not in self._indexes:
+            raise ValueError("The index is not attached to this RandomAccessArray.")
+        self._indexes = tuple(attached for attached in self._indexes if attached is not index)
+
+    def _update_indexes(self, index, old, value):
+        for range_index in self._indexes:
+            range_index.update(index, old, value)
+
+    def _refresh_indexes(self):
+        for range_index in self._indexes:
+            range_index.build(islice(self._data, self._length))
+
+    @property
+    def is_sorted(self):
+        """Whether the array is known to be sorted, by a sort or `mark_sorted`.
+
+        Any write through indexing, a view or `append`/`insert` clears the flag.
+        """
+        return self._sort_state is not None
+
+    def mark_sorted(self, ascending=True, key=None):
+        """Records that the array is sorted after verifying it in one O(n) pass.
+
+        Use it for arrays filled in order, which the sorted search methods otherwise
+        reject.
+
+        Raises:
+            ValueError: If the elements are not sorted in the given order.
+
+        Examples:
+            >>> raarray = RandomAccessArray(0, dynamic=True)
+            >>> raarray.extend([2, 4, 6])
+            >>> raarray.mark_sorted()
+            >>> raarray.is_sorted
+            True
+        """
+        keys = [key(value) for value in self] if key else list(self)
+        pairs = zip(keys, islice(keys, 1, None))
+        if any(b < a for a, b in pairs) if ascending else any(a < b for a, b in pairs):
+            raise ValueError(f"The array is not sorted in {'ascending' if ascending else 'descending'} order.")
+        self._sort_state = (key, ascending)
+
+    def _search_key(self, key):
+        """Returns the current sort order, checking its key matches `key`."""
+        if self._sort_state is None:
+            raise ValueError("Sorted search requires a sorted array; call sort() or mark_sorted() first.")
+        sort_key, ascending = self._sort_state
+        if key is not None and key is not sort_key:
+            raise ValueError("The array is sorted by a different key than the one searched with.")
+        return sort_key, ascending
+
+    def _bisect(self, x, key, right):
+        """Binary searches the sorted array for the insertion point of the key `x`."""
+        key, ascending = self._search_key(key)
+        if ascending:
+            if key is None and self._backend == 'numpy':
+                side = 'right' if right else 'left'
+                return int(numpy.searchsorted(self._data[:self._len_used], x, side=side))
+            return (bisect_right if right else bisect_left)(self._data, x, 0, self._len_used, key=key)
+        lo, hi = 0, self._len_used
+        while lo < hi:  # the mirror image of bisect for descending order
+            mid = (lo + hi) // 2
+            k = key(self[mid]) if key else self[mid]
+            if x < k or (right and x == k):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def bisect_left(self, x, key=None):
+        """Returns the index at which the key `x` would be inserted before equal keys.
+
+        Runs in O(log n). As with the `bisect` module, `x` is compared with the keys of
+        the elements, so with a key function it is a key rather than an element.
+
+        Args:
+            x (Any): The key to locate.
+            key (Callable, optional): The key function, which must be the one the array
+                was sorted by. Defaults to the sort key.
+
+        Raises:
+            ValueError: If the array is not known to be sorted, or was sorted by another key.
+
+        Examples:
+            >>> raarray = RandomAccessArray(5)
+            >>> for i, val in enumerate([8, 2, 6, 4, 6]):
+            ...     raarray[i] = val
+            >>> raarray.sort()
+            >>> raarray.bisect_left(6), raarray.bisect_right(6)
+            (2, 4)
+        """
+        return self._bisect(x, key, right=False)
+
+    def bisect_right(self, x, key=None):
+        """Returns the index at which the key `x` would be inserted after equal keys.
+
+        See `bisect_left`.
+        """
+        return self._bisect(x, key, right=True)
+
+    def index_of(self, x, key=None):
+        """Returns the index of the first element whose key equals `x` in O(log n).
+
+        Raises:
+            ValueError: If no element matches, or the array is not known to be sorted.
+        """
+        i = self._bisect(x, key, right=False)
+        sort_key = self._sort_state[0]
+        if i < self._len_used and (sort_key(self[i]) if sort_key else self[i]) == x:
+            return i
+        raise ValueError(f"{x!r} is not in the RandomAccessArray")
+
+    def _key_bounds(self, lo, hi, key):
+        """Returns the index range of the elements whose keys fall in `[lo, hi)`."""
+        _, ascending = self._search_key(key)
+        if ascending:
+            start, stop = self._bisect(lo, key, right=False), self._bisect(hi, key, right=False)
+        else:
+            start, stop = self._bisect(hi, key, right=True), self._bisect(lo, key, right=True)
+        return start, max(start, stop)
+
+    def count_range(self, lo, hi, key=None):
+        """Counts the elements whose keys fall in the half-open range `[lo, hi)` in O(log n).
+
+        Examples:
+            >>> raarray = RandomAccessArray(5)
+            >>> for i, val in enumerate([8, 2, 6, 4, 6]):
+            ...     raarray[i] = val
+            >>> raarray.sort(ascending=False)
+            >>> raarray.count_range(4, 8), list(raarray.iter_range(4, 8))
+            (3, [6, 6, 4])
+        """
+        start, stop = self._key_bounds(lo, hi, key)
+        return stop - start
+
+    def iter_range(self, lo, hi, key=None):
+        """Yields the elements whose keys fall in `[lo, hi)`, in array order."""
+        start, stop = self._key_bounds(lo, hi, key)
+        return (self._data[i] for i in range(start, stop))
+
+    def argsort(self, ascending=True, key=None):
+        """Returns the indices that would sort the array, as a new RandomAccessArray.
+
+        Examples:
+            >>> raarray = RandomAccessArray(3)
+            >>> for i, val in enumerate([8, 2, 6]):
+            ...     raarray[i] = val
+            >>> raarray.argsort()
+            RandomAccessArray([1, 2, 0])
+        """
+        if self._backend == 'numpy':
+            return self._from_storage(self._numpy_order(ascending, key), backend='numpy')
+        sort_key = self.__getitem__ if key is None else lambda i: key(self[i])
+        return self._from_storage(sorted(range(self._len_used), key=sort_key, reverse=not ascending))
+
+    def map(self, func):
+        """Returns a new RandomAccessArray of `func` applied to the elements.
+
+        The 'numpy' backend calls `func` once on the whole ndarray, so it must be
+        vectorized, e.g., a ufunc or arithmetic on its argument. The 'python'
+        backend calls it on each element.
+
+        Examples:
+            >>> raarray = RandomAccessArray(3)
+            >>> for i, val in enumerate([8, 2, 6]):
+            ...     raarray[i] = val
+            >>> raarray.map(lambda x: x * 10)
+            RandomAccessArray([80, 20, 60])
+        """
+        if self._backend == 'numpy':
+            return self._from_storage(numpy.asarray(func(self._data[:self._len_used])), backend='numpy')
+        return self._from_storage([func(value) for value in self])
+
+    def where(self, predicate):
+        """Returns the indices of the elements satisfying `predicate`, in order.
+
+        Like `map`, the 'numpy' backend calls `predicate` once on the whole ndarray.
+
+        Examples:
+            >>> raarray = RandomAccessArray(4)
+            >>> for i, val in enumerate([8, 2, 6, 4]):
+            ...     raarray[i] = val
+            >>> raarray.where(lambda x: x > 5)
+            RandomAccessArray([0, 2])
+        """
+        if self._backend == 'numpy':
+            return self._from_storage(numpy.flatnonzero(predicate(self._data[:self._len_used])), backend='numpy')
+        return self._from_storage([i for i, value in enumerate(self) if predicate(value)])
+
+    def sum(self):
+        """Returns the sum of the elements, 0 for an empty array."""
+        if self._backend == 'numpy':
+            return self._data[:self._len_used].sum().item()
+        return sum(self)
+
+    def min(self):
+        """Returns the smallest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self._backend == 'numpy':
+            if not self._len_used:
+                raise ValueError("min() of an empty RandomAccessArray")
+            return self._data[:self._len_used].min().item()
+        return min(self)
+
+    def max(self):
+        """Returns the largest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self._backend == 'numpy':
+            if not self._len_used:
+                raise ValueError("max() of an empty RandomAccessArray")
+            return self._data[:self._len_used].max().item()
+        return max(self)
+
+    def save(self, path, typecode=None):
+        """Writes the array to `path` in the compact ofnodes binary format.
+
+        Args:
+            path (str | os.PathLike): The file to write.
+            typecode (str, optional): The `array` typecode of the payload. Defaults to
+                the array's own typecode, else 'q' for integer items and 'd' for float items.
+
+        Raises:
+            TypeError: If the items are not numeric, e.g., unfilled `None` slots.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), "data.ofn")
+            >>> raarray = RandomAccessArray(3)
+            >>> for i, val in enumerate([8, 2, 6]):
+            ...     raarray[i] = val
+            >>> raarray.save(path)
+        """
+        if typecode is None and self._backend == 'numpy':
+            typecode = self._data.dtype.char
+        # a view is re-iterable, for inferring the typecode, and copies nothing
+        save_array(path, self.view(), typecode or self._typecode)
+
+    @classmethod
+    def open_mmap(cls, path):
+        """Maps a file written by `save` for lazy, zero-copy, read-only access.
+
+        Returns:
+            MappedRandomAccessArray: The mapped array. Close it, or use it as a
+                context manager, to unmap the file.
+
+        Raises:
+            ValueError: If `path` is not an ofnodes file of this kind, or is shorter
+                than its header records.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), "data.ofn")
+            >>> raarray = RandomAccessArray(3)
+            >>> for i, val in enumerate([8, 2, 6]):
+            ...     raarray[i] = val
+            >>> raarray.save(path)
+            >>> with RandomAccessArray.open_mmap(path) as mapped:
+            ...     mapped[2], len(mapped)
+            (6, 3)
+        """
+        return MappedRandomAccessArray(path)
@@ -0,0 +1,216 @@
+"""Defines range indexes answering range queries over an array in O(log n).
+
+An index is built from a sequence of values and is kept current with
+`update(index, old, new)` calls, and with `append(value)` and `pop()` calls as
+values are added or removed at the end, each in O(log n). Attached to a
+RandomAccessArray with `RandomAccessArray.attach_index`, it receives those calls
+on every write, so a query never rescans the range.
+
+Example:
+    Typical usage example:
+
+        sums = raarray.attach_index(FenwickTree())
+        raarray[3] = 10
+        sums.range_query(0, 100)
+"""
+
+_EMPTY = object()
+
+
+class FenwickTree:
+    """A binary indexed tree of prefix sums.
+
+    Slot `i` of the tree holds the sum of the `i & -i` values ending at value
+    `i - 1`, so any prefix sum is the sum of at most log2(n) slots, and a change
+    to one value touches at most log2(n) slots.
+
+    Args:
+        values (Iterable, optional): The values to index. Defaults to none.
+
+    Attributes:
+        _tree (list): The partial sums, 1-based; slot 0 is unused.
+
+    Examples:
+        >>> sums = FenwickTree([8, 2, 6, 4, 5])
+        >>> sums.range_query(1, 4)
+        12
+        >>> sums.update(2, 6, 10)
+        >>> sums.range_query(1, 4), sums.prefix_sum(5)
+        (16, 29)
+    """
+    __slots__ = ('_tree',)
+
+    def __init__(self, values=()):
+        self.build(values)
+
+    def __len__(self):
+        return len(self._tree) - 1
+
+    def build(self, values):
+        """Rebuilds the tree from `values` in O(n)."""
+        tree = [0]
+        tree.extend(values)
+        n = len(tree) - 1
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def update(self, index, old, new):
+        """Records that the value at `index` changed from `old` to `new`."""
+        delta = new - old
+        tree, n = self._tree, len(self._tree) - 1
+        i = index + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def append(self, value):
+        """Indexes `value` after the last value in O(log n)."""
+        tree = self._tree
+        i = len(tree)
+        total, j, stop = value, i - 1, i - (i & -i)
+        while j > stop:  # slot i also covers the slots of its children
+            total += tree[j]
+            j &= j - 1
+        tree.append(total)
+
+    def pop(self):
+        """Stops indexing the last value in O(1); no other slot covers it."""
+        if len(self._tree) == 1:
+            raise IndexError("pop from empty FenwickTree")
+        del self._tree[-1]
+
+    def prefix_sum(self, stop):
+        """Returns the sum of the values before `stop`."""
+        if not 0 <= stop <= len(self._tree) - 1:
+            raise IndexError("FenwickTree prefix out of range")
+        tree, total = self._tree, 0
+        while stop:
+            total += tree[stop]
+            stop &= stop - 1
+        return total
+
+    def range_query(self, lo, hi):
+        """Returns the sum of the values in the half-open range `[lo, hi)`.
+
+        Raises:
+            IndexError: If the range is not within the indexed values.
+        """
+        if lo > hi:
+            raise IndexError(f"Invalid range [{lo}, {hi})")
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+
+class SegmentTree:
+    """A bottom-up segment tree folding ranges with any associative operation.
+
+    Leaves `c..c+n-1` hold the values, for a capacity `c` of at least `n`, and node
+    `i` holds `op(node 2i, node 2i+1)`, so a range is covered by at most 2·log2(c)
+    nodes. Operands are combined in index order, so `op` need not be commutative.
+    Unused leaves are empty and skipped when combining, so `append` only rebuilds
+    the tree, doubling the capacity, when every leaf is in use.
+
+    Args:
+        values (Iterable, optional): The values to index. Defaults to none.
+        op (Callable): The associative binary operation, e.g., `min`, `max`,
+            `operator.add` or `math.gcd`. Defaults to `min`.
+
+    Attributes:
+        _tree (list): The nodes, 1-based; the leaves start at `_capacity`.
+        _n (int): The number of values.
+        _capacity (int): The number of leaves.
+        _op (Callable): The associative binary operation.
+
+    Examples:
+        >>> mins = SegmentTree([8, 2, 6, 4, 5])
+        >>> mins.range_query(2, 5)
+        4
+        >>> mins.update(3, 4, 9)
+        >>> mins.range_query(2, 5)
+        5
+    """
+    __slots__ = ('_tree', '_n', '_capacity', '_op')
+
+    def __init__(self, values=(), op=min):
+        self._op = op
+        self.build(values)
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def op(self):
+        """The associative binary operation."""
+        return self._op
+
+    def build(self, values):
+        """Rebuilds the tree from `values` in O(n)."""
+        values = list(values)
+        self._fill(values, len(values))
+
+    def _fill(self, values, capacity):
+        n = len(values)
+        tree = [_EMPTY] * capacity + values + [_EMPTY] * (capacity - n)
+        combine = self._combine
+        for i in range(capacity - 1, 0, -1):
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+        self._tree, self._n, self._capacity = tree, n, capacity
+
+    def _combine(self, left, right):
+        if right is _EMPTY:
+            return left
+        return right if left is _EMPTY else self._op(left, right)
+
+    def update(self, index, old, new):
+        """Records that the value at `index` changed to `new`."""
+        tree, combine = self._tree, self._combine
+        i = index + self._capacity
+        tree[i] = new
+        i >>= 1
+        while i:
+            tree[i] = combine(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def append(self, value):
+        """Indexes `value` after the last value, in amortized O(log n)."""
+        if self._n == self._capacity:
+            leaves = self._tree[self._capacity:]
+            leaves.append(value)
+            self._fill(leaves, max(1, 2 * self._capacity))
+        else:
+            self._n += 1
+            self.update(self._n - 1, _EMPTY, value)
+
+    def pop(self):
+        """Stops indexing the last value in O(log n)."""
+        if not self._n:
+            raise IndexError("pop from empty SegmentTree")
+        self._n -= 1
+        self.update(self._n, None, _EMPTY)
+
+    def range_query(self, lo, hi):
+        """Returns the values in the half-open range `[lo, hi)` folded with `op`.
+
+        Raises:
+            IndexError: If the range is empty or not within the indexed values.
+        """
+        if not 0 <= lo < hi <= self._n:
+            raise IndexError(f"Invalid or empty range [{lo}, {hi})")
+        tree, op = self._tree, self._op
+        left = right = _EMPTY
+        lo += self._capacity
+        hi += self._capacity
+        while lo < hi:
+            if lo & 1:
+                left = tree[lo] if left is _EMPTY else op(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = tree[hi] if right is _EMPTY else op(tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        if right is _EMPTY:
+            return left
+        return right if left is _EMPTY else op(left, right)
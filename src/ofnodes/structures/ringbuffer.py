@@ -0,0 +1,113 @@
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+
+class RingBuffer:
+    """A fixed-capacity FIFO buffer over a preallocated `RandomAccessArray`.
+
+    The logical order starts at a head index that wraps around the array, so
+    `append` and `popleft` are O(1) and never allocate. When the buffer is full,
+    `append` overwrites the oldest item by default, which keeps a bounded window
+    of the last `capacity` items.
+
+    Args:
+        capacity (int): The number of slots to preallocate.
+        overwrite (bool): If True, appending to a full buffer drops the oldest
+            item; if False, it raises IndexError. Defaults to True.
+
+    Attributes:
+        _buffer (RandomAccessArray): The preallocated slots.
+        _start (int): The index of the oldest item.
+        _size (int): The number of items held.
+
+    Examples:
+        >>> window = RingBuffer(3)
+        >>> window.extend([1, 2, 3, 4])
+        >>> window
+        RingBuffer([2, 3, 4], capacity=3)
+        >>> window.snapshot()
+        ([2, 3], [4])
+        >>> window.popleft()
+        2
+    """
+
+    __slots__ = ('_buffer', '_start', '_size', '_overwrite')
+
+    def __init__(self, capacity, overwrite=True) -> None:
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be at least 1.")
+        self._buffer = RandomAccessArray(capacity)
+        self._start = 0
+        self._size = 0
+        self._overwrite = overwrite
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for part in self.snapshot():
+            yield from part
+
+    def __getitem__(self, index: int):
+        """Returns the item at a logical index, 0 being the oldest."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._buffer[(self._start + index) % len(self._buffer)]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)}, capacity={self.capacity})"
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def is_full(self) -> bool:
+        return self._size == len(self._buffer)
+
+    def append(self, value) -> None:
+        """Appends `value` as the newest item.
+
+        Raises:
+            IndexError: If the buffer is full and was created with `overwrite=False`.
+        """
+        capacity = len(self._buffer)
+        if self._size < capacity:
+            self._buffer[(self._start + self._size) % capacity] = value
+            self._size += 1
+        elif self._overwrite:
+            self._buffer[self._start] = value
+            self._start = (self._start + 1) % capacity
+        else:
+            raise IndexError("RingBuffer is full")
+
+    def extend(self, values) -> None:
+        for value in values:
+            self.append(value)
+
+    def popleft(self):
+        """Removes and returns the oldest item.
+
+        Raises:
+            IndexError: If the buffer is empty.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty RingBuffer")
+        value = self._buffer[self._start]
+        self._buffer[self._start] = None  # release the reference
+        self._start = (self._start + 1) % len(self._buffer)
+        self._size -= 1
+        return value
+
+    def snapshot(self) -> tuple:
+        """Exports the items, oldest first, as one or two contiguous slices of the array.
+
+        Returns:
+            tuple[list] | tuple[list, list]: One slice when the items don't wrap
+                around the end of the array, otherwise the slice up to the end of the
+                array followed by the slice from its start.
+        """
+        stop = self._start + self._size
+        capacity = len(self._buffer)
+        if stop <= capacity:
+            return (self._buffer[self._start:stop],)
+        return (self._buffer[self._start:capacity], self._buffer[0:stop - capacity])
@@ -0,0 +1,210 @@
+"""Defines a RandomAccessArray stored in a named shared memory segment.
+
+The segment holds an array in the ofnodes binary format of
+`ofnodes.structures.mapped`: the 24-byte header followed by the typed payload.
+Other processes attach to it by name, reading the typecode and length from the
+header, and read and write the payload in place without copying or pickling it.
+
+Example:
+    Typical usage example:
+
+        with SharedRandomAccessArray(1_000_000, typecode='d') as shared:
+            shared.parallel_map(math.sqrt, workers=4)
+            total = shared.parallel_reduce(operator.add, 0.0, workers=4)
+"""
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from multiprocessing import resource_tracker, shared_memory
+from os import cpu_count
+
+from ofnodes.structures.mapped import ARRAY_KIND, BYTEORDER, HEADER, MAGIC, TYPECODES, VERSION
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+
+
+def _release(shm, views, owner):
+    """Releases the views and closes the segment, unlinking it if `owner`."""
+    for view in reversed(views):
+        view.release()
+    shm.close()
+    if owner:
+        shm.unlink()
+
+
+def _map_chunk(name, start, stop, fn):
+    with SharedRandomAccessArray.attach(name) as shared:
+        shared._data[start:stop] = array(shared.typecode, map(fn, shared._data[start:stop]))
+
+
+def _reduce_chunk(name, start, stop, fn):
+    with SharedRandomAccessArray.attach(name) as shared:
+        return reduce(fn, shared._data[start:stop])
+
+
+class SharedRandomAccessArray(RandomAccessArray):
+    """A fixed-size, typed RandomAccessArray in a `multiprocessing.shared_memory` segment.
+
+    The creating instance owns the segment and unlinks it on `close`; instances
+    returned by `attach` only detach. Either way a finalizer closes the segment if
+    the array is garbage collected first, so segments do not leak. Pickling an
+    instance, e.g., to send it to a worker, sends only its name and the receiver
+    attaches to the same memory.
+
+    Args:
+        size (int): The number of elements.
+        typecode (str): The `array` typecode of the elements. Defaults to 'd'.
+        fill (int | float): The initial value of every element. Defaults to 0.
+        name (str, optional): The name of the segment. Defaults to a unique name.
+
+    Attributes:
+        _shm (SharedMemory): The shared memory segment.
+        _views (list[memoryview]): The views onto the segment, released on close.
+        _owner (bool): Whether this instance created, and so unlinks, the segment.
+        _finalizer (weakref.finalize): Closes the segment exactly once.
+
+    Examples:
+        >>> import operator
+        >>> with SharedRandomAccessArray(4, typecode='q') as shared:
+        ...     for i in range(4):
+        ...         shared[i] = i + 1
+        ...     shared.parallel_reduce(operator.mul, 1, workers=2)
+        24
+    """
+    def __init__(self, size, typecode='d', fill=0, name=None):
+        if typecode not in TYPECODES:
+            raise ValueError(f"Unsupported typecode: {typecode!r}")
+        nbytes = HEADER.size + size * array(typecode).itemsize
+        shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+        HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, ARRAY_KIND, typecode.encode(), BYTEORDER, size, 0)
+        self._bind(shm, typecode, size, owner=True)
+        if fill:
+            self._data[:] = array(typecode, [fill]) * size
+        self._fill = fill
+
+    @classmethod
+    def attach(cls, name, track=True):
+        """Attaches to the segment of an existing SharedRandomAccessArray by name.
+
+        Args:
+            name (str): The `name` of the array to attach to.
+            track (bool): Whether to leave the segment registered with this process's
+                resource tracker. Processes started by the owner, e.g., pool workers,
+                share its tracker and need no change. An unrelated process has its own
+                tracker, which would unlink the segment when the process exits, and
+                should pass False. Defaults to True.
+
+        Raises:
+            FileNotFoundError: If no segment has that name.
+            ValueError: If the segment does not hold a SharedRandomAccessArray.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        if not track:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        magic, version, kind, typecode, _, count, _ = HEADER.unpack_from(shm.buf)
+        if magic != MAGIC or version != VERSION or kind != ARRAY_KIND:
+            shm.close()
+            raise ValueError(f"{name!r} is not a SharedRandomAccessArray segment.")
+        shared = cls.__new__(cls)
+        shared._bind(shm, typecode.decode(), count, owner=False)
+        return shared
+
+    def _bind(self, shm, typecode, size, owner):
+        buffer = shm.buf[HEADER.size:HEADER.size + size * array(typecode).itemsize]
+        self._data = buffer.cast(typecode)
+        self._typecode = typecode
+        self._fill = 0
+        self._length = self._len_used = size
+        self._dynamic = False
+        self._growth_factor = 2.0
+        self._shrink_threshold = None
+        self._reserved = 0
+        self._backend = 'python'
+        self._sort_state = None
+        self._shm = shm
+        self._views = [buffer, self._data]
+        self._owner = owner
+        self._finalizer = weakref.finalize(self, _release, shm, self._views, owner)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __reduce__(self):
+        return (SharedRandomAccessArray.attach, (self.name,))
+
+    def __dir__(self) -> list[str]:
+        excluded = {'_shm', '_views', '_owner', '_finalizer', '_bind', '_chunks'}
+        return [attr for attr in super().__dir__() if attr not in excluded]
+
+    def __repr__(self):
+        if not self._finalizer.alive:
+            return f"SharedRandomAccessArray(name={self.name!r}, closed)"
+        return f"SharedRandomAccessArray({self._data.tolist()}, typecode={self._typecode!r}, name={self.name!r})"
+
+    @property
+    def name(self):
+        """The name other processes attach to."""
+        return self._shm.name
+
+    @property
+    def closed(self):
+        """Whether `close` has released the segment."""
+        return not self._finalizer.alive
+
+    def close(self):
+        """Releases the segment, unlinking it if this instance created it.
+
+        Calling it again has no effect.
+        """
+        self._finalizer()
+
+    def _chunks(self, workers):
+        """Partitions the index range into at most `workers` contiguous chunks."""
+        n = self._length
+        workers = max(1, min(workers or cpu_count() or 1, n))
+        bounds = [n * k // workers for k in range(workers + 1)]
+        return list(zip(bounds, bounds[1:]))
+
+    def parallel_map(self, fn, workers=None):
+        """Replaces every element `x` with `fn(x)` in place across a process pool.
+
+        Each worker attaches to the segment and maps a contiguous index range, so
+        only the name and the bounds are sent. `fn` must be picklable, e.g., a
+        module-level function, and return values of the array's typecode.
+
+        Args:
+            fn (Callable): The function applied to each element.
+            workers (int, optional): The number of processes. Defaults to `os.cpu_count()`.
+        """
+        if not self._length:
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_map_chunk, self.name, start, stop, fn) for start, stop in self._chunks(workers)]
+            for future in futures:
+                future.result()
+        self._sort_state = None
+        self._refresh_indexes()
+
+    def parallel_reduce(self, fn, init, workers=None):
+        """Folds the elements with `fn` across a process pool, starting from `init`.
+
+        Each worker reduces a contiguous index range to a partial result, and the
+        partials are folded in index order onto `init`. `fn` must therefore be
+        associative, and picklable.
+
+        Args:
+            fn (Callable): The binary function, e.g., `operator.add`.
+            init (Any): The initial value, returned for an empty array.
+            workers (int, optional): The number of processes. Defaults to `os.cpu_count()`.
+
+        Returns:
+            Any: `fn(...fn(fn(init, partial_0), partial_1)..., partial_k)`.
+        """
+        if not self._length:
+            return init
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_reduce_chunk, self.name, start, stop, fn) for start, stop in self._chunks(workers)]
+            return reduce(fn, (future.result() for future in futures), init)
@@ -2,10 +2,12 @@ from typing import Optional, Any
 
 from ofnodes.nodes.singlynode import SinglyNode
 from ofnodes.components.structures.descriptors import Head, Tail, Target
-from ofnodes.components.structures.mixins import CycleDetectionMixin, SearchMixin, RemoveMixin, InsertHeadMixin, InsertTailMixin, InsertAfterTargetMixin, InsertBeforeTargetMixin, PrintMixin
-from ofnodes.sorting.mixins import BubbleSortMixin, InsertionSortMixin, ReverseOrderMixin
+from ofnodes.components.structures.mixins import CycleDetectionMixin, SearchMixin, RemoveMixin, InsertHeadMixin, InsertTailMixin, InsertAfterTargetMixin, InsertBeforeTargetMixin, PrintMixin, IndexAccessMixin, SerializationMixin
+from ofnodes.sorting.mixins import BubbleSortMixin, InsertionSortMixin, QuickSortMixin, ReverseOrderMixin
+from ofnodes.structures.mapped import MappedSinglyLinkedList, save_linked_list
+from ofnodes.structures.binaryheap import PriorityQueue
 
-class SinglyLinkedList(CycleDetectionMixin, InsertionSortMixin, SearchMixin, RemoveMixin, InsertHeadMixin, InsertTailMixin, InsertAfterTargetMixin, InsertBeforeTargetMixin, PrintMixin, BubbleSortMixin, ReverseOrderMixin):
+class SinglyLinkedList(IndexAccessMixin, SerializationMixin, CycleDetectionMixin, InsertionSortMixin, SearchMixin, RemoveMixin, InsertHeadMixin, InsertTailMixin, InsertAfterTargetMixin, InsertBeforeTargetMixin, PrintMixin, BubbleSortMixin, QuickSortMixin, ReverseOrderMixin):
     """A class representing a singly linked list.
 
     This class provides functionality to create and manipulate a singly linked list
@@ -16,21 +18,35 @@ class SinglyLinkedList(CycleDetectionMixin, InsertionSortMixin, SearchMixin, Rem
         _head (Optional[SinglyNode]): The head of the linked list.
         _tail (Optional[SinglyNode]): The tail of the linked list.
         _target (Optional[Any]): The target data or node instance.
+        _finger (Optional[tuple[int, SinglyNode]]): The last position visited by index.
+        _skips (Optional[tuple[int, list[SinglyNode]]]): The lazily built skip index.
+        _skip_index (bool): Whether index access builds and uses the skip index.
+
+    Args:
+        values (Iterable, optional): The data of the nodes to append, in order.
+        skip_index (bool): If True, index access keeps a square-root decomposition
+            skip index for O(sqrt(n)) random access. Defaults to False.
 
     Examples:
         >>> linked_list = SinglyLinkedList()
         >>> linked_list
         SinglyLinkedList(head=None, tail=None, target=None)
+        >>> sllist = SinglyLinkedList(range(100), skip_index=True)
+        >>> sllist[57]
+        57
     """
 
-    __slots__ = ('_head', '_tail', '_target',)
+    __slots__ = ('_head', '_tail', '_target', '_finger', '_skips', '_skip_index',)
     head = Head()
     tail = Tail()
     target = Target()
-    def __init__(self, values=None) -> None:
+    def __init__(self, values=None, skip_index=False) -> None:
         self._head: Optional[SinglyNode] = None
         self._tail: Optional[SinglyNode] = None
         self._target: Optional[Any|SinglyNode] = None
+        self._finger: Optional[tuple[int, SinglyNode]] = None
+        self._skips: Optional[tuple[int, list[SinglyNode]]] = None
+        self._skip_index: bool = skip_index
         if values:
             for value in values:
                 self.tail = value
@@ -42,28 +58,24 @@ class SinglyLinkedList(CycleDetectionMixin, InsertionSortMixin, SearchMixin, Rem
         #return f"{type(self).__name__}(head={type(self.head).__name__}, tail={self.tail})"
         if not self._head:
             return "SinglyLinkedList()"
-        node = self._head
-        nodes = []
-        while node:
-            nodes.append(repr(node.data))
-            node = node.next
-        return f"{type(self).__name__}([" + ', '.join(nodes) + "])"
+        body, count = self._format_edges(repr, ', ')
+        if count is None:
+            return f"{type(self).__name__}([{body}])"
+        return f"{type(self).__name__}([{body}], len={count})"
 
     def __str__(self) -> str:
         if not self._head:
             return "Empty Singly Linked List"
-        node = self._head
-        nodes = []
-        while node:
-            nodes.append(str(node.data))
-            node = node.next
-        return ' -> '.join(nodes)
+        body, count = self._format_edges(str, ' -> ')
+        if count is None:
+            return body
+        return f"{body} ({count} nodes)"
 
     def __dir__(self) -> list[str]:
         # Get the list of attributes and methods from the parent classes
         parent_dir = set(super().__dir__())
         # Filter out private attributes and methods
-        excluded = {'_head', '_tail', '_target', 'reference_based_reverse_order', 'reference_based_bubble_sort','index_based_bubble_sort', 'index_based_reverse_order', 'index_based_insertion_sort', 'reference_based_insertion_sort'}
+        excluded = {'_head', '_tail', '_target', '_finger', '_skips', '_skip_index', '_locate', '_invalidate_index', '_format_edges', 'reference_based_reverse_order', 'reference_based_bubble_sort','index_based_bubble_sort', 'index_based_reverse_order', 'index_based_insertion_sort', 'reference_based_insertion_sort', 'reference_based_partition', 'reference_based_quicksort'}
         parent_dir = {attr for attr in parent_dir if attr not in excluded}
         # Return a sorted list of all attributes and methods
         return sorted(parent_dir)
@@ -126,6 +138,98 @@ class SinglyLinkedList(CycleDetectionMixin, InsertionSortMixin, SearchMixin, Rem
         """
         return super().reference_based_bubble_sort(ascending)
 
+    def partition(self, pivot=None, predicate=None, key=None):
+        """Stably partitions the nodes around a pivot or by a predicate in one pass.
+
+        Given a pivot, the nodes are relinked into those whose key is less than the
+        pivot, equal to it and greater than it, in that order. Given a predicate, the
+        nodes for which it is true come first. No nodes are allocated.
+
+        Args:
+            pivot (Any, optional): The key the node keys are compared with.
+            predicate (Callable, optional): Selects the nodes that come first.
+            key (Callable, optional): A function computing the key of each node's data.
+
+        Returns:
+            tuple[int, ...]: The lengths of the parts, in order.
+
+        Examples:
+            >>> sllist = SinglyLinkedList(['ok', 'error', 'ok', 'retry'])
+            >>> sllist.partition(predicate=lambda status: status == 'ok')
+            (2, 2)
+            >>> sllist
+            SinglyLinkedList(['ok', 'ok', 'error', 'retry'])
+        """
+        return super().reference_based_partition(pivot, predicate, key)
+
+    def quicksort(self, ascending=True, key=None):
+        """Sorts the nodes in place using a stable, iterative 3-way quicksort.
+
+        Runs in O(n log n) expected time, and in O(n) when there are only a few
+        distinct keys. No nodes are allocated.
+
+        Examples:
+            >>> sllist = SinglyLinkedList([404, 200, 500, 200, 404])
+            >>> sllist.quicksort()
+            >>> sllist
+            SinglyLinkedList([200, 200, 404, 404, 500])
+        """
+        return super().reference_based_quicksort(ascending, key)
+
+    def merge_sorted(self, other, key=None):
+        """Merges the nodes of another sorted list into this sorted list in O(n + m).
+
+        Both lists must be sorted in ascending order of `key`. The nodes of `other`
+        are interleaved with the nodes of this list by relinking, so no nodes are
+        allocated and `other` is left empty. The merge is stable: of two equal
+        nodes, the one from this list comes first.
+
+        Args:
+            other (SinglyLinkedList): The sorted list whose nodes are moved into this one.
+            key (Callable, optional): A function computing the sort key of each node's data.
+
+        Raises:
+            ValueError: If `other` is this list.
+
+        Examples:
+            >>> sllist, other = SinglyLinkedList([1, 4, 6]), SinglyLinkedList([2, 4, 8])
+            >>> sllist.merge_sorted(other)
+            >>> sllist, other
+            (SinglyLinkedList([1, 2, 4, 4, 6, 8]), SinglyLinkedList())
+        """
+        if other is self:
+            raise ValueError("Cannot merge a SinglyLinkedList with itself.")
+        a, b = self._head, other._head
+        if b is None:
+            return
+        if a is None:
+            self._head, self._tail = other._head, other._tail
+        else:
+            key_a = key(a._data) if key else a._data
+            key_b = key(b._data) if key else b._data
+            head = tail = None
+            while a and b:
+                if key_b < key_a:  # ties take the node of this list first
+                    node, b = b, b._next
+                    if b:
+                        key_b = key(b._data) if key else b._data
+                else:
+                    node, a = a, a._next
+                    if a:
+                        key_a = key(a._data) if key else a._data
+                if head is None:
+                    head = node
+                else:
+                    tail._next = node
+                tail = node
+            tail._next = a or b
+            self._head = head
+            if a is None:  # this list ran out first, so the other's tail is last
+                self._tail = other._tail
+        other._head = other._tail = None
+        other._invalidate_index()
+        self._invalidate_index()
+
     def reverse_order(self):
         """Reverses the order of elements in the singly linked data structure.
 
@@ -160,3 +264,112 @@ class SinglyLinkedList(CycleDetectionMixin, InsertionSortMixin, SearchMixin, Rem
             True
         """
         return super().reference_based_cycle_detection()
+
+    def save(self, path, typecode=None):
+        """Writes the node data to `path` in the compact ofnodes binary format.
+
+        Args:
+            path (str | os.PathLike): The file to write.
+            typecode (str, optional): The `array` typecode of the payload. Defaults to
+                'q' for integer data and 'd' for float data.
+
+        Raises:
+            TypeError: If the node data is not numeric.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), "data.ofn")
+            >>> SinglyLinkedList([8, 2, 6]).save(path)
+        """
+        save_linked_list(path, self, typecode)
+
+    @classmethod
+    def open_mmap(cls, path):
+        """Maps a file written by `save` for lazy, zero-copy, read-only traversal.
+
+        Returns:
+            MappedSinglyLinkedList: The mapped list. Close it, or use it as a
+                context manager, to unmap the file.
+
+        Raises:
+            ValueError: If `path` is not an ofnodes file of this kind, or is shorter
+                than its header records.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), "data.ofn")
+            >>> SinglyLinkedList([8, 2, 6]).save(path)
+            >>> with SinglyLinkedList.open_mmap(path) as mapped:
+            ...     list(mapped)
+            [8, 2, 6]
+        """
+        return MappedSinglyLinkedList(path)
+
+
+def _merged_nodes(lists, key):
+    """Yields the nodes of sorted linked lists in merged order.
+
+    A PriorityQueue holds the next node of every list, prioritized by its key and
+    then by the position of its list, which keeps the merge stable. The successor of
+    a node is queued before the node is yielded, so the caller may relink it.
+    """
+    queue = PriorityQueue(
+        ((i, sllist._head), (key(sllist._head._data) if key else sllist._head._data, i))
+        for i, sllist in enumerate(lists)
+        if sllist._head is not None
+    )
+    while queue:
+        i, node = queue.peek()
+        following = node._next
+        if following is None:
+            queue.pop()
+        else:
+            queue.replace((i, following), (key(following._data) if key else following._data, i))
+        yield node
+
+
+def kway_merge(*lists, key=None, as_list=False):
+    """Merges any number of sorted linked lists in O(n log k) for n nodes in k lists.
+
+    By default the merged data is streamed lazily and the lists are left untouched.
+    With `as_list`, the nodes are instead relinked into a new SinglyLinkedList,
+    which leaves the input lists empty; no nodes are allocated either way. The
+    merge is stable: equal nodes come out in the order of their lists' arguments.
+
+    Args:
+        *lists (SinglyLinkedList): Lists sorted in ascending order of `key`.
+        key (Callable, optional): A function computing the sort key of each node's data.
+        as_list (bool): If True, returns a new SinglyLinkedList of the relinked nodes.
+            Defaults to False.
+
+    Returns:
+        Iterator | SinglyLinkedList: The merged data, or the list of merged nodes.
+
+    Raises:
+        ValueError: If `as_list` is True and a list is passed more than once.
+
+    Examples:
+        >>> shards = [SinglyLinkedList([1, 5]), SinglyLinkedList([2, 3]), SinglyLinkedList([4])]
+        >>> list(kway_merge(*shards))
+        [1, 2, 3, 4, 5]
+        >>> kway_merge(*shards, as_list=True), shards[0]
+        (SinglyLinkedList([1, 2, 3, 4, 5]), SinglyLinkedList())
+    """
+    if not as_list:
+        return (node._data for node in _merged_nodes(lists, key))
+    if len({id(sllist) for sllist in lists}) != len(lists):
+        raise ValueError("Cannot relink the nodes of a SinglyLinkedList passed more than once.")
+    merged = SinglyLinkedList()
+    tail = None
+    for node in _merged_nodes(lists, key):
+        if tail is None:
+            merged._head = node
+        else:
+            tail._next = node
+        tail = node
+    merged._tail = tail
+    for sllist in lists:
+        sllist._head = sllist._tail = None
+        sllist._invalidate_index()
+    return merged
+
@@ -0,0 +1,268 @@
+import random
+
+from ofnodes.nodes.skipnode import SkipNode
+
+MAX_LEVEL = 32
+
+
+class SkipList:
+    """A sorted collection of SkipNodes with expected O(log n) updates and lookups.
+
+    Every node is linked into level 0, and each node linked into a level is also
+    linked into the next one up with probability 1/2. A search starts at the top
+    level of the head sentinel, runs along a level while the next node sorts
+    before the target and drops a level otherwise, so it visits O(log n) nodes in
+    expectation. Each link also records its width, i.e., how many level 0 nodes it
+    spans, so summing the widths along the search path gives a node's rank and
+    positional indexing is O(log n) as well.
+
+    Node levels are drawn from a `random.Random` seeded with `seed`, so the same
+    seed and insertions always build the same skip list.
+
+    Args:
+        values (Iterable, optional): The initial values, inserted one by one. Use
+            `from_sorted` to bulk-load sorted values in O(n).
+        key (Callable, optional): Computes each value's sort key. Defaults to the value.
+        seed (Any, optional): Seeds the random levels. Defaults to an unpredictable seed.
+
+    Attributes:
+        _head (SkipNode): The sentinel before the first node, linked into every level.
+        _levels (int): The number of levels in use.
+        _length (int): The number of nodes.
+        _key (Optional[Callable]): Computes each value's sort key.
+        _random (random.Random): Draws the node levels.
+
+    Note:
+        Values with equal keys keep their insertion order.
+
+    Examples:
+        >>> skiplist = SkipList([8, 2, 6, 4], seed=42)
+        >>> skiplist.insert(5)
+        >>> skiplist
+        SkipList([2, 4, 5, 6, 8])
+        >>> 6 in skiplist, skiplist.rank(6), skiplist[-1]
+        (True, 3, 8)
+        >>> skiplist.remove(4)
+        >>> list(skiplist.iter_range(3, 8))
+        [5, 6]
+    """
+    __slots__ = ('_head', '_levels', '_length', '_key', '_random')
+
+    def __init__(self, values=(), key=None, seed=None):
+        self._head = SkipNode(None, MAX_LEVEL)
+        self._levels = 1
+        self._length = 0
+        self._key = key
+        self._random = random.Random(seed)
+        for value in values:
+            self.insert(value)
+
+    @classmethod
+    def from_sorted(cls, values, key=None, seed=None):
+        """Builds a SkipList from values already sorted by `key` in O(n).
+
+        The nodes are appended to every level they are drawn into, without
+        searching, and the widths are computed from the ranks along the way.
+
+        Raises:
+            ValueError: If the values are not sorted.
+
+        Examples:
+            >>> SkipList.from_sorted(['fig', 'date', 'peach'], key=len, seed=1)
+            SkipList(['fig', 'date', 'peach'])
+        """
+        skiplist = cls(key=key, seed=seed)
+        head = skiplist._head
+        last, last_rank = [head] * MAX_LEVEL, [0] * MAX_LEVEL
+        levels, rank, previous = 1, 0, None
+        for value in values:
+            value_key = key(value) if key else value
+            if rank and value_key < previous:
+                raise ValueError("from_sorted requires values sorted in ascending order.")
+            previous = value_key
+            rank += 1
+            node = SkipNode(value, skiplist._random_level())
+            for i in range(node.level):
+                last[i]._forward[i] = node
+                last[i]._widths[i] = rank - last_rank[i]
+                last[i], last_rank[i] = node, rank
+            levels = max(levels, node.level)
+        for i in range(levels):  # the last node of each level links past the end
+            last[i]._widths[i] = rank + 1 - last_rank[i]
+        skiplist._levels, skiplist._length = levels, rank
+        return skiplist
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        node = self._head._forward[0]
+        while node is not None:
+            yield node._data
+            node = node._forward[0]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+    def __str__(self):
+        return f"[{', '.join(str(value) for value in self)}]"
+
+    def __contains__(self, value):
+        node = self._first_at_least(self._key(value) if self._key else value)[0]._forward[0]
+        return self._find_equal(node, value) is not None
+
+    def __getitem__(self, index):
+        """Returns the value at position `index` in O(log n).
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SkipList index out of range")
+        node, rank = self._head, 0
+        for i in range(self._levels - 1, -1, -1):
+            while rank + node._widths[i] <= index + 1:
+                rank += node._widths[i]
+                node = node._forward[i]
+        return node._data
+
+    @property
+    def head(self):
+        """The first node, or None if the skip list is empty."""
+        return self._head._forward[0]
+
+    @property
+    def levels(self):
+        """The number of levels in use."""
+        return self._levels
+
+    def _random_level(self):
+        """Draws a level from the geometric distribution with p = 1/2."""
+        bits = self._random.getrandbits(MAX_LEVEL - 1)
+        return min(((bits & -bits) or 1 << (MAX_LEVEL - 1)).bit_length(), MAX_LEVEL)
+
+    def _key_of(self, node):
+        return self._key(node._data) if self._key else node._data
+
+    def _search(self, k, right):
+        """Finds the last node at each level whose key is before `k`.
+
+        With `right`, nodes whose key equals `k` count as before it too.
+
+        Returns:
+            tuple[list[SkipNode], list[int]]: The nodes from level 0 up and their ranks.
+        """
+        node, rank = self._head, 0
+        update, ranks = [None] * self._levels, [0] * self._levels
+        for i in range(self._levels - 1, -1, -1):
+            following = node._forward[i]
+            while following is not None:
+                following_key = self._key_of(following)
+                if following_key > k or (not right and following_key == k):
+                    break
+                rank += node._widths[i]
+                node, following = following, following._forward[i]
+            update[i], ranks[i] = node, rank
+        return update, ranks
+
+    def _first_at_least(self, k):
+        """Returns the last node whose key is less than `k`, and its rank."""
+        node, rank = self._head, 0
+        for i in range(self._levels - 1, -1, -1):
+            following = node._forward[i]
+            while following is not None and self._key_of(following) < k:
+                rank += node._widths[i]
+                node, following = following, following._forward[i]
+        return node, rank
+
+    def _find_equal(self, node, value):
+        """Returns the first node from `node` on holding `value`, among the nodes with its key."""
+        k = self._key(value) if self._key else value
+        while node is not None and self._key_of(node) == k:
+            if node._data == value:
+                return node
+            node = node._forward[0]
+        return None
+
+    def insert(self, value):
+        """Inserts `value` after any values with an equal key in expected O(log n)."""
+        k = self._key(value) if self._key else value
+        update, ranks = self._search(k, right=True)
+        level = self._random_level()
+        head, n = self._head, self._length
+        for i in range(self._levels, level):  # open new levels, which link past the end
+            head._forward[i], head._widths[i] = None, n + 1
+            update.append(head)
+            ranks.append(0)
+        self._levels = max(self._levels, level)
+        node, rank = SkipNode(value, level), ranks[0] + 1
+        for i in range(level):
+            previous = update[i]
+            node._forward[i] = previous._forward[i]
+            node._widths[i] = ranks[i] + previous._widths[i] - ranks[0]
+            previous._forward[i] = node
+            previous._widths[i] = rank - ranks[i]
+        for i in range(level, self._levels):  # links passing over the new node span one more
+            update[i]._widths[i] += 1
+        self._length = n + 1
+
+    def remove(self, value):
+        """Removes the first occurrence of `value` in expected O(log n).
+
+        Raises:
+            ValueError: If the value is not in the skip list.
+        """
+        k = self._key(value) if self._key else value
+        update, _ = self._search(k, right=False)
+        node = update[0]._forward[0]
+        while node is not None and self._key_of(node) == k and node._data != value:
+            for i in range(node.level):  # a skipped equal node precedes the target at its levels
+                update[i] = node
+            node = node._forward[0]
+        if node is None or self._key_of(node) != k:
+            raise ValueError(f"{value!r} is not in the SkipList")
+        for i in range(self._levels):
+            previous = update[i]
+            if previous._forward[i] is node:
+                previous._forward[i] = node._forward[i]
+                previous._widths[i] += node._widths[i] - 1
+            else:
+                previous._widths[i] -= 1
+        while self._levels > 1 and self._head._forward[self._levels - 1] is None:
+            self._levels -= 1
+        self._length -= 1
+
+    def search(self, x):
+        """Returns True if some value has the key `x`, in expected O(log n)."""
+        node = self._first_at_least(x)[0]._forward[0]
+        return node is not None and self._key_of(node) == x
+
+    def rank(self, x):
+        """Returns the number of values whose key is less than `x`, in expected O(log n).
+
+        This is the index of the first value with the key `x`, if there is one.
+        """
+        return self._first_at_least(x)[1]
+
+    def bisect_right(self, x):
+        """Returns the number of values whose key is at most `x`, in expected O(log n)."""
+        _, ranks = self._search(x, right=True)
+        return ranks[0]
+
+    def count_range(self, lo, hi):
+        """Counts the values whose keys fall in the half-open range `[lo, hi)`."""
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    def iter_range(self, lo=None, hi=None):
+        """Yields the values whose keys fall in `[lo, hi)` in order.
+
+        Finding the first value is O(log n), after which each value costs O(1).
+        Either bound may be None for an open end.
+        """
+        node = self._head if lo is None else self._first_at_least(lo)[0]
+        node = node._forward[0]
+        while node is not None and (hi is None or self._key_of(node) < hi):
+            yield node._data
+            node = node._forward[0]
@@ -0,0 +1,154 @@
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+
+_MISSING = object()
+
+
+class SparseRandomAccessArray:
+    """A RandomAccessArray over a huge index space that stores only populated slots.
+
+    Slots hold `default` until written. Only slots holding another value are
+    stored, in a dict from index to value, so memory grows with the populated
+    slots rather than the size. To visit them in index order, their indices are
+    sorted lazily, once after any run of writes that populate or clear slots.
+
+    Args:
+        size (int): The number of slots.
+        default (Any, optional): The value of every unpopulated slot. Defaults to None.
+
+    Attributes:
+        _size (int): The number of slots.
+        _default (Any): The value of every unpopulated slot.
+        _entries (dict[int, Any]): The values of the populated slots.
+        _indices (Optional[list[int]]): The indices of the populated slots in ascending
+            order, or None until they are next needed after a slot was populated or cleared.
+
+    Note:
+        Reads and writes are O(1). The first ordered traversal after populating or
+        clearing slots sorts the k populated indices in O(k log k).
+
+    Examples:
+        >>> sparse = SparseRandomAccessArray(10 ** 9)
+        >>> sparse[10 ** 8], sparse[42], sparse[7] = 8, 2, 6
+        >>> sparse[42], sparse[43], len(sparse), sparse.populated
+        (2, None, 1000000000, 3)
+        >>> sparse.insertion_sort()
+        >>> list(sparse.items())
+        [(7, 2), (42, 6), (100000000, 8)]
+    """
+    __slots__ = ('_size', '_default', '_entries', '_indices')
+
+    def __init__(self, size, default=None):
+        if size < 0:
+            raise ValueError("size must be non-negative.")
+        self._size = size
+        self._default = default
+        self._entries = {}
+        self._indices = []
+
+    def _check_index(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("SparseRandomAccessArray index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entries.get(i, self._default) for i in range(self._size)[index]]
+        return self._entries.get(self._check_index(index), self._default)
+
+    def __setitem__(self, index, value):
+        index = self._check_index(index)
+        if value == self._default:
+            self.__delitem__(index)
+            return
+        if index not in self._entries:
+            self._indices = None
+        self._entries[index] = value
+
+    def __delitem__(self, index):
+        """Resets a slot to the default value."""
+        index = self._check_index(index)
+        if self._entries.pop(index, _MISSING) is not _MISSING:
+            self._indices = None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Yields the value of every slot, defaults included; see `values` and `items`."""
+        entries, default = self._entries, self._default
+        return (entries.get(i, default) for i in range(self._size))
+
+    def _sorted_indices(self):
+        """Returns the indices of the populated slots in ascending order, sorting them if stale."""
+        if self._indices is None:
+            self._indices = sorted(self._entries)
+        return self._indices
+
+    def __contains__(self, value):
+        return value in self._entries.values() or (
+            value == self._default and len(self._entries) < self._size
+        )
+
+    def __repr__(self):
+        entries = {i: self._entries[i] for i in self._sorted_indices()}
+        return f"SparseRandomAccessArray({entries}, size={self._size}, default={self._default!r})"
+
+    def __str__(self):
+        """Returns the populated values in index order."""
+        return f"[{', '.join(str(value) for value in self.values())}]"
+
+    @property
+    def populated(self):
+        """The number of slots holding a value other than the default."""
+        return len(self._entries)
+
+    @property
+    def default(self):
+        """The value of every unpopulated slot."""
+        return self._default
+
+    def indices(self):
+        """Returns the indices of the populated slots in ascending order."""
+        return list(self._sorted_indices())
+
+    def values(self):
+        """Yields the values of the populated slots in index order."""
+        entries = self._entries
+        return (entries[i] for i in self._sorted_indices())
+
+    def items(self):
+        """Yields `(index, value)` pairs of the populated slots in index order."""
+        entries = self._entries
+        return ((i, entries[i]) for i in self._sorted_indices())
+
+    def _rewrite(self, operation, *args):
+        """Runs a RandomAccessArray operation over the populated values in index order.
+
+        The values are rearranged among the populated slots; the set of populated
+        indices does not change.
+        """
+        indices = self._sorted_indices()
+        values = RandomAccessArray(len(indices))
+        for position, value in enumerate(self.values()):
+            values[position] = value
+        getattr(values, operation)(*args)
+        for index, value in zip(indices, values):
+            self._entries[index] = value
+
+    def bubble_sort(self, ascending=True):
+        """Sorts the populated values in place using bubble sort."""
+        self._rewrite('bubble_sort', ascending)
+
+    def insertion_sort(self, ascending=True, key=None):
+        """Sorts the populated values in place using insertion sort."""
+        self._rewrite('insertion_sort', ascending, key)
+
+    def sort(self, ascending=True, key=None):
+        """Sorts the populated values in place with a stable Timsort."""
+        self._rewrite('sort', ascending, key)
+
+    def reverse_order(self):
+        """Reverses the order of the populated values in place."""
+        self._rewrite('reverse_order')
@@ -2,9 +2,9 @@ from typing import Optional
 
 from ofnodes.nodes.singlynode import SinglyNode
 from ofnodes.components.structures.descriptors import Head
-from ofnodes.components.structures.mixins import RemoveMixin,  PrintMixin
+from ofnodes.components.structures.mixins import RemoveMixin,  PrintMixin, SerializationMixin
 
-class Stack(RemoveMixin, PrintMixin):
+class Stack(RemoveMixin, PrintMixin, SerializationMixin):
     """Support for a reference-based LIFO object.
     
     The head is considered the last node. The head is popped
@@ -24,7 +24,7 @@ class Stack(RemoveMixin, PrintMixin):
         # Get the list of attributes and methods from the parent classes
         parent_dir = set(super().__dir__())
         # Filter out private attributes and methods
-        parent_dir = {attr for attr in parent_dir if attr not in {'_head', '_tail', '_target'}}
+        parent_dir = {attr for attr in parent_dir if attr not in {'_head', '_tail', '_target', '_format_edges'}}
         # Return a sorted list of all attributes and methods
         return sorted(parent_dir)
 
@@ -32,22 +32,18 @@ class Stack(RemoveMixin, PrintMixin):
         #return f"{type(self).__name__}(head={type(self.head).__name__}, tail={self.tail})"
         if not self._head:
             return f"{type(self).__name__}()"
-        node = self._head
-        nodes = []
-        while node:
-            nodes.append(repr(node.data))
-            node = node.next
-        return f"{type(self).__name__}([" + ', '.join(nodes) + "])"
+        body, count = self._format_edges(repr, ', ')
+        if count is None:
+            return f"{type(self).__name__}([{body}])"
+        return f"{type(self).__name__}([{body}], len={count})"
 
     def __str__(self) -> str:
         if not self._head:
             return f"Empty {type(self).__name__}"
-        node = self._head
-        nodes = []
-        while node:
-            nodes.append(str(node.data))
-            node = node.next
-        return ' -> '.join(nodes)
+        body, count = self._format_edges(str, ' -> ')
+        if count is None:
+            return body
+        return f"{body} ({count} nodes)"
 
     def push(self, data):
         self.head = data  # trigger the setter, setter validates data
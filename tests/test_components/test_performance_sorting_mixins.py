@@ -56,4 +56,39 @@ class TestPerformanceReferenceBasedInsertionSort:
         while current:
             assert current.data == _[index]
             current = current.next
-            index += 1
\ No newline at end of file
+            index += 1
+
+
+class TestPerformanceIndexBasedHeapSort:
+    @pytest.mark.performance
+    def test_versus_quadratic_sorts(self):
+        import random
+        import timeit
+        for n in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+            values = [random.random() for _ in range(n)]
+            raarray = RandomAccessArray(n, typecode='d')
+            timings = []
+            # the quadratic sorts are only run while they take seconds rather than hours
+            sorts = ('heap_sort', 'insertion_sort', 'bubble_sort') if n <= 10 ** 4 else ('heap_sort',)
+            for name in sorts:
+                raarray.view()[:] = values
+                timings.append(f"{name} {timeit.timeit(getattr(raarray, name), number=1) * 1e3:.0f} ms")
+                assert list(raarray) == sorted(values)
+            print(f"\n{n} elements: {', '.join(timings)}")
+
+
+class TestPerformanceReferenceBasedQuicksort:
+    @pytest.mark.performance
+    def test_duplicate_heavy(self):
+        import random
+        import timeit
+        for n in (10 ** 3, 10 ** 4, 10 ** 5):
+            for distinct in (4, n):
+                values = [random.randrange(distinct) for _ in range(n)]
+                sllist = SinglyLinkedList(values)
+                timings = [f"quicksort {timeit.timeit(sllist.quicksort, number=1) * 1e3:.1f} ms"]
+                assert list(sllist) == sorted(values)
+                if n <= 10 ** 3:  # the quadratic sort is only run while it takes seconds
+                    sllist = SinglyLinkedList(values)
+                    timings.append(f"bubble_sort {timeit.timeit(sllist.bubble_sort, number=1) * 1e3:.1f} ms")
+                print(f"\n{n} nodes, {distinct} distinct keys: {', '.join(timings)}")
@@ -1,4 +1,6 @@
 import pytest
+from ofnodes.components.structures.mixins import RemoveMixin
+from ofnodes.nodes.singlynode import SinglyNode
 from ofnodes.structures.singlylinkedlist import SinglyLinkedList
 
 class TestRemoveMixin:
@@ -102,3 +104,12 @@ class TestRemoveHead:
             assert node is removed
         test_remove_tail()
         test_remove_between_head_and_tail()
+
+    def test_host_without_index(self):
+        class Dummy(RemoveMixin):
+            __slots__ = ('_head', '_tail')
+        dummy = Dummy()
+        dummy._head = SinglyNode(1)
+        dummy._head._next = dummy._tail = SinglyNode(2)
+        assert dummy.remove_tail().data == 2
+        assert dummy._head is dummy._tail and dummy._head.next is None
@@ -1,5 +1,5 @@
 import pytest
-from ofnodes.sorting.mixins import BubbleSortMixin, InsertionSortMixin
+from ofnodes.sorting.mixins import BubbleSortMixin, HeapSortMixin, InsertionSortMixin, QuickSortMixin, ReverseOrderMixin
 from ofnodes.structures.singlylinkedlist import SinglyLinkedList
 from ofnodes.structures.randomaccessarray import RandomAccessArray
 
@@ -300,6 +300,174 @@ class TestInsertionSortMixin:
             assert repr(raarray) == 'RandomAccessArray([8, 6, 5, 2, 1])'
 
 
+class TestHeapSortMixin:
+
+
+    class TestIndexBasedHeapify:
+        def test_wrong_object_type(self):
+            class Dummy(HeapSortMixin):
+                pass
+            dummy = Dummy()
+            with pytest.raises(TypeError) as exc_info:
+                dummy.index_based_heapify()
+            assert "index_based_heapify" in str(exc_info)
+        def test_min_heap(self):
+            import random
+            values = [random.randint(0, 100) for _ in range(101)]
+            raarray = RandomAccessArray(len(values))
+            for i, val in enumerate(values):
+                raarray[i] = val
+            raarray.index_based_heapify()
+            assert sorted(raarray) == sorted(values)
+            assert all(raarray[(i - 1) // 2] <= raarray[i] for i in range(1, len(values)))
+        def test_max_heap_with_key(self):
+            strings = ["strawberry", "fig", "peach", "date", "cherry"]
+            raarray = RandomAccessArray(len(strings))
+            for i, val in enumerate(strings):
+                raarray[i] = val
+            raarray.index_based_heapify(max_heap=True, key=len)
+            assert raarray[0] == "strawberry"
+            assert all(len(raarray[(i - 1) // 2]) >= len(raarray[i]) for i in range(1, len(strings)))
+
+
+    class TestIndexBasedHeapSort:
+        def test_wrong_object_type(self):
+            class Dummy(HeapSortMixin):
+                pass
+            dummy = Dummy()
+            with pytest.raises(TypeError) as exc_info:
+                dummy.index_based_heap_sort()
+            assert "index_based_heap_sort" in str(exc_info)
+        def test_zero_elements(self):
+            raarray = RandomAccessArray(0)
+            raarray.index_based_heap_sort()
+            assert repr(raarray) == 'RandomAccessArray([])'
+        def test_one_element(self):
+            raarray = RandomAccessArray(1)
+            raarray[0] = 42
+            raarray.index_based_heap_sort()
+            assert repr(raarray) == 'RandomAccessArray([42])'
+        def test_random_ascending_and_descending(self):
+            import random
+            for n in (2, 3, 10, 257):
+                values = [random.randint(0, n // 2) for _ in range(n)]
+                raarray = RandomAccessArray(n, typecode='q')
+                for i, val in enumerate(values):
+                    raarray[i] = val
+                raarray.index_based_heap_sort()
+                assert list(raarray) == sorted(values)
+                raarray.index_based_heap_sort(ascending=False)
+                assert list(raarray) == sorted(values, reverse=True)
+        def test_custom_key(self):
+            strings = ["strawberry", "fig", "peach", "date"]
+            raarray = RandomAccessArray(len(strings))
+            for i, val in enumerate(strings):
+                raarray[i] = val
+            raarray.index_based_heap_sort(key=len)
+            assert repr(raarray) == "RandomAccessArray(['fig', 'date', 'peach', 'strawberry'])"
+            raarray.index_based_heap_sort(ascending=False, key=len)
+            assert repr(raarray) == "RandomAccessArray(['strawberry', 'peach', 'date', 'fig'])"
+        def test_heap_sort_of_filled_prefix(self):
+            raarray = RandomAccessArray(10)
+            for i, val in enumerate([8, 2, 6]):
+                raarray[i] = val
+            raarray.heap_sort()
+            assert raarray[:4] == [2, 6, 8, None]
+            assert raarray.is_sorted
+        def test_heap_sort_of_view(self):
+            raarray = RandomAccessArray(6, typecode='q')
+            for i, val in enumerate([8, 2, 6, 4, 5, 1]):
+                raarray[i] = val
+            raarray.view(step=2).heap_sort()
+            assert list(raarray) == [5, 2, 6, 4, 8, 1]
+            raarray.view(start=1, step=2).heapify(max_heap=True)
+            assert raarray[1] == 4
+
+
+class TestQuickSortMixin:
+
+
+    class TestReferenceBasedPartition:
+        def test_no_head(self):
+            class Dummy(QuickSortMixin):
+                pass
+            dummy = Dummy()
+            with pytest.raises(TypeError) as exc_info:
+                dummy.reference_based_partition(pivot=1)
+            assert "reference_based_partition" in str(exc_info)
+        def test_pivot_or_predicate(self):
+            sllist = SinglyLinkedList([1, 2])
+            with pytest.raises(ValueError):
+                sllist.partition()
+            with pytest.raises(ValueError):
+                sllist.partition(pivot=1, predicate=bool)
+        def test_empty_list(self):
+            sllist = SinglyLinkedList()
+            assert sllist.partition(pivot=1) == (0, 0, 0)
+            assert sllist.head is None and sllist.tail is None
+        def test_pivot_is_stable(self):
+            pairs = [(3, 'a'), (1, 'b'), (2, 'c'), (3, 'd'), (1, 'e'), (2, 'f')]
+            sllist = SinglyLinkedList(pairs)
+            assert sllist.partition(pivot=2, key=lambda pair: pair[0]) == (2, 2, 2)
+            assert list(sllist) == [(1, 'b'), (1, 'e'), (2, 'c'), (2, 'f'), (3, 'a'), (3, 'd')]
+            assert sllist.tail.data == (3, 'd') and sllist.tail.next is None
+        def test_predicate_relinks_without_allocating(self):
+            sllist = SinglyLinkedList(range(10))
+            nodes = set()
+            node = sllist.head
+            while node:
+                nodes.add(id(node))
+                node = node.next
+            assert sllist.partition(predicate=lambda x: x % 3 == 0) == (4, 6)
+            assert list(sllist) == [0, 3, 6, 9, 1, 2, 4, 5, 7, 8]
+            node = sllist.head
+            while node:
+                assert id(node) in nodes
+                node = node.next
+            sllist.tail = 10
+            assert sllist[-1] == 10 and len(sllist) == 11
+
+
+    class TestReferenceBasedQuicksort:
+        def test_no_head(self):
+            class Dummy(QuickSortMixin):
+                pass
+            dummy = Dummy()
+            with pytest.raises(TypeError) as exc_info:
+                dummy.reference_based_quicksort()
+            assert "reference_based_quicksort" in str(exc_info)
+        def test_zero_and_one_node(self):
+            sllist = SinglyLinkedList()
+            sllist.quicksort()
+            assert repr(sllist) == 'SinglyLinkedList()'
+            sllist = SinglyLinkedList([42])
+            sllist.quicksort()
+            assert repr(sllist) == 'SinglyLinkedList([42])'
+        def test_random_ascending_and_descending(self):
+            import random
+            for n in (2, 3, 10, 500):
+                values = [random.randint(0, n // 3) for _ in range(n)]
+                sllist = SinglyLinkedList(values)
+                sllist.quicksort()
+                assert list(sllist) == sorted(values)
+                assert sllist.tail.data == max(values) and sllist.tail.next is None
+                sllist.quicksort(ascending=False)
+                assert list(sllist) == sorted(values, reverse=True)
+        def test_stable_with_key(self):
+            import random
+            pairs = [(random.choice([200, 404, 500]), i) for i in range(300)]
+            sllist = SinglyLinkedList(pairs)
+            sllist.quicksort(key=lambda pair: pair[0])
+            assert list(sllist) == sorted(pairs, key=lambda pair: pair[0])
+            sllist.quicksort(ascending=False, key=lambda pair: pair[0])
+            assert list(sllist) == sorted(pairs, key=lambda pair: pair[0], reverse=True)
+        def test_index_access_after_sort(self):
+            sllist = SinglyLinkedList([5, 1, 4, 2, 3], skip_index=True)
+            assert sllist[3] == 2
+            sllist.quicksort()
+            assert sllist[3] == 4 and sllist[-1] == 5
+
+
 class TestReverseOrderMixin:
     def test_reference_based_reverse_order(self):
         def test_no_head():
@@ -325,9 +493,11 @@ class TestReverseOrderMixin:
 
     def test_index_based_reverse_order(self):
         def test_no__getitem__():
-            sllist = SinglyLinkedList()
+            class Dummy(ReverseOrderMixin):
+                pass
+            dummy = Dummy()
             with pytest.raises(TypeError) as exc_info:
-                sllist.index_based_reverse_order()
+                dummy.index_based_reverse_order()
             assert "index_based_reverse_order" in str(exc_info)
         #def test_empty_array():
         #    # TODO: shouldn't reverse an array[i] is None
@@ -0,0 +1,29 @@
+import pytest
+from ofnodes.nodes.doublynode import DoublyNode
+from ofnodes.nodes.singlynode import SinglyNode
+
+def test_dynamic_attribute_assignment():
+    node = DoublyNode(42)
+    with pytest.raises(AttributeError) as exc_info:
+        node.fail = True
+    assert "object has no attribute" in str(exc_info)
+
+def test__init__():
+    node = DoublyNode('foo')
+    assert isinstance(node, SinglyNode)
+    assert node.data == 'foo' and node.next is None and node.prev is None
+    assert repr(node) == "DoublyNode(data='foo')"
+
+def test__dir__():
+    node = DoublyNode('foo')
+    assert {'data', 'next', 'prev'} <= set(dir(node))
+    assert not {'_data', '_next', '_prev'} & set(dir(node))
+
+def test_prev_property():
+    node = DoublyNode('foo')
+    with pytest.raises(AttributeError) as exc_info:
+        node.prev = DoublyNode('bar')
+    assert "Cannot set 'prev'" in str(exc_info)
+    with pytest.raises(AttributeError) as exc_info:
+        del node.prev
+    assert "cannot be deleted" in str(exc_info)
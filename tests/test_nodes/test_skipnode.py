@@ -0,0 +1,28 @@
+import pytest
+from ofnodes.nodes.skipnode import SkipNode
+
+def test_dynamic_attribute_assignment():
+    node = SkipNode(42)
+    with pytest.raises(AttributeError) as exc_info:
+        node.fail = True
+    assert "object has no attribute" in str(exc_info)
+
+def test__init__():
+    node = SkipNode('foo', level=3)
+    assert node.data == 'foo' and node.next is None and node.level == 3
+    assert repr(node) == "SkipNode(data='foo', level=3)"
+    assert str(node) == 'foo'
+    with pytest.raises(ValueError):
+        SkipNode('foo', level=0)
+
+def test__dir__():
+    node = SkipNode('foo')
+    assert {'data', 'next', 'level'} <= set(dir(node))
+    assert not {'_data', '_forward', '_widths'} & set(dir(node))
+
+def test_read_only_properties():
+    node = SkipNode('foo')
+    with pytest.raises(AttributeError):
+        node.data = 'bar'
+    with pytest.raises(AttributeError):
+        node.next = SkipNode('bar')
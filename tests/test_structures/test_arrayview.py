@@ -0,0 +1,112 @@
+import pytest
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+
+
+@pytest.fixture
+def raarray():
+    raarray = RandomAccessArray(8)
+    for i, val in enumerate([8, 2, 6, 4, 5, 1, 7, 3]):
+        raarray[i] = val
+    return raarray
+
+
+class TestRandomAccessArrayView:
+
+    def test_view_shares_storage(self, raarray):
+        view = raarray.view(2, 6)
+        assert list(view) == [6, 4, 5, 1]
+        view[0] = 60
+        assert raarray[2] == 60
+        raarray[5] = 10
+        assert view[-1] == 10
+
+    def test_strided_views(self, raarray):
+        assert list(raarray.view(step=2)) == [8, 6, 5, 7]
+        assert list(raarray.view(step=-3)) == [3, 5, 2]
+        assert list(raarray.view(1).view(step=2)) == [2, 4, 1, 3]
+        assert len(raarray.view(10)) == 0
+
+    def test_bounds(self, raarray):
+        view = raarray.view(2, 4)
+        with pytest.raises(IndexError):
+            view[2]
+        with pytest.raises(IndexError):
+            view[-3] = 1
+
+    def test_slices(self, raarray):
+        view = raarray.view(step=2)
+        assert view[1:3] == [6, 5]
+        view[::2] = [0, 0]
+        assert list(raarray) == [0, 2, 6, 4, 0, 1, 7, 3]
+        with pytest.raises(ValueError):
+            view[:2] = [1]
+
+    def test_sorts_and_reverse_in_place(self, raarray):
+        raarray.view(0, 4).bubble_sort()
+        assert list(raarray) == [2, 4, 6, 8, 5, 1, 7, 3]
+        raarray.view(4).insertion_sort(ascending=False)
+        assert list(raarray) == [2, 4, 6, 8, 7, 5, 3, 1]
+        raarray.view(step=2).reverse_order()
+        assert list(raarray) == [3, 4, 7, 8, 6, 5, 2, 1]
+
+    def test_repr_and_str(self, raarray):
+        view = raarray.view(0, 3)
+        assert repr(view) == "RandomAccessArrayView([8, 2, 6])"
+        assert str(view) == "[8, 2, 6]"
+        assert view.base is raarray
+
+    def test_follows_dynamic_base(self):
+        raarray = RandomAccessArray(0, dynamic=True)
+        raarray.extend([1, 2, 3])
+        view = raarray.view()
+        raarray.extend(range(100))
+        view[0] = 10
+        assert raarray[0] == 10
+
+    def test_shrunk_base(self):
+        raarray = RandomAccessArray(0, dynamic=True)
+        raarray.extend(range(10))
+        tail = raarray.view(6)
+        raarray.pop()  # the base keeps its capacity
+        assert len(raarray._data) > len(raarray)
+        with pytest.raises(IndexError):
+            tail[3]
+        with pytest.raises(IndexError):
+            tail[3] = 0
+        with pytest.raises(IndexError):
+            tail[:]
+        with pytest.raises(IndexError):
+            list(tail)
+        assert tail[:3] == [6, 7, 8]
+        with pytest.raises(IndexError):
+            tail[::-1]  # the highest position comes first
+        assert tail[2::-1] == [8, 7, 6]
+
+    def test_reversed_slice_write_extends_filled_prefix(self):
+        raarray = RandomAccessArray(6)
+        view = raarray.view(step=-1)
+        view[1:3] = ['a', 'b']
+        assert raarray.len_used == 5 and raarray[4] == 'a' and raarray[3] == 'b'
+
+    def test_to_memoryview(self):
+        raarray = RandomAccessArray(6, typecode='q')
+        for i in range(6):
+            raarray[i] = i
+        exported = raarray.view(5, None, -2).to_memoryview()
+        assert exported.tolist() == [5, 3, 1]
+        exported[0] = 50
+        assert raarray[5] == 50
+        with pytest.raises(TypeError):
+            RandomAccessArray(2).view().to_memoryview()
+
+
+class TestPerformanceArrayView:
+    @pytest.mark.performance
+    def test_view_versus_copy(self):
+        import timeit
+        n = 1000000
+        raarray = RandomAccessArray(n, typecode='d')
+        copy_time = timeit.timeit(lambda: raarray[n // 4:3 * n // 4], number=10) / 10
+        view_time = timeit.timeit(lambda: raarray.view(n // 4, 3 * n // 4), number=10) / 10
+        export_time = timeit.timeit(lambda: raarray.view(n // 4, 3 * n // 4).to_memoryview(), number=10) / 10
+        print(f"\nslice copy {copy_time * 1e6:.0f} us, view {view_time * 1e6:.1f} us, memoryview export {export_time * 1e6:.1f} us for {n // 2} elements")
@@ -0,0 +1,142 @@
+# tests/test_structures/test_asyncbuffers.py
+import asyncio
+import time
+import pytest
+from ofnodes.structures.asyncqueue import AsyncQueue
+from ofnodes.structures.asyncstack import AsyncStack
+
+class TestAsyncStack:
+    def test_lifo(self):
+        async def main():
+            stack = AsyncStack([1, 2])
+            await stack.put(3)
+            return [await stack.get(), stack.get_nowait(), await stack.get()]
+        assert asyncio.run(main()) == [3, 2, 1]
+
+    def test_repr_and_dir(self):
+        stack = AsyncStack([1, 2])
+        assert repr(stack) == 'AsyncStack([2, 1])' and len(stack) == 2
+        assert repr(AsyncStack()) == 'AsyncStack()'
+        assert not [attr for attr in dir(stack) if attr.startswith('_') and not attr.startswith('__')]
+
+    def test_head_is_read_only(self):
+        stack = AsyncStack([1, 2])
+        assert stack.head.data == 2
+        with pytest.raises(AttributeError):
+            stack.head = 3
+        assert repr(stack) == 'AsyncStack([2, 1])' and len(stack) == 2
+
+
+class TestAsyncQueue:
+    def test_fifo(self):
+        async def main():
+            queue = AsyncQueue([1, 2])
+            await queue.put(3)
+            return [await queue.get(), queue.get_nowait(), await queue.get()]
+        assert asyncio.run(main()) == [1, 2, 3]
+
+    def test_repr_and_dir(self):
+        queue = AsyncQueue([1, 2])
+        assert repr(queue) == 'AsyncQueue([1, 2])' and len(queue) == 2
+        assert not [attr for attr in dir(queue) if attr.startswith('_') and not attr.startswith('__')]
+
+    def test_head_and_tail_are_read_only(self):
+        queue = AsyncQueue([1, 2])
+        assert queue.head.data == 1 and queue.tail.data == 2
+        with pytest.raises(AttributeError):
+            queue.head = 0
+        with pytest.raises(AttributeError):
+            queue.tail = 3
+        assert repr(queue) == 'AsyncQueue([1, 2])' and len(queue) == 2
+
+    def test_nowait(self):
+        queue = AsyncQueue(maxsize=1)
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+        queue.put_nowait('foo')
+        assert queue.full() and not queue.empty()
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait('bar')
+        assert queue.get_nowait() == 'foo'
+        assert queue.empty() and queue._tail is None
+
+    def test_get_waits_for_put(self):
+        async def main():
+            queue = AsyncQueue()
+            getter = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            assert not getter.done()
+            await queue.put('wake')
+            return await getter
+        assert asyncio.run(main()) == 'wake'
+
+    def test_put_waits_while_full(self):
+        async def main():
+            queue = AsyncQueue([1], maxsize=1)
+            putter = asyncio.create_task(queue.put(2))
+            await asyncio.sleep(0)
+            assert not putter.done()
+            assert await queue.get() == 1
+            await putter
+            return list(await queue.get_many(5))
+        assert asyncio.run(main()) == [2]
+
+    def test_get_many(self):
+        async def main():
+            queue = AsyncQueue(range(5), maxsize=5)
+            first = await queue.get_many(3)
+            putters = [asyncio.create_task(queue.put(i)) for i in range(5, 8)]
+            await asyncio.sleep(0)
+            await asyncio.gather(*putters)
+            return first, await queue.get_many(10)
+        assert asyncio.run(main()) == ([0, 1, 2], [3, 4, 5, 6, 7])
+
+    def test_cancelled_getter(self):
+        async def main():
+            queue = AsyncQueue()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(queue.get(), 0.01)
+            queue.put_nowait('after')
+            return await queue.get()
+        assert asyncio.run(main()) == 'after'
+
+    def test_many_producers_and_consumers(self):
+        async def main():
+            queue = AsyncQueue(maxsize=8)
+            async def produce(offset):
+                for i in range(100):
+                    await queue.put(offset + i)
+            async def consume():
+                return [await queue.get() for _ in range(100)]
+            results = await asyncio.gather(*(consume() for _ in range(10)), *(produce(p * 100) for p in range(10)))
+            return sorted(data for batch in results[:10] for data in batch)
+        assert asyncio.run(main()) == list(range(1000))
+
+
+class TestPerformanceAsyncBuffers:
+    @pytest.mark.performance
+    @pytest.mark.parametrize("structure", [AsyncQueue, AsyncStack])
+    def test_latency_and_throughput(self, structure):
+        producers, consumers, items = 50, 50, 2000
+        async def main():
+            buffer = structure(maxsize=256)
+            latencies = []
+            async def produce():
+                for _ in range(items):
+                    await buffer.put(time.perf_counter())
+            async def consume():
+                remaining = producers * items // consumers
+                while remaining:
+                    for sent in await buffer.get_many(min(10, remaining)):
+                        latencies.append(time.perf_counter() - sent)
+                        remaining -= 1
+            start = time.perf_counter()
+            await asyncio.gather(*(produce() for _ in range(producers)), *(consume() for _ in range(consumers)))
+            return time.perf_counter() - start, sorted(latencies)
+        elapsed, latencies = asyncio.run(main())
+        assert len(latencies) == producers * items
+        print(
+            f"\n{structure.__name__}: {len(latencies) / elapsed:,.0f} items/sec, "
+            f"median latency {latencies[len(latencies) // 2] * 1e3:.3f} ms, "
+            f"p99 latency {latencies[int(len(latencies) * 0.99)] * 1e3:.3f} ms"
+        )
@@ -0,0 +1,146 @@
+import heapq
+import random
+
+import pytest
+from ofnodes.structures.binaryheap import BinaryHeap, PriorityQueue
+
+
+def drain(heap):
+    return [heap.pop() for _ in range(len(heap))]
+
+
+def assert_heap_invariant(heap):
+    data = list(heap._heap)
+    for index, handle in enumerate(data):
+        assert handle._index == index
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < len(data):
+                assert not heap._before(data[child], handle)
+
+
+class TestBinaryHeap:
+
+    def test_heapify_and_pop_in_order(self):
+        values = [random.randint(0, 100) for _ in range(200)]
+        heap = BinaryHeap(values)
+        assert_heap_invariant(heap)
+        assert len(heap) == 200
+        assert drain(heap) == sorted(values)
+        assert not heap
+
+    def test_push_and_peek(self):
+        heap = BinaryHeap()
+        for value in [8, 2, 6, 4]:
+            heap.push(value)
+        assert heap.peek() == 2 and len(heap) == 4
+        assert_heap_invariant(heap)
+        assert drain(heap) == [2, 4, 6, 8]
+        with pytest.raises(IndexError):
+            heap.pop()
+        with pytest.raises(IndexError):
+            heap.peek()
+
+    def test_max_heap_and_key(self):
+        words = ['peach', 'fig', 'date', 'strawberry']
+        assert drain(BinaryHeap(words, key=len)) == ['fig', 'date', 'peach', 'strawberry']
+        assert drain(BinaryHeap(words, key=len, max_heap=True)) == ['strawberry', 'peach', 'date', 'fig']
+
+    def test_ties_are_fifo(self):
+        heap = BinaryHeap(key=lambda pair: pair[0])
+        heap.push_many([(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')])
+        heap.push((1, 'e'))
+        assert drain(heap) == [(0, 'b'), (0, 'd'), (1, 'a'), (1, 'c'), (1, 'e')]
+
+    def test_push_many(self):
+        heap = BinaryHeap(range(10, 20))
+        handles = heap.push_many([3, 1])
+        assert [handle.value for handle in handles] == [3, 1]
+        heap.push_many(range(100, 90, -1))
+        assert_heap_invariant(heap)
+        assert drain(heap) == sorted([*range(10, 20), 3, 1, *range(100, 90, -1)])
+
+    def test_push_pop_and_replace_match_heapq(self):
+        values = [random.randint(0, 50) for _ in range(30)]
+        heap, reference = BinaryHeap(values), sorted(values)
+        heapq.heapify(reference)
+        for value in [random.randint(0, 60) for _ in range(50)]:
+            assert heap.push_pop(value) == heapq.heappushpop(reference, value)
+            assert heap.replace(value) == heapq.heapreplace(reference, value)
+        assert drain(heap) == sorted(reference)
+        assert BinaryHeap().push_pop(5) == 5
+        with pytest.raises(IndexError):
+            BinaryHeap().replace(5)
+
+    def test_decrease_key(self):
+        heap = BinaryHeap([5, 7, 9])
+        handle = heap.push(8)
+        heap.decrease_key(handle, 1)
+        assert handle in heap and handle.value == 1
+        assert_heap_invariant(heap)
+        assert heap.pop() == 1 and not handle.in_heap
+        with pytest.raises(ValueError):
+            heap.decrease_key(handle, 0)
+        other = heap.push(6)
+        with pytest.raises(ValueError):
+            heap.decrease_key(other, 10)
+
+    def test_remove(self):
+        heap = BinaryHeap()
+        handles = [heap.push(value) for value in [8, 2, 6, 4, 5, 1, 7, 3]]
+        assert heap.remove(handles[2]) == 6
+        assert heap.remove(handles[7]) == 3
+        assert_heap_invariant(heap)
+        assert drain(heap) == [1, 2, 4, 5, 7, 8]
+        with pytest.raises(ValueError):
+            heap.remove(handles[0])
+
+    def test_repr_and_iteration(self):
+        heap = BinaryHeap([3, 1, 2])
+        assert sorted(heap) == [1, 2, 3]
+        assert repr(heap) == f"BinaryHeap({list(heap)})"
+
+
+class TestPriorityQueue:
+
+    def test_explicit_priorities(self):
+        queue = PriorityQueue([('c', 3), ('a', 1)])
+        task = queue.push('b', 2)
+        queue.push('z', 0)
+        assert queue.peek() == 'z'
+        queue.decrease_key(task, -1)
+        assert drain(queue) == ['b', 'z', 'a', 'c']
+
+    def test_max_heap(self):
+        queue = PriorityQueue(max_heap=True)
+        queue.push_many([('low', 1), ('high', 9)])
+        assert queue.push_pop('mid', 5) == 'high'
+        assert queue.replace('top', 10) == 'mid'
+        assert drain(queue) == ['top', 'low']
+
+
+class TestPerformanceBinaryHeap:
+    @pytest.mark.performance
+    def test_versus_resorting(self):
+        import timeit
+        from ofnodes.structures.randomaccessarray import RandomAccessArray
+        n = 2000
+        values = [random.random() for _ in range(n)]
+
+        def with_heap():
+            heap = BinaryHeap()
+            for value in values:
+                heap.push(value)
+            return [heap.pop() for _ in range(n)]
+
+        def with_insertion_sort():
+            raarray = RandomAccessArray(0, dynamic=True)
+            for value in values:
+                raarray.append(value)
+                raarray.insertion_sort()
+            return list(raarray)
+
+        heap_time = timeit.timeit(with_heap, number=1)
+        sort_time = timeit.timeit(with_insertion_sort, number=1)
+        heapify_time = timeit.timeit(lambda: BinaryHeap(values), number=1)
+        print(f"\n{n} values: heap push/pop {heap_time * 1e3:.0f} ms, heapify {heapify_time * 1e3:.1f} ms, insertion sort per push {sort_time * 1e3:.0f} ms")
+        assert with_heap() == sorted(values)
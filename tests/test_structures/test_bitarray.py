@@ -0,0 +1,130 @@
+import pytest
+from ofnodes.structures.bitarray import BitArray
+
+
+class TestBitArray:
+
+    def test_init(self):
+        assert len(BitArray(10)) == 10 and BitArray(10).nbytes == 2
+        assert not BitArray(10).any() and BitArray(10, fill=True).all()
+        assert BitArray(10, fill=True).count() == 10
+        with pytest.raises(ValueError):
+            BitArray(-1)
+
+    def test_item_access(self):
+        flags = BitArray(12)
+        flags[0] = flags[9] = flags[-1] = True
+        assert flags[0] and flags[9] and flags[11] and not flags[1]
+        flags[9] = False
+        assert not flags[9]
+        assert flags[:4] == [True, False, False, False]
+        with pytest.raises(IndexError):
+            flags[12]
+        with pytest.raises(IndexError):
+            flags[-13] = True
+
+    def test_from_bits_and_representation(self):
+        flags = BitArray.from_bits('1011')
+        assert list(flags) == [True, False, True, True]
+        assert str(flags) == '1011'
+        assert repr(flags) == "BitArray.from_bits('1011')"
+        assert BitArray.from_bits([0, 1, 0]) == BitArray.from_bits('010')
+
+    def test_count_any_all(self):
+        flags = BitArray.from_bits('0110000001')
+        assert flags.count() == 3 and flags.count(False) == 7
+        assert flags.any() and not flags.all()
+        assert BitArray(0).all() and not BitArray(0).any()
+        assert BitArray.from_bits('11111111').all()
+
+    def test_bitwise_operations(self):
+        a, b = BitArray.from_bits('1100101'), BitArray.from_bits('1010011')
+        assert str(a & b) == '1000001'
+        assert str(a | b) == '1110111'
+        assert str(a ^ b) == '0110110'
+        assert str(~a) == '0011010'
+        assert (~BitArray(3)).all() and (~BitArray(3)).nbytes == 1
+        a |= b
+        assert str(a) == '1110111'
+        a &= BitArray(7)
+        assert not a.any()
+        with pytest.raises(ValueError):
+            a ^ BitArray(8)
+        with pytest.raises(TypeError):
+            a & [True] * 7
+
+    def test_find_first(self):
+        flags = BitArray(100)
+        assert flags.find_first() == -1 and flags.find_first(False) == 0
+        flags[83] = True
+        flags[90] = True
+        assert flags.find_first() == 83
+        full = BitArray(20, fill=True)
+        assert full.find_first(False) == -1
+        full[17] = False
+        assert full.find_first(False) == 17
+
+    def test_bulk_operations_across_chunks(self):
+        from ofnodes.structures.bitarray import CHUNK_SIZE
+        size = CHUNK_SIZE * 8 * 2 + 13
+        flags, other = BitArray(size), BitArray(size)
+        for i in range(0, size, 7):
+            flags[i] = True
+        for i in range(0, size, 3):
+            other[i] = True
+        assert flags.count() == len(range(0, size, 7))
+        assert (flags & other).count() == len(range(0, size, 21))
+        assert (flags | other).count() == len(range(0, size, 7)) + len(range(0, size, 3)) - len(range(0, size, 21))
+        assert (flags ^ other) == (flags | other) & ~(flags & other)
+        assert (~flags).count() == size - flags.count() and not (~flags)[size - 1 - (size - 1) % 7]
+        flags &= other
+        assert flags.count() == len(range(0, size, 21)) and flags[21] and not flags[7]
+
+    def test_count_does_not_copy(self):
+        import tracemalloc
+        flags = BitArray(8000000, fill=True)
+        other = BitArray(8000000)
+        tracemalloc.start()
+        try:
+            assert flags.count() == 8000000
+            flags &= other
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < flags.nbytes // 10 and flags.count() == 0
+
+    def test_find_first_does_not_copy(self):
+        import tracemalloc
+        flags = BitArray(8000000)
+        flags[9] = True  # lstrip would copy everything after the first byte
+        tracemalloc.start()
+        try:
+            assert flags.find_first() == 9
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < flags.nbytes // 100
+
+
+class TestPerformanceBitArray:
+    @pytest.mark.performance
+    def test_memory_and_bulk_operations(self):
+        import random
+        import timeit
+        import tracemalloc
+        from ofnodes.structures.randomaccessarray import RandomAccessArray
+        n = 1000000
+        for make in (lambda: RandomAccessArray(n, fill=False), lambda: BitArray(n)):
+            tracemalloc.start()
+            flags = make()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"\n{type(flags).__name__}: {current / 1024:.0f} KiB for {n} flags")
+        flags = BitArray(n)
+        for i in random.sample(range(n), 1000):
+            flags[i] = True
+        other = BitArray(n, fill=True)
+        for name, operation in (('count', flags.count), ('any', flags.any), ('and', lambda: flags & other), ('find_first', flags.find_first)):
+            print(f"{name}: {timeit.timeit(operation, number=10) / 10 * 1e6:.0f} us")
+        scan = timeit.timeit(lambda: sum(flags), number=1)
+        print(f"per-flag scan: {scan * 1e6:.0f} us")
@@ -0,0 +1,156 @@
+# tests/test_structures/test_concurrentstack.py
+import threading
+import time
+from queue import Empty, Full
+import pytest
+from ofnodes.structures.concurrentstack import ConcurrentStack
+from ofnodes.nodes.singlynode import SinglyNode
+
+class TestConcurrentStack:
+    def test_dynamic_attribute_assignment(self):
+        stack = ConcurrentStack()
+        with pytest.raises(AttributeError) as exc_info:
+            stack.fail = True  # pylint: disable=assigning-non-slot
+        assert "object has no attribute" in str(exc_info)
+
+    def test__init___values(self):
+        stack = ConcurrentStack([8, 2, 1, 5])
+        assert repr(stack) == 'ConcurrentStack([5, 1, 2, 8])'
+        assert str(stack) == '5 -> 1 -> 2 -> 8'
+        assert len(stack) == 4
+        assert repr(ConcurrentStack()) == 'ConcurrentStack()'
+        assert str(ConcurrentStack()) == 'Empty ConcurrentStack'
+
+    def test__dir__(self):
+        stack = ConcurrentStack()
+        assert not [attr for attr in dir(stack) if attr.startswith('_') and not attr.startswith('__')]
+        assert {'push', 'pop', 'pop_many', 'push_nowait', 'pop_nowait', 'maxsize'} <= set(dir(stack))
+
+    def test_push_pop_peek(self):
+        stack = ConcurrentStack()
+        stack.push(42)
+        stack.push('foo')
+        assert stack.peek() == 'foo'
+        popped = stack.pop()
+        assert isinstance(popped, SinglyNode) and popped.data == 'foo'
+        assert stack.pop().data == 42
+        assert stack.is_empty()
+        with pytest.raises(IndexError):
+            stack.peek()
+
+    def test_mutation_only_through_push_and_pop(self):
+        stack = ConcurrentStack([1], maxsize=1)
+        assert stack.head.data == 1
+        with pytest.raises(AttributeError):
+            stack.head = 2
+        assert not hasattr(stack, 'remove_head') and not hasattr(stack, 'remove')
+        assert len(stack) == 1 and repr(stack) == 'ConcurrentStack([1])'
+        node = stack.pop()
+        assert node.next is None and len(stack) == 0 and stack.head is None
+
+    def test_nowait(self):
+        stack = ConcurrentStack(maxsize=1)
+        with pytest.raises(Empty):
+            stack.pop_nowait()
+        stack.push_nowait(1)
+        with pytest.raises(Full):
+            stack.push_nowait(2)
+        assert stack.pop_nowait().data == 1
+
+    def test_timeouts(self):
+        stack = ConcurrentStack([1], maxsize=1)
+        with pytest.raises(Full):
+            stack.push(2, timeout=0.01)
+        stack.pop()
+        with pytest.raises(Empty):
+            stack.pop(timeout=0.01)
+        with pytest.raises(Empty):
+            stack.pop_many(3, timeout=0.01)
+
+    def test_pop_many(self):
+        stack = ConcurrentStack(range(5), maxsize=5)
+        assert [node.data for node in stack.pop_many(3)] == [4, 3, 2]
+        assert len(stack) == 2
+        assert [node.data for node in stack.pop_many(10)] == [1, 0]
+        assert stack.is_empty()
+
+    def test_blocking_backpressure(self):
+        stack = ConcurrentStack([0], maxsize=1)
+        pushed = threading.Event()
+        def producer():
+            stack.push(1)
+            pushed.set()
+        thread = threading.Thread(target=producer)
+        thread.start()
+        assert not pushed.wait(0.05)  # blocked while full
+        assert stack.pop().data == 0
+        assert pushed.wait(1)
+        thread.join()
+        assert stack.pop().data == 1
+
+    def test_blocking_pop_wakes_up(self):
+        stack = ConcurrentStack()
+        result = []
+        thread = threading.Thread(target=lambda: result.append(stack.pop(timeout=5).data))
+        thread.start()
+        time.sleep(0.01)
+        stack.push('wake')
+        thread.join()
+        assert result == ['wake']
+
+    def test_no_lost_items_under_contention(self):
+        stack = ConcurrentStack(maxsize=64)
+        producers, items = 8, 2000
+        popped = []
+        lock = threading.Lock()
+        done = threading.Event()
+        def produce(offset):
+            for i in range(items):
+                stack.push(offset + i)
+        def consume():
+            local = []
+            while not (done.is_set() and stack.is_empty()):
+                try:
+                    local.extend(node.data for node in stack.pop_many(16, timeout=0.01))
+                except Empty:
+                    pass
+            with lock:
+                popped.extend(local)
+        producer_threads = [threading.Thread(target=produce, args=(p * items,)) for p in range(producers)]
+        consumer_threads = [threading.Thread(target=consume) for _ in range(4)]
+        for thread in producer_threads + consumer_threads:
+            thread.start()
+        for thread in producer_threads:
+            thread.join()
+        done.set()
+        for thread in consumer_threads:
+            thread.join()
+        assert sorted(popped) == list(range(producers * items))
+        assert len(stack) == 0
+
+
+class TestPerformanceConcurrentStack:
+    @pytest.mark.performance
+    @pytest.mark.parametrize("threads", [1, 4, 16])
+    def test_stress_throughput(self, threads):
+        stack = ConcurrentStack(maxsize=1024)
+        operations = 50000
+        def worker():
+            for i in range(operations // threads):
+                stack.push(i)
+                stack.pop()
+        def batch_worker():
+            for i in range(operations // threads // 16):
+                for j in range(16):
+                    stack.push(j)
+                stack.pop_many(16)
+        for target, label in ((worker, 'push/pop'), (batch_worker, 'push/pop_many')):
+            workers = [threading.Thread(target=target) for _ in range(threads)]
+            start = time.perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            print(f"\n{label} with {threads} threads: {2 * operations / elapsed:,.0f} ops/sec")
+            assert stack.is_empty()
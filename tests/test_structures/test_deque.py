@@ -0,0 +1,80 @@
+# tests/test_structures/test_deque.py
+import pytest
+from ofnodes.structures.deque import Deque
+from ofnodes.nodes.doublynode import DoublyNode
+
+class TestDeque:
+    def test_dynamic_attribute_assignment(self):
+        deque = Deque()
+        with pytest.raises(AttributeError) as exc_info:
+            deque.fail = True  # pylint: disable=assigning-non-slot
+        assert "object has no attribute" in str(exc_info)
+
+    def test__init___values(self):
+        deque = Deque([8, 2, 1])
+        assert repr(deque) == 'Deque([8, 2, 1])'
+        assert str(deque) == '8 <-> 2 <-> 1'
+        assert list(reversed(deque)) == [1, 2, 8] and len(deque) == 3
+        assert repr(Deque()) == 'Deque()' and str(Deque()) == 'Empty Deque'
+
+    def test__dir__(self):
+        deque = Deque()
+        assert not [attr for attr in dir(deque) if attr.startswith('_') and not attr.startswith('__')]
+
+    def test_both_ends(self):
+        deque = Deque()
+        deque.append(2)
+        deque.appendleft(1)
+        deque.append(3)
+        assert list(deque) == [1, 2, 3] and deque.peekleft() == 1 and deque.peek() == 3
+        assert deque.head.next.prev is deque.head
+        node = deque.pop()
+        assert isinstance(node, DoublyNode) and node.data == 3 and node.prev is None
+        assert deque.tail.next is None
+        node = deque.popleft()
+        assert node.data == 1 and node.next is None and deque.head.prev is None
+        assert deque.pop().data == 2
+        assert deque.is_empty() and deque.head is None and deque.tail is None and len(deque) == 0
+        with pytest.raises(ValueError):
+            deque.pop()
+        with pytest.raises(ValueError):
+            deque.popleft()
+        with pytest.raises(IndexError):
+            deque.peek()
+        with pytest.raises(IndexError):
+            deque.peekleft()
+
+    def test_extend_and_drain(self):
+        deque = Deque([3])
+        deque.extend([4, 5])
+        deque.extendleft([2, 1])
+        assert list(deque) == [1, 2, 3, 4, 5] and len(deque) == 5
+        assert [node.data for node in deque.drain(2)] == [1, 2]
+        assert [node.data for node in deque.drain()] == [3, 4, 5]
+        assert deque.is_empty()
+
+
+class TestPerformanceDeque:
+    @pytest.mark.performance
+    def test_against_collections_deque(self):
+        import collections
+        import timeit
+        n = 100000
+        def ofnodes_deque():
+            deque = Deque()
+            for i in range(n):
+                deque.append(i)
+                deque.appendleft(i)
+            while deque._head is not None:
+                deque.pop()
+                deque.popleft()
+        def builtin_deque():
+            deque = collections.deque()
+            for i in range(n):
+                deque.append(i)
+                deque.appendleft(i)
+            while deque:
+                deque.pop()
+                deque.popleft()
+        for function in (ofnodes_deque, builtin_deque):
+            print(f"\n{function.__name__}: {timeit.timeit(function, number=3) / 3 * 1e3:.1f} ms per {2 * n} items")
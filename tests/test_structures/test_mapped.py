@@ -0,0 +1,179 @@
+# tests/test_structures/test_mapped.py
+import pytest
+from ofnodes.structures.mapped import (CHUNK_SIZE, HEADER, MappedRandomAccessArray,
+                                      MappedSinglyLinkedList, save_array, save_linked_list)
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+from ofnodes.structures.singlylinkedlist import SinglyLinkedList
+
+def make_array(values):
+    raarray = RandomAccessArray(len(values))
+    for i, val in enumerate(values):
+        raarray[i] = val
+    return raarray
+
+class TestMappedRandomAccessArray:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([8, 2, 6, 4, 5]).save(path)
+        assert path.stat().st_size == HEADER.size + 5 * 8
+        with RandomAccessArray.open_mmap(path) as mapped:
+            assert isinstance(mapped, MappedRandomAccessArray)
+            assert len(mapped) == 5 and mapped.typecode == 'q'
+            assert mapped[0] == 8 and mapped[-1] == 5
+            assert list(mapped) == [8, 2, 6, 4, 5]
+            window = mapped[1:4]
+            assert isinstance(window, memoryview) and window.tolist() == [2, 6, 4]
+            window.release()
+            assert repr(mapped) == "MappedRandomAccessArray(typecode='q', len=5)"
+
+    def test_typecodes(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([1.5, 2]).save(path)
+        with RandomAccessArray.open_mmap(path) as mapped:
+            assert mapped.typecode == 'd' and list(mapped) == [1.5, 2.0]
+        make_array([1, 2]).save(path, typecode='B')
+        with RandomAccessArray.open_mmap(path) as mapped:
+            assert mapped.typecode == 'B' and list(mapped) == [1, 2]
+
+    def test_read_only(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([1, 2]).save(path)
+        with RandomAccessArray.open_mmap(path) as mapped:
+            with pytest.raises(TypeError):
+                mapped._data[0] = 3
+
+    def test_unsupported_payload(self, tmp_path):
+        with pytest.raises(TypeError) as exc_info:
+            RandomAccessArray(2).save(tmp_path / 'array.ofn')
+        assert "Only numeric payloads" in str(exc_info)
+        with pytest.raises(ValueError) as exc_info:
+            make_array([1]).save(tmp_path / 'array.ofn', typecode='u')
+        assert "Unsupported typecode" in str(exc_info)
+
+    def test_not_an_ofnodes_file(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'not ofnodes' * 4)
+        with pytest.raises(ValueError) as exc_info:
+            RandomAccessArray.open_mmap(path)
+        assert "not an ofnodes file" in str(exc_info)
+        path.write_bytes(b'')
+        with pytest.raises(ValueError):
+            RandomAccessArray.open_mmap(path)
+
+    def test_truncated_file(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([8, 2, 6, 4, 5]).save(path)
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(ValueError) as exc_info:
+            RandomAccessArray.open_mmap(path)
+        assert "is truncated" in str(exc_info)
+
+    def test_corrupt_header(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([1, 2]).save(path)
+        contents = bytearray(path.read_bytes())
+        contents[6:7] = b'u'  # typecode
+        path.write_bytes(contents)
+        with pytest.raises(ValueError) as exc_info:
+            RandomAccessArray.open_mmap(path)
+        assert "corrupt ofnodes header" in str(exc_info)
+
+    def test_platform_sized_typecodes(self, tmp_path):
+        with pytest.raises(ValueError) as exc_info:
+            make_array([1]).save(tmp_path / 'array.ofn', typecode='l')
+        assert "Unsupported typecode" in str(exc_info)
+
+    def test_other_byte_order(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([1, 2]).save(path)
+        contents = bytearray(path.read_bytes())
+        contents[7:8] = b'>' if contents[7:8] == b'<' else b'<'
+        path.write_bytes(contents)
+        with pytest.raises(ValueError) as exc_info:
+            RandomAccessArray.open_mmap(path)
+        assert "another byte order" in str(exc_info)
+
+    def test_failed_write_keeps_existing_file(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        make_array([1, 2]).save(path)
+        def values():
+            yield from range(CHUNK_SIZE + 1)
+            raise RuntimeError("source failed")
+        with pytest.raises(RuntimeError):
+            save_array(path, values(), typecode='q')
+        with pytest.raises(OverflowError):
+            save_array(path, [1, 256], typecode='B')
+        assert [p.name for p in tmp_path.iterdir()] == ['array.ofn']
+        with RandomAccessArray.open_mmap(path) as mapped:
+            assert list(mapped) == [1, 2]
+        with pytest.raises(OverflowError):
+            save_array(tmp_path / 'new.ofn', [-1], typecode='B')
+        assert not (tmp_path / 'new.ofn').exists()
+
+    def test_streams_iterators(self, tmp_path):
+        path = tmp_path / 'array.ofn'
+        count = 2 * CHUNK_SIZE + 3
+        save_array(path, (i % 100 for i in range(count)), typecode='B')
+        assert path.stat().st_size == HEADER.size + count
+        with RandomAccessArray.open_mmap(path) as mapped:
+            assert len(mapped) == count
+            assert mapped[CHUNK_SIZE] == CHUNK_SIZE % 100 and mapped[-1] == (count - 1) % 100
+
+    def test_kind_mismatch(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        SinglyLinkedList([1, 2]).save(path)
+        with pytest.raises(ValueError) as exc_info:
+            RandomAccessArray.open_mmap(path)
+        assert "does not hold a MappedRandomAccessArray payload" in str(exc_info)
+
+
+class TestMappedSinglyLinkedList:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        SinglyLinkedList([8, 2, 6, 4, 5]).save(path)
+        with SinglyLinkedList.open_mmap(path) as mapped:
+            assert isinstance(mapped, MappedSinglyLinkedList)
+            assert len(mapped) == 5
+            assert list(mapped) == [8, 2, 6, 4, 5]
+            assert [mapped[i] for i in range(5)] == [8, 2, 6, 4, 5]
+            assert mapped[-2] == 4 and mapped[0] == 8
+            with pytest.raises(IndexError):
+                mapped[5]
+            assert repr(SinglyLinkedList(mapped)) == 'SinglyLinkedList([8, 2, 6, 4, 5])'
+
+    def test_empty_list(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        SinglyLinkedList().save(path)
+        with SinglyLinkedList.open_mmap(path) as mapped:
+            assert len(mapped) == 0 and list(mapped) == []
+
+    def test_truncated_next_block(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        SinglyLinkedList([1, 2, 3]).save(path, typecode='h')
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError) as exc_info:
+            SinglyLinkedList.open_mmap(path)
+        assert "is truncated" in str(exc_info)
+
+    def test_padding_before_next_block(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        SinglyLinkedList([1, 2, 3]).save(path, typecode='h')
+        with SinglyLinkedList.open_mmap(path) as mapped:
+            assert list(mapped) == [1, 2, 3]
+            assert mapped[2] == 3
+
+    def test_large_list(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        SinglyLinkedList(range(100000)).save(path)
+        with SinglyLinkedList.open_mmap(path) as mapped:
+            assert mapped[99999] == 99999
+            assert sum(mapped) == sum(range(100000))
+
+    def test_streams_iterators(self, tmp_path):
+        path = tmp_path / 'list.ofn'
+        count = CHUNK_SIZE + 2
+        save_linked_list(path, iter(range(count)), typecode='q')
+        with SinglyLinkedList.open_mmap(path) as mapped:
+            assert len(mapped) == count
+            assert list(mapped) == list(range(count))
+            assert list(mapped._next[CHUNK_SIZE - 1:]) == [CHUNK_SIZE, CHUNK_SIZE + 1, -1]
@@ -0,0 +1,101 @@
+import pytest
+from ofnodes.structures.ndrandomaccessarray import NDRandomAccessArray
+
+
+@pytest.fixture
+def grid():
+    grid = NDRandomAccessArray((3, 4))
+    values = iter([8, 2, 6, 4, 5, 1, 7, 3, 0, 9, 11, 10])
+    for i in range(3):
+        for j in range(4):
+            grid[i, j] = next(values)
+    return grid
+
+
+class TestNDRandomAccessArray:
+
+    def test_init(self):
+        cube = NDRandomAccessArray((2, 3, 4), typecode='d')
+        assert cube.shape == (2, 3, 4) and cube.strides == (12, 4, 1)
+        assert cube.ndim == 3 and cube.size == 24 and len(cube) == 2
+        assert len(cube.base) == 24 and cube.base.typecode == 'd'
+        assert NDRandomAccessArray(5).shape == (5,)
+        with pytest.raises(ValueError):
+            NDRandomAccessArray(())
+        with pytest.raises(ValueError):
+            NDRandomAccessArray((2, -1))
+
+    def test_tuple_indexing(self, grid):
+        assert grid[0, 0] == 8 and grid[2, 3] == 10 and grid[-1, -2] == 11
+        assert grid.base[1 * 4 + 2] == 7
+        with pytest.raises(IndexError):
+            grid[3, 0]
+        with pytest.raises(IndexError):
+            grid[0, 0, 0]
+        with pytest.raises(TypeError):
+            grid[0] = 1
+
+    def test_row_and_column_views(self, grid):
+        row, column = grid[1], grid[:, 2]
+        assert list(row) == [5, 1, 7, 3]
+        assert list(column) == [6, 7, 11]
+        column[0] = 60
+        assert grid[0, 2] == 60
+        assert grid.tolist()[0] == [8, 2, 60, 4]
+
+    def test_slicing(self, grid):
+        sub = grid[::2, 1:3]
+        assert sub.shape == (2, 2) and sub.tolist() == [[2, 6], [9, 11]]
+        sub[1, 1] = 0
+        assert grid[2, 2] == 0
+        assert grid[::-1, 0].tolist() == [0, 5, 8]
+
+    def test_transpose(self, grid):
+        transposed = grid.T
+        assert transposed.shape == (4, 3) and transposed.strides == (1, 4)
+        assert transposed.tolist() == [list(column) for column in zip(*grid.tolist())]
+        transposed[3, 0] = 40
+        assert grid[0, 3] == 40
+        cube = NDRandomAccessArray((2, 3, 4), fill=0)
+        assert cube.transpose(1, 0, 2).shape == (3, 2, 4)
+        assert cube.transpose((2, 0, 1)).strides == (1, 12, 4)
+        with pytest.raises(ValueError):
+            cube.transpose(0, 0, 1)
+
+    def test_lanes(self, grid):
+        assert [list(lane) for lane in grid.lanes(0)] == [[8, 5, 0], [2, 1, 9], [6, 7, 11], [4, 3, 10]]
+        assert [list(lane) for lane in grid.lanes()] == grid.tolist()
+
+    def test_per_axis_sorts(self, grid):
+        grid.bubble_sort(axis=1)
+        assert grid.tolist() == [[2, 4, 6, 8], [1, 3, 5, 7], [0, 9, 10, 11]]
+        grid.insertion_sort(axis=0, ascending=False)
+        assert grid.tolist() == [[2, 9, 10, 11], [1, 4, 6, 8], [0, 3, 5, 7]]
+        grid.sort(axis=0)
+        assert grid.tolist() == [[0, 3, 5, 7], [1, 4, 6, 8], [2, 9, 10, 11]]
+        grid.T.sort(axis=0, ascending=False)
+        assert grid.tolist() == [[7, 5, 3, 0], [8, 6, 4, 1], [11, 10, 9, 2]]
+
+    def test_per_axis_reverse(self, grid):
+        grid.reverse_order(axis=0)
+        assert grid.tolist() == [[0, 9, 11, 10], [5, 1, 7, 3], [8, 2, 6, 4]]
+        grid.reverse_order()
+        assert grid.tolist() == [[10, 11, 9, 0], [3, 7, 1, 5], [4, 6, 2, 8]]
+
+    def test_repr_and_str(self):
+        grid = NDRandomAccessArray((2, 2), fill=0)
+        assert repr(grid) == "NDRandomAccessArray([[0, 0], [0, 0]])"
+        assert str(grid) == "[[0, 0], [0, 0]]"
+
+
+class TestPerformanceNDRandomAccessArray:
+    @pytest.mark.performance
+    def test_column_scan(self):
+        import timeit
+        from ofnodes.structures.randomaccessarray import RandomAccessArray
+        n = 1000
+        grid = NDRandomAccessArray((n, n), typecode='d')
+        rows = [RandomAccessArray(n, typecode='d') for _ in range(n)]
+        strided = timeit.timeit(lambda: [sum(grid[:, j]) for j in range(0, n, 10)], number=1)
+        nested = timeit.timeit(lambda: [sum(row[j] for row in rows) for j in range(0, n, 10)], number=1)
+        print(f"\ncolumn scans: strided view {strided * 1e3:.0f} ms, list of rows {nested * 1e3:.0f} ms for {n // 10} columns of {n}")
@@ -0,0 +1,99 @@
+# tests/test_structures/test_persistentlinkedlist.py
+import threading
+import pytest
+from ofnodes.nodes.frozensinglynode import FrozenSinglyNode
+from ofnodes.nodes.singlynode import SinglyNode
+from ofnodes.structures.persistentlinkedlist import PersistentLinkedList, to_singly_linked_list, from_singly_linked_list
+from ofnodes.structures.singlylinkedlist import SinglyLinkedList
+
+class TestFrozenSinglyNode:
+    def test_no_mutation_path(self):
+        node = FrozenSinglyNode('foo', FrozenSinglyNode('bar'))
+        assert isinstance(node, SinglyNode)
+        assert node.data == 'foo' and node.next.data == 'bar'
+        with pytest.raises(AttributeError) as exc_info:
+            node.data = 'baz'
+        assert "immutable" in str(exc_info)
+        with pytest.raises(AttributeError):
+            setattr(node, '_next', None)
+        with pytest.raises(AttributeError):
+            node + 'baz'
+        with pytest.raises(AttributeError):
+            del node._data
+        assert repr(node) == "FrozenSinglyNode(data='foo')"
+
+    def test_cannot_be_linked_into_mutable_structure(self):
+        sllist = SinglyLinkedList([1])
+        with pytest.raises(AttributeError):
+            sllist.head = FrozenSinglyNode(0)
+
+
+class TestPersistentLinkedList:
+    def test__init__(self):
+        plist = PersistentLinkedList([1, 2, 3])
+        assert len(plist) == 3 and list(plist) == [1, 2, 3]
+        assert repr(PersistentLinkedList()) == 'PersistentLinkedList()'
+        assert str(PersistentLinkedList()) == 'Empty PersistentLinkedList'
+        assert str(plist) == '1 -> 2 -> 3'
+
+    def test_immutable(self):
+        plist = PersistentLinkedList([1])
+        with pytest.raises(AttributeError):
+            plist._head = None
+        with pytest.raises(AttributeError):
+            plist.fail = True
+        assert '_head' not in dir(plist) and 'push' in dir(plist)
+
+    def test_push_shares_tail(self):
+        v1 = PersistentLinkedList([2, 3])
+        v2 = v1.push(1)
+        assert repr(v1) == 'PersistentLinkedList([2, 3])'
+        assert repr(v2) == 'PersistentLinkedList([1, 2, 3])'
+        assert v2.head.next is v1.head
+        assert len(v1) == 2 and len(v2) == 3
+
+    def test_pop(self):
+        v1 = PersistentLinkedList([1, 2])
+        v2 = v1.pop()
+        assert v2.head is v1.head.next and len(v2) == 1
+        assert v1.peek() == 1 and v2.peek() == 2
+        v3 = v2.pop()
+        assert v3.is_empty() and len(v3) == 0
+        with pytest.raises(ValueError) as exc_info:
+            v3.pop()
+        assert "empty linked structure" in str(exc_info)
+        with pytest.raises(IndexError):
+            v3.peek()
+
+    def test_prepend(self):
+        v1 = PersistentLinkedList([3])
+        v2 = v1.prepend([1, 2])
+        assert list(v2) == [1, 2, 3] and len(v2) == 3
+        assert v2.head.next.next is v1.head
+        assert v1.prepend([]).head is v1.head
+
+    def test_snapshot_readers(self):
+        versions = [PersistentLinkedList()]
+        for i in range(1000):
+            versions.append(versions[-1].push(i))
+        results = []
+        def read(version):
+            results.append(sum(version))
+        threads = [threading.Thread(target=read, args=(v,)) for v in versions[::100]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == sorted(sum(range(i)) for i in range(0, 1001, 100))
+
+
+class TestConversion:
+    def test_round_trip(self):
+        sllist = SinglyLinkedList(['foo', 42.0, True])
+        plist = from_singly_linked_list(sllist)
+        assert repr(plist) == "PersistentLinkedList(['foo', 42.0, True])"
+        copied = to_singly_linked_list(plist)
+        assert repr(copied) == "SinglyLinkedList(['foo', 42.0, True])"
+        copied.head = 'mutable again'
+        assert list(plist) == ['foo', 42.0, True]
+        assert repr(to_singly_linked_list(PersistentLinkedList())) == 'SinglyLinkedList()'
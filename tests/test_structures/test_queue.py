@@ -0,0 +1,114 @@
+# tests/test_structures/test_queue.py
+import pytest
+from ofnodes.structures.queue import Queue
+from ofnodes.nodes.singlynode import SinglyNode
+
+class TestQueue:
+    def test_dynamic_attribute_assignment(self):
+        queue = Queue()
+        with pytest.raises(AttributeError) as exc_info:
+            queue.fail = True  # pylint: disable=assigning-non-slot
+        assert "object has no attribute" in str(exc_info)
+
+    def test__init___values(self):
+        queue = Queue([8, 2, 1, 5])
+        assert repr(queue) == 'Queue([8, 2, 1, 5])'
+        assert str(queue) == '8 -> 2 -> 1 -> 5'
+        assert len(queue) == 4 and list(queue) == [8, 2, 1, 5]
+        assert repr(Queue()) == 'Queue()' and str(Queue()) == 'Empty Queue'
+
+    def test__dir__(self):
+        queue = Queue()
+        assert not [attr for attr in dir(queue) if attr.startswith('_') and not attr.startswith('__')]
+        assert {'enqueue', 'dequeue', 'extend', 'drain', 'peek'} <= set(dir(queue))
+
+    def test_enqueue_dequeue(self):
+        queue = Queue()
+        queue.enqueue(42)
+        queue.enqueue('foo')
+        assert queue.peek() == 42
+        node = queue.dequeue()
+        assert isinstance(node, SinglyNode) and node.data == 42
+        assert queue.dequeue().data == 'foo'
+        assert queue.is_empty() and queue.tail is None and len(queue) == 0
+        with pytest.raises(ValueError) as exc_info:
+            queue.dequeue()
+        assert "empty linked structure" in str(exc_info)
+        with pytest.raises(IndexError):
+            queue.peek()
+        queue.enqueue('again')
+        assert queue.head is queue.tail
+
+    def test_extend(self):
+        queue = Queue([1])
+        queue.extend([2, 3])
+        queue.extend([])
+        assert list(queue) == [1, 2, 3] and queue.tail.data == 3 and len(queue) == 3
+        empty = Queue()
+        empty.extend(range(2))
+        assert empty.head.data == 0 and empty.tail.data == 1
+
+    def test_drain(self):
+        queue = Queue(range(5))
+        assert [node.data for node in queue.drain(2)] == [0, 1]
+        assert len(queue) == 3 and queue.peek() == 2
+        assert [node.data for node in queue.drain()] == [2, 3, 4]
+        assert queue.is_empty() and queue.tail is None and len(queue) == 0
+        assert queue.drain() == []
+
+    def test_dequeued_nodes_are_unlinked(self):
+        queue = Queue(range(5))
+        assert queue.dequeue().next is None
+        assert all(node.next is None for node in queue.drain(2))
+        assert list(queue) == [3, 4]
+        assert all(node.next is None for node in queue.drain())
+
+    def test_len_after_every_removal(self):
+        queue = Queue(range(6))
+        assert not hasattr(queue, 'remove_head') and not hasattr(queue, 'remove_tail')
+        queue.dequeue()
+        assert len(queue) == 5 == len(list(queue))
+        queue.drain(2)
+        assert len(queue) == 3 == len(list(queue))
+        queue.dequeue()
+        queue.drain()
+        assert len(queue) == 0 and queue.head is None and queue.tail is None
+
+    def test_head_and_tail_are_read_only(self):
+        queue = Queue([1, 2])
+        with pytest.raises(AttributeError):
+            queue.head = 0
+        with pytest.raises(AttributeError):
+            queue.tail = SinglyNode(3)
+        queue.enqueue(SinglyNode(3))
+        assert list(queue) == [1, 2, 3] and len(queue) == 3 and queue.tail.data == 3
+
+    def test_display(self, capsys):
+        Queue([2, 4]).display()
+        assert capsys.readouterr().out == "2\n4\n"
+
+
+class TestPerformanceQueue:
+    @pytest.mark.performance
+    def test_against_collections_deque(self):
+        import collections
+        import timeit
+        n = 100000
+        def ofnodes_queue():
+            queue = Queue()
+            for i in range(n):
+                queue.enqueue(i)
+            while queue._head is not None:
+                queue.dequeue()
+        def ofnodes_bulk():
+            queue = Queue()
+            queue.extend(range(n))
+            queue.drain()
+        def builtin_deque():
+            queue = collections.deque()
+            for i in range(n):
+                queue.append(i)
+            while queue:
+                queue.popleft()
+        for function in (ofnodes_queue, ofnodes_bulk, builtin_deque):
+            print(f"\n{function.__name__}: {timeit.timeit(function, number=3) / 3 * 1e3:.1f} ms per {n} items")
@@ -69,3 +69,578 @@ class TestRandomAccessArray:
             raarray.reverse_order()
             assert repr(raarray) == 'RandomAccessArray([5, 4, 6, 2, 8])'
             assert str(raarray) == '[5, 4, 6, 2, 8]'
+
+
+    class TestTypedStorage:
+
+
+        def test_init(self):
+            from array import array
+            raarray = RandomAccessArray(3, typecode='d')
+            assert isinstance(raarray._data, array) and raarray.typecode == 'd'
+            assert repr(raarray) == "RandomAccessArray([0.0, 0.0, 0.0], typecode='d')"
+            assert repr(RandomAccessArray(2, typecode='q', fill=-1)) == "RandomAccessArray([-1, -1], typecode='q')"
+            assert repr(RandomAccessArray(2, fill=0)) == 'RandomAccessArray([0, 0])'
+            assert RandomAccessArray(2).typecode is None
+
+        def test_item_access(self):
+            raarray = RandomAccessArray(3, typecode='q')
+            raarray[0] = 8
+            raarray[-1] = 5
+            assert raarray[0] == 8 and raarray[2] == 5 and len(raarray) == 3
+            assert str(raarray) == '[8, 0, 5]'
+            with pytest.raises(TypeError):
+                raarray[1] = 'not a number'
+            with pytest.raises(OverflowError):
+                RandomAccessArray(1, typecode='b')[0] = 1000
+
+        def test_sorts_and_reverse(self):
+            values = [8.5, 2.0, 6.25, 4.0, 5.5]
+            raarray = RandomAccessArray(5, typecode='d')
+            for i, val in enumerate(values):
+                raarray[i] = val
+            raarray.bubble_sort()
+            assert list(raarray) == sorted(values)
+            raarray.insertion_sort(ascending=False)
+            assert list(raarray) == sorted(values, reverse=True)
+            raarray.insertion_sort(key=lambda value: abs(value - 5))
+            assert list(raarray) == sorted(values, key=lambda value: abs(value - 5))
+            raarray.reverse_order()
+            assert list(raarray) == sorted(values, key=lambda value: abs(value - 5))[::-1]
+
+        def test_save_uses_typecode(self, tmp_path):
+            raarray = RandomAccessArray(2, typecode='f')
+            raarray[0] = 1.5
+            raarray.save(tmp_path / 'array.ofn')
+            with RandomAccessArray.open_mmap(tmp_path / 'array.ofn') as mapped:
+                assert mapped.typecode == 'f' and list(mapped) == [1.5, 0.0]
+
+    class TestDynamic:
+
+        def test_fixed_rejects_growth(self):
+            raarray = RandomAccessArray(3)
+            for operation, args in (('append', (1,)), ('extend', ([1],)), ('insert', (0, 1)), ('pop', ()), ('reserve', (4,))):
+                with pytest.raises(TypeError):
+                    getattr(raarray, operation)(*args)
+
+        def test_invalid_growth_factor(self):
+            with pytest.raises(ValueError):
+                RandomAccessArray(0, dynamic=True, growth_factor=1)
+
+        def test_append_grows_geometrically(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            capacities = set()
+            for i in range(100):
+                raarray.append(i)
+                capacities.add(raarray.capacity)
+            assert list(raarray) == list(range(100))
+            assert len(raarray) == 100
+            assert capacities == {1, 2, 4, 8, 16, 32, 64, 128}
+
+        def test_bounds_follow_logical_length(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend([8, 2, 6])
+            raarray.reserve(10)
+            assert raarray[-1] == 6 and raarray[1:] == [2, 6]
+            with pytest.raises(IndexError):
+                raarray[3]
+            with pytest.raises(IndexError):
+                raarray[3] = 1
+            assert repr(raarray) == "RandomAccessArray([8, 2, 6])"
+            assert str(raarray) == "[8, 2, 6]"
+
+        def test_insert_and_pop(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend([1, 2, 4])
+            raarray.insert(2, 3)
+            raarray.insert(-100, 0)
+            raarray.insert(100, 5)
+            assert list(raarray) == [0, 1, 2, 3, 4, 5]
+            assert raarray.pop() == 5
+            assert raarray.pop(0) == 0
+            assert raarray.pop(-2) == 3
+            assert list(raarray) == [1, 2, 4]
+            with pytest.raises(IndexError):
+                raarray.pop(3)
+
+        def test_insert_and_pop_in_filled_prefix(self):
+            raarray = RandomAccessArray(5, dynamic=True)
+            raarray[0], raarray[1] = 8, 2
+            assert raarray.pop(0) == 8
+            assert raarray.len_used == 1 and len(raarray) == 4
+            raarray.sort()
+            raarray.insert(0, 6)
+            assert raarray.len_used == 2 and len(raarray) == 5
+            raarray.sort()
+            assert list(raarray) == [2, 6]
+            raarray.insert(3, 4)
+            assert raarray.len_used == 4 and raarray[3] == 4
+            assert raarray.pop(4) is None and raarray.len_used == 4
+
+        def test_pop_clears_vacated_slots(self):
+            raarray = RandomAccessArray(0, dynamic=True, shrink_threshold=None)
+            raarray.extend([object(), object()])
+            raarray.pop()
+            assert raarray._data[1] is None
+
+        def test_shrink_respects_reserve(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend(range(64))
+            while len(raarray) > 1:
+                raarray.pop()
+            assert raarray.capacity < 8
+            raarray.reserve(32)
+            raarray.extend(range(31))
+            while raarray:
+                raarray.pop()
+            assert raarray.capacity == 32
+            with pytest.raises(IndexError):
+                raarray.pop()
+
+        def test_pop_never_grows(self):
+            raarray = RandomAccessArray(10, fill=0, dynamic=True, shrink_threshold=0.9)
+            capacities = []
+            while raarray:
+                raarray.pop()
+                capacities.append(raarray.capacity)
+            assert capacities[0] == 10
+            assert all(a >= b for a, b in zip(capacities, capacities[1:]))
+
+        def test_typed_dynamic(self):
+            raarray = RandomAccessArray(0, typecode='d', dynamic=True, growth_factor=1.5)
+            raarray.extend([3.0, 1.0, 2.0])
+            raarray.insertion_sort()
+            assert list(raarray) == [1.0, 2.0, 3.0]
+            assert repr(raarray) == "RandomAccessArray([1.0, 2.0, 3.0], typecode='d')"
+
+        def test_sorts_ignore_spare_capacity(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend([8, 2, 6, 4, 5])
+            raarray.reserve(16)
+            raarray.bubble_sort()
+            assert list(raarray) == [2, 4, 5, 6, 8]
+            raarray.reverse_order()
+            assert list(raarray) == [8, 6, 5, 4, 2]
+
+        def test_save_writes_logical_length(self, tmp_path):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend([1, 2, 3])
+            raarray.save(tmp_path / 'array.ofn')
+            with RandomAccessArray.open_mmap(tmp_path / 'array.ofn') as mapped:
+                assert list(mapped) == [1, 2, 3]
+
+        def test_slice_assignment_keeps_length(self):
+            raarray = RandomAccessArray(5)
+            raarray[:] = [0, 1, 2, 3, 4]
+            with pytest.raises(ValueError):
+                raarray[1:3] = [9, 9, 9, 9]
+            with pytest.raises(ValueError):
+                raarray[::2] = [9]
+            assert len(raarray) == 5 and list(raarray) == [0, 1, 2, 3, 4]
+            raarray[1:3] = [9, 8]
+            assert list(raarray) == [0, 9, 8, 3, 4]
+
+        def test_slices_stop_at_logical_length(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend(range(5))
+            raarray.reserve(16)
+            assert raarray[2:100] == [2, 3, 4]
+            assert raarray[::-2] == [4, 2, 0]
+            assert raarray[-2:] == [3, 4]
+            assert raarray[3:1] == []
+
+        def test_slice_assignment_with_spare_capacity(self):
+            raarray = RandomAccessArray(0, typecode='q', dynamic=True)
+            raarray.extend([1, 2, 3])
+            raarray.reserve(16)
+            raarray[::-1] = [7, 8, 9]
+            assert list(raarray) == [9, 8, 7] and raarray.capacity == 16
+
+    class TestBufferProtocol:
+
+        def test_from_buffer_is_zero_copy(self):
+            from array import array
+            buffer = array('d', [3.0, 1.0, 2.0])
+            raarray = RandomAccessArray.from_buffer(buffer)
+            assert raarray.typecode == 'd' and len(raarray) == 3
+            raarray.insertion_sort()
+            assert buffer.tolist() == [1.0, 2.0, 3.0]
+            assert repr(raarray) == "RandomAccessArray([1.0, 2.0, 3.0], typecode='d')"
+
+        def test_from_read_only_buffer(self):
+            raarray = RandomAccessArray.from_buffer(b'abc')
+            assert list(raarray) == [97, 98, 99]
+            with pytest.raises(TypeError):
+                raarray[0] = 1
+
+        def test_from_multidimensional_buffer(self):
+            grid = memoryview(bytearray(range(6))).cast('B', (2, 3))
+            assert list(RandomAccessArray.from_buffer(grid)) == [0, 1, 2, 3, 4, 5]
+
+        def test_from_numpy(self):
+            numpy = pytest.importorskip('numpy')
+            values = numpy.array([3, 1, 2], dtype=numpy.int64)
+            RandomAccessArray.from_buffer(values).bubble_sort()
+            assert values.tolist() == [1, 2, 3]
+
+        def test_to_memoryview(self):
+            raarray = RandomAccessArray(0, typecode='q', dynamic=True)
+            raarray.extend([1, 2, 3])
+            exported = raarray.to_memoryview()
+            assert exported.tolist() == [1, 2, 3]
+            with pytest.raises(BufferError):
+                raarray.extend(range(10))
+            exported.release()
+            raarray.extend(range(10))
+            with pytest.raises(TypeError):
+                RandomAccessArray(3).to_memoryview()
+
+    class TestBackends:
+
+        @staticmethod
+        def filled(values, **kwargs):
+            raarray = RandomAccessArray(len(values), **kwargs)
+            for i, val in enumerate(values):
+                raarray[i] = val
+            return raarray
+
+        def test_invalid_backend(self):
+            with pytest.raises(ValueError):
+                RandomAccessArray(3, backend='cupy')
+
+        def test_numpy_missing(self, monkeypatch):
+            from ofnodes.structures import randomaccessarray
+            monkeypatch.setattr(randomaccessarray, 'numpy', None)
+            with pytest.raises(ImportError):
+                RandomAccessArray(3, backend='numpy')
+
+        def test_python_sort_is_stable(self):
+            raarray = self.filled(['peach', 'fig', 'date', 'lime'])
+            raarray.sort(key=len)
+            assert list(raarray) == ['fig', 'date', 'lime', 'peach']
+            raarray.sort(ascending=False, key=len)
+            assert list(raarray) == ['peach', 'date', 'lime', 'fig']
+
+        def test_python_sort_typed_and_dynamic(self):
+            raarray = RandomAccessArray(0, typecode='q', dynamic=True)
+            raarray.extend([8, 2, 6])
+            raarray.reserve(10)
+            raarray.sort()
+            assert list(raarray) == [2, 6, 8] and raarray.capacity == 10
+
+        def test_python_vectorized_api(self):
+            raarray = self.filled([8, 2, 6, 4])
+            assert list(raarray.argsort()) == [1, 3, 2, 0]
+            assert list(raarray.argsort(ascending=False)) == [0, 2, 3, 1]
+            assert list(raarray.map(lambda x: x / 2)) == [4.0, 1.0, 3.0, 2.0]
+            assert list(raarray.where(lambda x: x > 5)) == [0, 2]
+            assert (raarray.sum(), raarray.min(), raarray.max()) == (20, 2, 8)
+            with pytest.raises(ValueError):
+                RandomAccessArray(0).min()
+
+        def test_numpy_storage(self):
+            numpy = pytest.importorskip('numpy')
+            raarray = self.filled([8, 2, 6], backend='numpy', dtype='float64')
+            assert isinstance(raarray._data, numpy.ndarray)
+            assert raarray.backend == 'numpy' and raarray.dtype == numpy.float64
+            assert repr(raarray) == "RandomAccessArray([8.0, 2.0, 6.0], backend='numpy', dtype='float64')"
+            with pytest.raises(ValueError):
+                RandomAccessArray(3, typecode='d', backend='numpy')
+
+        def test_numpy_sorts_and_reverse(self):
+            pytest.importorskip('numpy')
+            raarray = self.filled([8, 2, 6, 4, 5], backend='numpy')
+            raarray.bubble_sort(ascending=False)
+            assert list(raarray) == [8, 6, 5, 4, 2]
+            raarray.reverse_order()
+            assert list(raarray) == [2, 4, 5, 6, 8]
+            raarray.insertion_sort(ascending=False, key=lambda x: x % 3)
+            assert list(raarray) == [2, 5, 8, 4, 6]
+            raarray.insertion_sort()
+            assert list(raarray) == [2, 4, 5, 6, 8]
+
+        def test_numpy_vectorized_api(self):
+            pytest.importorskip('numpy')
+            raarray = self.filled([8, 2, 6, 4], backend='numpy', dtype='int64')
+            assert list(raarray.argsort()) == [1, 3, 2, 0]
+            assert list(raarray.map(lambda x: x * 10)) == [80, 20, 60, 40]
+            assert list(raarray.where(lambda x: x > 5)) == [0, 2]
+            assert (raarray.sum(), raarray.min(), raarray.max()) == (20, 2, 8)
+            assert type(raarray.sum()) is int
+
+        def test_numpy_dynamic(self):
+            pytest.importorskip('numpy')
+            raarray = RandomAccessArray(0, backend='numpy', dtype='int64', dynamic=True)
+            raarray.extend([3, 1, 2])
+            raarray.insert(0, 9)
+            assert raarray.pop(1) == 3
+            raarray.sort()
+            assert list(raarray) == [1, 2, 9]
+            assert raarray.to_memoryview().tolist() == [1, 2, 9]
+
+    class TestSortedSearch:
+
+        @staticmethod
+        def filled(values, **kwargs):
+            raarray = RandomAccessArray(len(values), **kwargs)
+            for i, val in enumerate(values):
+                raarray[i] = val
+            return raarray
+
+        def test_sort_state_tracking(self):
+            raarray = self.filled([8, 2, 6])
+            assert not raarray.is_sorted
+            raarray.insertion_sort()
+            assert raarray.is_sorted
+            raarray[0] = 9
+            assert not raarray.is_sorted
+            raarray.bubble_sort()
+            raarray.view(0, 2)[0] = 1
+            assert not raarray.is_sorted
+
+        def test_unsorted_search_raises(self):
+            raarray = self.filled([8, 2, 6])
+            for method, args in (('bisect_left', (2,)), ('bisect_right', (2,)), ('index_of', (2,)), ('count_range', (0, 9)), ('iter_range', (0, 9))):
+                with pytest.raises(ValueError):
+                    getattr(raarray, method)(*args)
+
+        def test_mark_sorted(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend([2, 4, 4, 9])
+            raarray.mark_sorted()
+            assert raarray.index_of(4) == 1
+            raarray.append(1)
+            assert not raarray.is_sorted
+            with pytest.raises(ValueError):
+                raarray.mark_sorted()
+            raarray.pop()
+            raarray.mark_sorted()
+            assert raarray.pop() == 9 and raarray.is_sorted
+
+        def test_bisect_matches_bisect_module(self):
+            import bisect
+            import random
+            values = [random.randint(0, 20) for _ in range(50)]
+            raarray = self.filled(values)
+            raarray.sort()
+            for x in range(-1, 22):
+                assert raarray.bisect_left(x) == bisect.bisect_left(sorted(values), x)
+                assert raarray.bisect_right(x) == bisect.bisect_right(sorted(values), x)
+
+        def test_descending(self):
+            raarray = self.filled([8, 2, 6, 4, 6])
+            raarray.sort()
+            raarray.reverse_order()
+            assert raarray.is_sorted and list(raarray) == [8, 6, 6, 4, 2]
+            assert (raarray.bisect_left(6), raarray.bisect_right(6)) == (1, 3)
+            assert (raarray.bisect_left(5), raarray.bisect_right(5)) == (3, 3)
+            assert raarray.index_of(4) == 3
+            assert raarray.count_range(4, 8) == 3
+            assert list(raarray.iter_range(4, 8)) == [6, 6, 4]
+
+        def test_key(self):
+            raarray = self.filled(['peach', 'fig', 'date', 'lime', 'kiwi'])
+            raarray.insertion_sort(key=len)
+            assert raarray.bisect_left(4) == 1 and raarray.bisect_right(4, key=len) == 4
+            assert raarray[raarray.index_of(5)] == 'peach'
+            assert list(raarray.iter_range(3, 5)) == ['fig', 'date', 'lime', 'kiwi']
+            with pytest.raises(ValueError):
+                raarray.bisect_left(4, key=lambda s: s[0])
+
+        def test_index_of_missing(self):
+            raarray = self.filled([1, 3, 5])
+            raarray.sort()
+            with pytest.raises(ValueError):
+                raarray.index_of(4)
+            with pytest.raises(ValueError):
+                raarray.index_of(6)
+
+        def test_empty_range(self):
+            raarray = self.filled([1, 3, 5])
+            raarray.sort()
+            assert raarray.count_range(5, 2) == 0
+            assert list(raarray.iter_range(6, 9)) == []
+
+        def test_numpy_search(self):
+            pytest.importorskip('numpy')
+            raarray = self.filled([8, 2, 6, 4, 6], backend='numpy')
+            raarray.sort()
+            assert (raarray.bisect_left(6), raarray.bisect_right(6)) == (2, 4)
+            assert raarray.count_range(4, 7) == 3
+
+    class TestFilledPrefix:
+
+        def test_len_used_tracks_high_water_mark(self):
+            raarray = RandomAccessArray(10)
+            assert raarray.len_used == 0 and len(raarray) == 10
+            raarray[2] = 'c'
+            assert raarray.len_used == 3
+            raarray[0] = 'a'
+            assert raarray.len_used == 3
+            raarray[-1] = 'z'
+            assert raarray.len_used == 10
+
+        def test_prefilled_arrays_start_full(self):
+            assert RandomAccessArray(3, fill=0).len_used == 3
+            assert RandomAccessArray(3, typecode='d').len_used == 3
+            assert RandomAccessArray.from_buffer(b'ab').len_used == 2
+
+        def test_iteration_and_str_skip_empty_tail(self):
+            raarray = RandomAccessArray(5)
+            raarray[0], raarray[1] = 8, 2
+            assert list(raarray) == [8, 2]
+            assert str(raarray) == "[8, 2]"
+            assert repr(raarray) == "RandomAccessArray([8, 2, None, None, None])"
+
+        def test_sorts_and_reverse_skip_empty_tail(self):
+            raarray = RandomAccessArray(6)
+            for i, val in enumerate([8, 2, 6]):
+                raarray[i] = val
+            raarray.bubble_sort()
+            assert raarray[:] == [2, 6, 8, None, None, None]
+            raarray.insertion_sort(ascending=False)
+            assert raarray[:] == [8, 6, 2, None, None, None]
+            raarray.reverse_order()
+            assert raarray[:] == [2, 6, 8, None, None, None]
+            raarray.sort(ascending=False)
+            assert raarray[:] == [8, 6, 2, None, None, None]
+            assert raarray.bisect_left(6) == 1 and raarray.sum() == 16
+
+        def test_views_and_slices_raise_len_used(self):
+            raarray = RandomAccessArray(6)
+            raarray.view(step=2)[1] = 'x'
+            assert raarray.len_used == 3
+            raarray.view()[1:5] = 'abcd'
+            assert raarray.len_used == 5
+
+        def test_dynamic_len_used(self):
+            raarray = RandomAccessArray(0, dynamic=True)
+            raarray.extend([1, 2, 3])
+            assert raarray.len_used == 3
+            raarray.pop()
+            assert raarray.len_used == 2
+
+        def test_save_writes_every_slot(self, tmp_path):
+            raarray = RandomAccessArray(3, typecode='q')
+            raarray[0] = 7
+            raarray.save(tmp_path / 'array.ofn')
+            with RandomAccessArray.open_mmap(tmp_path / 'array.ofn') as mapped:
+                assert list(mapped) == [7, 0, 0]
+
+
+class TestPerformanceDynamic:
+    @pytest.mark.performance
+    def test_append_throughput(self):
+        import timeit
+        n = 100000
+        for growth_factor in (1.25, 1.5, 2.0):
+            def fill():
+                raarray = RandomAccessArray(0, dynamic=True, growth_factor=growth_factor)
+                for i in range(n):
+                    raarray.append(i)
+            elapsed = timeit.timeit(fill, number=3) / 3
+            print(f"\ngrowth_factor={growth_factor}: {elapsed / n * 1e9:.0f} ns per append")
+
+    @pytest.mark.performance
+    def test_peak_memory(self):
+        import tracemalloc
+        n = 100000
+        for growth_factor in (1.25, 1.5, 2.0):
+            tracemalloc.start()
+            raarray = RandomAccessArray(0, typecode='q', dynamic=True, growth_factor=growth_factor)
+            for i in range(n):
+                raarray.append(i)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"\ngrowth_factor={growth_factor}: capacity {raarray.capacity}, current {current / n:.1f}, peak {peak / n:.1f} bytes per element")
+            del raarray
+
+
+class TestPerformanceTypedStorage:
+    @pytest.mark.performance
+    def test_memory(self):
+        import tracemalloc
+        n = 1000000
+        for typecode in (None, 'd'):
+            tracemalloc.start()
+            raarray = RandomAccessArray(n, typecode=typecode)
+            for i in range(n):
+                raarray[i] = float(i)
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"\ntypecode={typecode!r}: {current / n:.1f} bytes per element")
+            del raarray
+
+    @pytest.mark.performance
+    def test_throughput(self):
+        import random
+        import timeit
+        n = 1000
+        values = [random.random() for _ in range(n)]
+        for typecode in (None, 'd'):
+            raarray = RandomAccessArray(n, typecode=typecode)
+            def fill():
+                for i, val in enumerate(values):
+                    raarray[i] = val
+            fill_time = timeit.timeit(fill, number=10) / 10
+            fill()
+            sort_time = timeit.timeit(raarray.insertion_sort, number=1)
+            print(f"\ntypecode={typecode!r}: fill {fill_time * 1e3:.2f} ms, insertion sort {sort_time * 1e3:.1f} ms for {n} elements")
+            assert list(raarray) == sorted(values)
+
+
+class TestPerformanceBackends:
+    @pytest.mark.performance
+    def test_sort_throughput(self):
+        import random
+        import timeit
+        pytest.importorskip('numpy')
+        n = 100000
+        values = [random.random() for _ in range(n)]
+        for kwargs in ({}, {'typecode': 'd'}, {'backend': 'numpy', 'dtype': 'float64'}):
+            raarray = RandomAccessArray(n, **kwargs)
+            def fill():
+                for i, val in enumerate(values):
+                    raarray[i] = val
+            def sort():
+                fill()
+                raarray.sort()
+            elapsed = timeit.timeit(sort, number=3) / 3 - timeit.timeit(fill, number=3) / 3
+            reduce_time = timeit.timeit(raarray.sum, number=10) / 10
+            print(f"\n{kwargs}: sort {elapsed * 1e3:.1f} ms, sum {reduce_time * 1e3:.2f} ms for {n} elements")
+            sort()
+            assert list(raarray) == sorted(values)
+
+
+class TestPerformanceSortedSearch:
+    @pytest.mark.performance
+    def test_lookup_versus_scan(self):
+        import random
+        import timeit
+        n = 100000
+        raarray = RandomAccessArray(0, typecode='q', dynamic=True)
+        raarray.extend(range(0, 2 * n, 2))
+        raarray.mark_sorted()
+        targets = [random.randrange(2 * n) for _ in range(100)]
+        search_time = timeit.timeit(lambda: [raarray.bisect_left(x) for x in targets], number=1)
+        scan_time = timeit.timeit(lambda: [next((i for i, v in enumerate(raarray) if v >= x), n) for x in targets], number=1)
+        print(f"\nbisect {search_time * 1e6 / 100:.1f} us, linear scan {scan_time * 1e6 / 100:.0f} us per lookup for {n} elements")
+        assert [raarray.bisect_left(x) for x in targets] == [(x + 1) // 2 for x in targets]
+
+
+class TestPerformanceFilledPrefix:
+    @pytest.mark.performance
+    def test_preallocated_sort(self):
+        import random
+        import timeit
+        n, filled = 1000000, 1000
+        raarray = RandomAccessArray(n)
+        values = [random.random() for _ in range(filled)]
+        def sort():
+            for i, val in enumerate(values):
+                raarray[i] = val
+            raarray.insertion_sort()
+        elapsed = timeit.timeit(sort, number=1)
+        iterate = timeit.timeit(lambda: list(raarray), number=10) / 10
+        print(f"\ninsertion sort {elapsed * 1e3:.1f} ms, iteration {iterate * 1e6:.0f} us for {filled} of {n} slots")
+        assert list(raarray) == sorted(values)
@@ -0,0 +1,199 @@
+import operator
+import random
+
+import pytest
+from ofnodes.structures.ndrandomaccessarray import NDRandomAccessArray
+from ofnodes.structures.randomaccessarray import RandomAccessArray
+from ofnodes.structures.rangeindex import FenwickTree, SegmentTree
+
+
+@pytest.fixture
+def raarray():
+    raarray = RandomAccessArray(8, fill=0)
+    for i, val in enumerate([8, 2, 6, 4, 5, 1, 7, 3]):
+        raarray[i] = val
+    return raarray
+
+
+class TestFenwickTree:
+
+    def test_matches_rescans(self):
+        values = [random.randint(-50, 50) for _ in range(100)]
+        sums = FenwickTree(values)
+        for _ in range(200):
+            i, new = random.randrange(100), random.randint(-50, 50)
+            sums.update(i, values[i], new)
+            values[i] = new
+            lo = random.randrange(101)
+            hi = random.randrange(lo, 101)
+            assert sums.range_query(lo, hi) == sum(values[lo:hi])
+        assert len(sums) == 100
+
+    def test_append_and_pop(self):
+        values, sums = [], FenwickTree()
+        for _ in range(100):
+            values.append(random.randint(-50, 50))
+            sums.append(values[-1])
+            if random.random() < 0.3:
+                values.pop()
+                sums.pop()
+            assert len(sums) == len(values)
+            assert sums.range_query(0, len(values)) == sum(values)
+            lo = random.randrange(len(values) + 1)
+            assert sums.range_query(lo, len(values)) == sum(values[lo:])
+        with pytest.raises(IndexError):
+            FenwickTree().pop()
+
+    def test_invalid_ranges(self):
+        sums = FenwickTree([1, 2, 3])
+        assert sums.range_query(1, 1) == 0
+        with pytest.raises(IndexError):
+            sums.range_query(2, 1)
+        with pytest.raises(IndexError):
+            sums.range_query(0, 4)
+
+
+class TestSegmentTree:
+
+    @pytest.mark.parametrize('op', [min, max, operator.add])
+    def test_matches_rescans(self, op):
+        values = [random.randint(-50, 50) for _ in range(37)]
+        tree = SegmentTree(values, op=op)
+        for _ in range(200):
+            i, new = random.randrange(37), random.randint(-50, 50)
+            tree.update(i, values[i], new)
+            values[i] = new
+            lo = random.randrange(37)
+            hi = random.randrange(lo + 1, 38)
+            expected = values[lo]
+            for value in values[lo + 1:hi]:
+                expected = op(expected, value)
+            assert tree.range_query(lo, hi) == expected
+
+    def test_append_and_pop(self):
+        values, tree = [], SegmentTree(op=operator.add)
+        for _ in range(100):
+            values.append(random.choice('abcdef'))
+            tree.append(values[-1])
+            if random.random() < 0.3 and len(values) > 1:
+                values.pop()
+                tree.pop()
+            assert len(tree) == len(values)
+            lo = random.randrange(len(values))
+            hi = random.randrange(lo + 1, len(values) + 1)
+            assert tree.range_query(lo, hi) == ''.join(values[lo:hi])
+        with pytest.raises(IndexError):
+            tree.range_query(0, len(values) + 1)
+        with pytest.raises(IndexError):
+            SegmentTree().pop()
+
+    def test_non_commutative_op_keeps_order(self):
+        tree = SegmentTree('abcdefg', op=operator.add)
+        assert tree.range_query(0, 7) == 'abcdefg'
+        assert tree.range_query(2, 5) == 'cde'
+        tree.update(3, 'd', 'D')
+        assert tree.range_query(1, 6) == 'bcDef'
+
+    def test_invalid_ranges(self):
+        tree = SegmentTree([1, 2, 3])
+        assert tree.op is min and len(tree) == 3
+        with pytest.raises(IndexError):
+            tree.range_query(1, 1)
+        with pytest.raises(IndexError):
+            tree.range_query(0, 4)
+
+
+class TestAttachedIndexes:
+
+    def test_element_writes_update_incrementally(self, raarray):
+        sums = raarray.attach_index(FenwickTree())
+        mins = raarray.attach_index(SegmentTree(op=min))
+        assert sums.range_query(0, 8) == 36 and mins.range_query(0, 4) == 2
+        raarray[1] = 20
+        raarray[-1] = 0
+        assert sums.range_query(0, 8) == 51 and mins.range_query(0, 4) == 4
+        assert mins.range_query(4, 8) == 0
+
+    def test_bulk_operations_rebuild(self, raarray):
+        sums = raarray.attach_index(FenwickTree())
+        mins = raarray.attach_index(SegmentTree())
+        raarray.insertion_sort()
+        assert mins.range_query(0, 2) == 1 and sums.range_query(0, 2) == 3
+        raarray.reverse_order()
+        assert mins.range_query(0, 2) == 7
+        raarray.sort()
+        assert sums.range_query(6, 8) == 15
+        raarray.view(step=2)[0] = 100
+        assert sums.range_query(0, 1) == 100
+        raarray[:] = list(range(8))
+        assert sums.range_query(0, 8) == 28
+
+    def test_dynamic_arrays(self):
+        raarray = RandomAccessArray(0, dynamic=True)
+        sums = raarray.attach_index(FenwickTree())
+        raarray.extend([1, 2, 3])
+        raarray.append(4)
+        raarray.insert(0, 10)
+        assert sums.range_query(0, 5) == 20
+        raarray.pop(1)
+        assert len(sums) == 4 and sums.range_query(0, 4) == 19
+
+    def test_appends_and_end_pops_do_not_rebuild(self, monkeypatch):
+        raarray = RandomAccessArray(0, dynamic=True)
+        sums = raarray.attach_index(FenwickTree())
+        mins = raarray.attach_index(SegmentTree())
+        rebuilds = []
+        for cls in (FenwickTree, SegmentTree):
+            def build(self, values, build=cls.build):
+                rebuilds.append(type(self).__name__)
+                build(self, values)
+            monkeypatch.setattr(cls, 'build', build)
+        raarray.extend([5, 3, 8])
+        raarray.append(1)
+        raarray.insert(4, 9)
+        assert raarray.pop() == 9 and raarray.pop(-1) == 1
+        assert rebuilds == []
+        assert sums.range_query(0, 3) == 16 and mins.range_query(0, 3) == 3
+        raarray.insert(0, 2)  # elements shift, so each index is rebuilt once
+        assert rebuilds == ['FenwickTree', 'SegmentTree']
+        assert sums.range_query(0, 4) == 18 and mins.range_query(1, 4) == 3
+        raarray.pop(0)
+        assert len(sums) == len(mins) == 3 and mins.range_query(0, 1) == 5
+
+    def test_nd_writes(self):
+        grid = NDRandomAccessArray((2, 3), fill=0)
+        sums = grid.base.attach_index(FenwickTree())
+        grid[1, 2] = 5
+        grid.T[0, 1] = 3
+        assert sums.range_query(3, 6) == 8
+
+    def test_detach(self, raarray):
+        sums = raarray.attach_index(FenwickTree())
+        raarray.detach_index(sums)
+        raarray[0] = 100
+        assert sums.range_query(0, 1) == 8
+        with pytest.raises(ValueError):
+            raarray.detach_index(sums)
+
+
+class TestPerformanceRangeIndex:
+    @pytest.mark.performance
+    def test_versus_rescans(self):
+        import timeit
+        n, queries = 100000, 1000
+        raarray = RandomAccessArray(n, fill=0)
+        for i in range(n):
+            raarray[i] = random.randint(0, 1000)
+        ranges = [sorted(random.sample(range(n + 1), 2)) for _ in range(queries)]
+        sums = raarray.attach_index(FenwickTree())
+        mins = raarray.attach_index(SegmentTree())
+        for name, query, naive in (
+            ('sum', sums.range_query, lambda lo, hi: sum(raarray[lo:hi])),
+            ('min', mins.range_query, lambda lo, hi: min(raarray[lo:hi])),
+        ):
+            indexed = timeit.timeit(lambda: [query(lo, hi) for lo, hi in ranges], number=1)
+            rescan = timeit.timeit(lambda: [naive(lo, hi) for lo, hi in ranges], number=1)
+            print(f"\nrange {name}: indexed {indexed * 1e6 / queries:.1f} us, rescan {rescan * 1e6 / queries:.0f} us per query over {n} elements")
+            assert [query(lo, hi) for lo, hi in ranges[:10]] == [naive(lo, hi) for lo, hi in ranges[:10]]
+        write = timeit.timeit(lambda: raarray.__setitem__(n // 2, 7), number=1000) / 1000
+        print(f"element write with two attached indexes: {write * 1e6:.1f} us")
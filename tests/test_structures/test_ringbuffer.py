@@ -0,0 +1,69 @@
+# tests/test_structures/test_ringbuffer.py
+import pytest
+from ofnodes.structures.ringbuffer import RingBuffer
+
+class TestRingBuffer:
+    def test_dynamic_attribute_assignment(self):
+        ring = RingBuffer(2)
+        with pytest.raises(AttributeError) as exc_info:
+            ring.fail = True  # pylint: disable=assigning-non-slot
+        assert "object has no attribute" in str(exc_info)
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError) as exc_info:
+            RingBuffer(0)
+        assert "at least 1" in str(exc_info)
+
+    def test_append_and_wrap(self):
+        ring = RingBuffer(3)
+        ring.extend([1, 2])
+        assert list(ring) == [1, 2] and len(ring) == 2 and not ring.is_full()
+        ring.extend([3, 4, 5])
+        assert repr(ring) == 'RingBuffer([3, 4, 5], capacity=3)'
+        assert ring.is_full() and len(ring) == 3
+        assert ring[0] == 3 and ring[-1] == 5
+        with pytest.raises(IndexError):
+            ring[3]
+
+    def test_no_overwrite(self):
+        ring = RingBuffer(2, overwrite=False)
+        ring.extend([1, 2])
+        with pytest.raises(IndexError) as exc_info:
+            ring.append(3)
+        assert "full" in str(exc_info)
+        assert list(ring) == [1, 2]
+
+    def test_popleft(self):
+        ring = RingBuffer(3)
+        ring.extend([1, 2, 3, 4])
+        assert ring.popleft() == 2
+        ring.append(5)
+        assert [ring.popleft() for _ in range(3)] == [3, 4, 5]
+        assert len(ring) == 0 and ring._buffer._data == [None, None, None]
+        with pytest.raises(IndexError) as exc_info:
+            ring.popleft()
+        assert "empty" in str(exc_info)
+
+    def test_snapshot(self):
+        ring = RingBuffer(4)
+        assert ring.snapshot() == ([],)
+        ring.extend([1, 2, 3])
+        assert ring.snapshot() == ([1, 2, 3],)
+        ring.extend([4, 5, 6])
+        assert ring.snapshot() == ([3, 4], [5, 6])
+        ring.extend([7, 8])
+        assert ring.snapshot() == ([5, 6, 7, 8],)
+
+
+class TestPerformanceRingBuffer:
+    @pytest.mark.performance
+    def test_against_collections_deque(self):
+        import collections
+        import timeit
+        n = 200000
+        ring = RingBuffer(1000)
+        window = collections.deque(maxlen=1000)
+        for label, append in (('RingBuffer', ring.append), ('deque(maxlen)', window.append)):
+            elapsed = timeit.timeit(lambda: [append(i) for i in range(n)], number=3) / 3
+            print(f"\n{label}: {n / elapsed:,.0f} appends/sec")
+        assert list(ring) == list(window)
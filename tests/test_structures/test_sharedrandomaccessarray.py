@@ -0,0 +1,111 @@
+import operator
+import pickle
+
+import pytest
+from ofnodes.structures.sharedrandomaccessarray import SharedRandomAccessArray
+
+
+def square(x):
+    return x * x
+
+
+def last(a, b):
+    return b
+
+
+@pytest.fixture
+def shared():
+    with SharedRandomAccessArray(10, typecode='q') as shared:
+        for i in range(10):
+            shared[i] = i
+        yield shared
+
+
+class TestSharedRandomAccessArray:
+
+    def test_init(self):
+        with SharedRandomAccessArray(3, fill=1.5) as shared:
+            assert shared.typecode == 'd' and len(shared) == 3
+            assert list(shared) == [1.5, 1.5, 1.5]
+        with pytest.raises(ValueError):
+            SharedRandomAccessArray(3, typecode='u')
+
+    def test_attach_shares_memory(self, shared):
+        with SharedRandomAccessArray.attach(shared.name) as attached:
+            assert attached.typecode == 'q' and list(attached) == list(range(10))
+            attached[0] = 100
+        assert shared[0] == 100
+        assert not shared.closed
+
+    def test_pickle_attaches(self, shared):
+        with pickle.loads(pickle.dumps(shared)) as attached:
+            attached[1] = -1
+        assert shared[1] == -1
+
+    def test_inherited_operations(self, shared):
+        shared.sort(ascending=False)
+        assert shared.is_sorted and shared.bisect_left(5) == 4
+        shared.view(step=3).reverse_order()
+        assert list(shared) == [0, 8, 7, 3, 5, 4, 6, 2, 1, 9]
+
+    def test_parallel_map(self, shared):
+        shared.parallel_map(square, workers=3)
+        assert list(shared) == [i * i for i in range(10)]
+
+    def test_parallel_reduce(self, shared):
+        assert shared.parallel_reduce(operator.add, 100, workers=3) == 145
+        assert shared.parallel_reduce(operator.add, 0, workers=20) == 45
+
+    def test_parallel_reduce_keeps_chunk_order(self):
+        with SharedRandomAccessArray(6, typecode='q') as shared:
+            for i in range(6):
+                shared[i] = i
+            assert shared.parallel_reduce(last, None, workers=4) == 5
+
+    def test_empty(self):
+        with SharedRandomAccessArray(0) as shared:
+            shared.parallel_map(square)
+            assert shared.parallel_reduce(operator.add, 7) == 7
+
+    def test_close_unlinks(self):
+        shared = SharedRandomAccessArray(4)
+        name = shared.name
+        shared.close()
+        shared.close()
+        assert shared.closed
+        assert repr(shared) == f"SharedRandomAccessArray(name={name!r}, closed)"
+        with pytest.raises(FileNotFoundError):
+            SharedRandomAccessArray.attach(name)
+
+    def test_garbage_collection_unlinks(self):
+        import gc
+        shared = SharedRandomAccessArray(4)
+        name = shared.name
+        del shared
+        gc.collect()
+        with pytest.raises(FileNotFoundError):
+            SharedRandomAccessArray.attach(name)
+
+    def test_attach_rejects_foreign_segment(self):
+        from multiprocessing import shared_memory
+        foreign = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(ValueError):
+                SharedRandomAccessArray.attach(foreign.name)
+        finally:
+            foreign.close()
+            foreign.unlink()
+
+
+class TestPerformanceSharedRandomAccessArray:
+    @pytest.mark.performance
+    def test_parallel_versus_serial(self):
+        import os
+        import timeit
+        n = 1000000
+        with SharedRandomAccessArray(n, typecode='d', fill=2.0) as shared:
+            serial = timeit.timeit(lambda: sum(shared), number=1)
+            workers = os.cpu_count()
+            parallel = timeit.timeit(lambda: shared.parallel_reduce(operator.add, 0.0, workers=workers), number=1)
+            print(f"\nserial sum {serial * 1e3:.0f} ms, parallel_reduce {parallel * 1e3:.0f} ms on {workers} workers for {n} elements")
+            assert shared.parallel_reduce(operator.add, 0.0, workers=workers) == 2.0 * n
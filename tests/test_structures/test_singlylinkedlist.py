@@ -1,5 +1,5 @@
 import pytest
-from ofnodes.structures.singlylinkedlist import SinglyLinkedList
+from ofnodes.structures.singlylinkedlist import SinglyLinkedList, kway_merge
 from ofnodes.nodes.singlynode import SinglyNode
 
 class TestCycleDetectionMixin:
@@ -73,6 +73,8 @@ class TestSinglyLinkedList:
         dirr = [
             "__add__",
             "__class__",
+            "__copy__",
+            "__deepcopy__",
             "__delattr__",
             "__dir__",
             "__doc__",
@@ -80,12 +82,15 @@ class TestSinglyLinkedList:
             "__format__",
             "__ge__",
             "__getattribute__",
+            "__getitem__",
             "__getstate__",
             "__gt__",
             "__hash__",
             "__init__",
             "__init_subclass__",
+            "__iter__",
             "__le__",
+            "__len__",
             "__lt__",
             "__module__",
             "__ne__",
@@ -94,6 +99,8 @@ class TestSinglyLinkedList:
             "__reduce_ex__",
             "__repr__",
             "__setattr__",
+            "__setitem__",
+            "__setstate__",
             "__sizeof__",
             "__slots__",
             "__str__",
@@ -106,15 +113,22 @@ class TestSinglyLinkedList:
             "insert_head",
             "insert_tail",
             "insertion_sort",
+            "merge_sorted",
+            "open_mmap",
+            "partition",
             "print_node_data",
+            "quicksort",
             "reference_based_cycle_detection",
             "remove",
             "remove_head",
             "remove_tail",
+            "repr_edge_items",
             "reverse_order",
+            "save",
             "search",
             "tail",
             "target",
+            "write_to",
         ]
         assert dir(sllist) == dirr
         assert "__dict__" not in str(dir(sllist))
@@ -315,3 +329,314 @@ class TestSortingInstanceMethods:
         sllist.reverse_order()
         assert repr(sllist) == "SinglyLinkedList([5, 4, 6, 2, 8])"
         assert str(sllist) == "5 -> 4 -> 6 -> 2 -> 8"
+
+
+class TestIndexAccess:
+    def test_getitem(self):
+        sllist = SinglyLinkedList([8, 2, 6, 4, 5])
+        assert [sllist[i] for i in range(len(sllist))] == [8, 2, 6, 4, 5]
+        assert sllist[-1] == 5 and sllist[-5] == 8
+        assert sllist[3] == 4 and sllist[1] == 2  # finger behind the index
+        with pytest.raises(IndexError):
+            sllist[5]
+        with pytest.raises(IndexError):
+            sllist[-6]
+        with pytest.raises(TypeError) as exc_info:
+            sllist['0']
+        assert "indices must be integers or slices" in str(exc_info)
+
+    def test_last_item_is_the_tail(self):
+        sllist = SinglyLinkedList([8, 2, 6])
+        assert sllist[-1] == 6
+        sllist.remove_tail()
+        sllist.tail = 4
+        assert sllist[-1] == 4
+        sllist[-1] = 5
+        assert sllist.tail.data == 5 and list(sllist) == [8, 2, 5]
+        with pytest.raises(IndexError):
+            SinglyLinkedList()[-1]
+
+    def test_getitem_slice(self):
+        sllist = SinglyLinkedList([8, 2, 6, 4, 5])
+        assert repr(sllist[1:4]) == "SinglyLinkedList([2, 6, 4])"
+        assert repr(sllist[::2]) == "SinglyLinkedList([8, 6, 5])"
+        assert repr(sllist[::-1]) == "SinglyLinkedList([5, 4, 6, 2, 8])"
+        assert repr(sllist[4:1]) == "SinglyLinkedList()"
+
+    def test_setitem(self):
+        sllist = SinglyLinkedList([8, 2, 6])
+        sllist[1] = 0
+        sllist[-1] = 'foo'
+        assert repr(sllist) == "SinglyLinkedList([8, 0, 'foo'])"
+        with pytest.raises(IndexError):
+            sllist[3] = 42
+
+    def test_setitem_slice(self):
+        sllist = SinglyLinkedList([8, 2, 6, 4, 5])
+        sllist[1:3] = ['foo', 'bar', 'baz']
+        assert repr(sllist) == "SinglyLinkedList([8, 'foo', 'bar', 'baz', 4, 5])"
+        sllist[:2] = []
+        assert repr(sllist) == "SinglyLinkedList(['bar', 'baz', 4, 5])"
+        sllist[2:] = [42]
+        assert repr(sllist) == "SinglyLinkedList(['bar', 'baz', 42])"
+        assert sllist.tail.data == 42 and sllist.tail.next is None
+        sllist[::2] = [1, 3]
+        assert repr(sllist) == "SinglyLinkedList([1, 'baz', 3])"
+        with pytest.raises(ValueError) as exc_info:
+            sllist[::2] = [1]
+        assert "extended slice of size 2" in str(exc_info)
+        sllist[:] = []
+        assert sllist.head is None and sllist.tail is None
+        sllist[:] = [7]
+        assert sllist.head is sllist.tail and sllist[0] == 7
+
+    def test_cache_invalidation(self):
+        sllist = SinglyLinkedList([8, 2, 6, 4, 5], skip_index=True)
+        assert sllist[3] == 4
+        sllist.head = 42
+        assert sllist[3] == 6
+        sllist.remove_head()
+        sllist.insert_after_target(2, 'after')
+        assert list(sllist) == [8, 2, 'after', 6, 4, 5]
+        assert sllist[3] == 6
+        sllist.remove('after')
+        assert sllist[3] == 4
+        sllist.remove_tail()
+        with pytest.raises(IndexError):
+            sllist[4]
+        sllist.tail = 1
+        assert sllist[4] == 1
+        sllist.insertion_sort()
+        assert [sllist[i] for i in range(5)] == [1, 2, 4, 6, 8]
+
+    def test_skip_index(self):
+        sllist = SinglyLinkedList(range(100), skip_index=True)
+        assert sllist[57] == 57 and sllist[3] == 3 and sllist[99] == 99
+        step, nodes = sllist._skips
+        assert step == 10 and len(nodes) == 10
+        sllist.insert_before_target(50, 'before')
+        assert sllist._skips is None
+        assert sllist[50] == 'before' and sllist[51] == 50
+        for i in range(100, 120):
+            sllist.tail = i
+        assert sllist[120] == 119
+
+    def test_skip_index_follows_tail_appends(self):
+        sllist = SinglyLinkedList(range(100), skip_index=True)
+        assert sllist[0] == 0
+        for i in range(100, 500):
+            sllist.tail = i
+        assert sllist[457] == 457
+        step, nodes = sllist._skips
+        assert step == 10 and len(nodes) == 46
+        assert all(nodes[i].data == i * step for i in range(len(nodes)))
+        assert sllist[3] == 3
+        step, nodes = sllist._skips
+        assert step == 22 and len(nodes) == 23
+        with pytest.raises(IndexError):
+            sllist[500]
+
+class TestPerformanceIndexAccess:
+    @pytest.mark.performance
+    def test_sequential_index_loop(self):
+        sllist = SinglyLinkedList(range(100000))
+        assert [sllist[i] for i in range(len(sllist))] == list(range(100000))
+    @pytest.mark.performance
+    def test_random_access_with_skip_index(self):
+        import random
+        sllist = SinglyLinkedList(range(100000), skip_index=True)
+        indexes = [random.randrange(100000) for _ in range(10000)]
+        assert [sllist[i] for i in indexes] == indexes
+    @pytest.mark.performance
+    def test_bounded_repr_of_large_list(self):
+        sllist = SinglyLinkedList(range(1000000))
+        assert repr(sllist).endswith("999999], len=1000000)")
+
+
+class TestSerialization:
+    def test_pickle_long_list(self):
+        import pickle
+        sllist = SinglyLinkedList(range(10000), skip_index=True)
+        sllist.target = 42
+        restored = pickle.loads(pickle.dumps(sllist))
+        assert list(restored) == list(range(10000))
+        assert restored.tail.data == 9999 and restored.tail.next is None
+        assert restored.target == 42 and restored._skip_index is True
+        assert restored[5000] == 5000
+
+    def test_pickle_empty_list(self):
+        import pickle
+        restored = pickle.loads(pickle.dumps(SinglyLinkedList()))
+        assert restored.head is None and restored.tail is None
+
+    def test_node_target_is_not_kept(self):
+        import pickle
+        sllist = SinglyLinkedList(['foo', 'bar'])
+        sllist.target = sllist.head
+        assert pickle.loads(pickle.dumps(sllist)).target is None
+
+    def test_copy(self):
+        import copy
+        payload = ['mutable']
+        sllist = SinglyLinkedList([payload, 42])
+        shallow = copy.copy(sllist)
+        assert shallow.head is not sllist.head and shallow.head.data is payload
+        assert shallow.tail.data == 42
+        deep = copy.deepcopy(sllist)
+        assert deep.head.data == payload and deep.head.data is not payload
+
+    def test_deepcopy_long_list(self):
+        import copy
+        sllist = SinglyLinkedList(range(10000))
+        deep = copy.deepcopy(sllist)
+        assert list(deep) == list(sllist)
+        deep.tail = 'appended'
+        assert sllist.tail.data == 9999
+
+
+class TestBoundedRepresentation:
+    def test_truncated_repr_and_str(self):
+        sllist = SinglyLinkedList(range(1000))
+        assert repr(sllist) == (
+            "SinglyLinkedList([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ..., "
+            "990, 991, 992, 993, 994, 995, 996, 997, 998, 999], len=1000)"
+        )
+        assert str(sllist) == (
+            "0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 8 -> 9 -> ... -> "
+            "990 -> 991 -> 992 -> 993 -> 994 -> 995 -> 996 -> 997 -> 998 -> 999 (1000 nodes)"
+        )
+
+    def test_boundary(self):
+        assert 'len=' not in repr(SinglyLinkedList(range(20)))
+        assert repr(SinglyLinkedList(range(21))).endswith(
+            "..., 11, 12, 13, 14, 15, 16, 17, 18, 19, 20], len=21)"
+        )
+
+    def test_full_repr_when_disabled(self):
+        class FullSinglyLinkedList(SinglyLinkedList):
+            __slots__ = ()
+            repr_edge_items = None
+        sllist = FullSinglyLinkedList(range(100))
+        assert repr(sllist) == f"FullSinglyLinkedList({list(range(100))})"
+
+    def test_write_to(self):
+        import io
+        sllist = SinglyLinkedList(['foo', 42, None])
+        stream = io.StringIO()
+        sllist.write_to(stream)
+        assert stream.getvalue() == "foo\n42\nNone\n"
+        stream = io.StringIO()
+        sllist.write_to(stream, fmt="{!r},")
+        assert stream.getvalue() == "'foo',42,None,"
+        with pytest.raises(ValueError):
+            sllist.write_to(stream, chunk_size=0)
+
+    def test_write_to_chunks(self):
+        class Stream:
+            def __init__(self):
+                self.writes = []
+            def write(self, text):
+                self.writes.append(text)
+        stream = Stream()
+        SinglyLinkedList(range(10)).write_to(stream, chunk_size=4)
+        assert stream.writes == ["0\n1\n2\n3\n", "4\n5\n6\n7\n", "8\n9\n"]
+
+
+def node_ids(*lists):
+    ids = set()
+    for sllist in lists:
+        node = sllist.head
+        while node:
+            ids.add(id(node))
+            node = node.next
+    return ids
+
+
+class TestMergeSorted:
+    def test_interleaves_and_empties_other(self):
+        sllist, other = SinglyLinkedList([1, 3, 5, 7]), SinglyLinkedList([2, 3, 8, 9])
+        ids = node_ids(sllist, other)
+        sllist.merge_sorted(other)
+        assert list(sllist) == [1, 2, 3, 3, 5, 7, 8, 9]
+        assert node_ids(sllist) == ids
+        assert sllist.tail.data == 9 and sllist.tail.next is None
+        assert other.head is None and other.tail is None and len(other) == 0
+        sllist.tail = 10
+        assert sllist[-1] == 10
+
+    def test_stable_with_key(self):
+        sllist = SinglyLinkedList([(1, 'a'), (2, 'a')])
+        other = SinglyLinkedList([(1, 'b'), (2, 'b'), (3, 'b')])
+        sllist.merge_sorted(other, key=lambda pair: pair[0])
+        assert list(sllist) == [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b'), (3, 'b')]
+        assert sllist.tail.data == (3, 'b')
+
+    def test_empty_lists(self):
+        sllist, other = SinglyLinkedList(), SinglyLinkedList([1, 2])
+        sllist.merge_sorted(other)
+        assert list(sllist) == [1, 2] and sllist.tail.data == 2 and other.head is None
+        sllist.merge_sorted(SinglyLinkedList())
+        assert list(sllist) == [1, 2]
+        with pytest.raises(ValueError):
+            sllist.merge_sorted(sllist)
+
+
+class TestKwayMerge:
+    def test_streams_without_modifying(self):
+        import random
+        shards = [SinglyLinkedList(sorted(random.randint(0, 50) for _ in range(n))) for n in (0, 1, 20, 35, 7)]
+        expected = sorted(value for shard in shards for value in shard)
+        before = [list(shard) for shard in shards]
+        merged = kway_merge(*shards)
+        assert list(merged) == expected
+        assert [list(shard) for shard in shards] == before
+
+    def test_stable(self):
+        shards = [SinglyLinkedList([(i, shard) for i in range(0, 10, shard + 1)]) for shard in range(3)]
+        merged = list(kway_merge(*shards, key=lambda pair: pair[0]))
+        assert merged == sorted((pair for shard in shards for pair in shard), key=lambda pair: pair[0])
+
+    def test_as_list_relinks(self):
+        shards = [SinglyLinkedList([1, 4]), SinglyLinkedList([2, 3, 9]), SinglyLinkedList()]
+        ids = node_ids(*shards)
+        merged = kway_merge(*shards, as_list=True)
+        assert list(merged) == [1, 2, 3, 4, 9]
+        assert merged.tail.data == 9
+        assert node_ids(merged) == ids
+        assert all(shard.head is None for shard in shards)
+        with pytest.raises(ValueError):
+            kway_merge(merged, merged, as_list=True)
+
+    def test_no_lists(self):
+        assert list(kway_merge()) == []
+        assert repr(kway_merge(as_list=True)) == 'SinglyLinkedList()'
+
+
+class TestPerformanceMerge:
+    @pytest.mark.performance
+    def test_versus_concatenate_and_sort(self):
+        import random
+        import timeit
+        n, k = 100000, 16
+        values = [random.random() for _ in range(n)]
+        shards = [sorted(values[i::k]) for i in range(k)]
+
+        def concatenate_and_sort():
+            sllist = SinglyLinkedList(value for shard in shards for value in shard)
+            sllist.quicksort()
+            return sllist
+
+        def merge_pairwise():
+            lists = [SinglyLinkedList(shard) for shard in shards]
+            for sllist in lists[1:]:
+                lists[0].merge_sorted(sllist)
+            return lists[0]
+
+        def merge_kway():
+            return kway_merge(*(SinglyLinkedList(shard) for shard in shards), as_list=True)
+
+        build = timeit.timeit(lambda: [SinglyLinkedList(shard) for shard in shards], number=1)
+        for merge in (concatenate_and_sort, merge_pairwise, merge_kway):
+            elapsed = timeit.timeit(merge, number=1) - build
+            print(f"\n{merge.__name__}: {elapsed * 1e3:.0f} ms for {n} nodes in {k} lists")
+            assert list(merge()) == sorted(values)
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+from ofnodes.structures.skiplist import SkipList
+
+
+def assert_structure(skiplist):
+    """Checks every link of every level and its width against the level 0 order."""
+    nodes, node = [], skiplist.head
+    while node is not None:
+        nodes.append(node)
+        node = node.next
+    assert len(nodes) == len(skiplist)
+    rank = {id(node): i + 1 for i, node in enumerate(nodes)}
+    head = skiplist._head
+    for level in range(skiplist.levels):
+        node, node_rank = head, 0
+        while node is not None:
+            following = node._forward[level]
+            following_rank = len(nodes) + 1 if following is None else rank[id(following)]
+            assert node._widths[level] == following_rank - node_rank
+            expected = next((n for n in nodes[node_rank:] if n.level > level), None)
+            assert following is expected
+            node, node_rank = following, following_rank
+    assert skiplist.levels == 1 or head._forward[skiplist.levels - 1] is not None
+
+
+class TestSkipList:
+
+    def test_insert_keeps_order(self):
+        values = [random.randint(0, 50) for _ in range(300)]
+        skiplist = SkipList(values, seed=7)
+        assert list(skiplist) == sorted(values)
+        assert_structure(skiplist)
+
+    def test_empty(self):
+        skiplist = SkipList()
+        assert len(skiplist) == 0 and list(skiplist) == [] and skiplist.head is None
+        assert repr(skiplist) == 'SkipList([])'
+        assert 1 not in skiplist and not skiplist.search(1)
+        assert skiplist.rank(1) == 0 and list(skiplist.iter_range(0, 5)) == []
+        with pytest.raises(IndexError):
+            skiplist[0]
+        with pytest.raises(ValueError):
+            skiplist.remove(1)
+
+    def test_seed_is_reproducible(self):
+        def levels(skiplist):
+            node, result = skiplist.head, []
+            while node is not None:
+                result.append(node.level)
+                node = node.next
+            return result
+        first, second = SkipList(range(200), seed=3), SkipList(range(200), seed=3)
+        assert levels(first) == levels(second)
+        assert levels(first) != levels(SkipList(range(200), seed=4))
+
+    def test_remove(self):
+        values = [random.randint(0, 30) for _ in range(200)]
+        skiplist = SkipList(values, seed=11)
+        expected = sorted(values)
+        random.shuffle(values)
+        for value in values[:150]:
+            skiplist.remove(value)
+            expected.remove(value)
+            assert_structure(skiplist)
+        assert list(skiplist) == expected
+        with pytest.raises(ValueError):
+            skiplist.remove(100)
+
+    def test_equal_keys_keep_insertion_order(self):
+        pairs = [(random.randint(0, 5), i) for i in range(100)]
+        skiplist = SkipList(pairs, key=lambda pair: pair[0], seed=5)
+        assert list(skiplist) == sorted(pairs, key=lambda pair: pair[0])
+        assert pairs[50] in skiplist and (pairs[50][0], -1) not in skiplist
+        skiplist.remove(pairs[50])
+        assert pairs[50] not in skiplist
+        assert_structure(skiplist)
+
+    def test_search_rank_and_indexing(self):
+        values = [random.randint(0, 100) for _ in range(250)]
+        skiplist = SkipList(values, seed=9)
+        expected = sorted(values)
+        for x in range(-1, 102):
+            assert skiplist.search(x) == (x in expected)
+            assert skiplist.rank(x) == sum(value < x for value in expected)
+            assert skiplist.bisect_right(x) == sum(value <= x for value in expected)
+        assert [skiplist[i] for i in range(len(expected))] == expected
+        assert skiplist[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            skiplist[len(expected)]
+
+    def test_iter_range(self):
+        skiplist = SkipList(range(0, 100, 3), seed=1)
+        assert list(skiplist.iter_range(10, 22)) == [12, 15, 18, 21]
+        assert skiplist.count_range(10, 22) == 4
+        assert list(skiplist.iter_range(hi=7)) == [0, 3, 6]
+        assert list(skiplist.iter_range(95)) == [96, 99]
+        assert skiplist.count_range(22, 10) == 0
+
+    def test_from_sorted(self):
+        values = sorted(random.randint(0, 1000) for _ in range(500))
+        skiplist = SkipList.from_sorted(values, seed=2)
+        assert list(skiplist) == values
+        assert_structure(skiplist)
+        skiplist.insert(500)
+        skiplist.remove(values[0])
+        assert_structure(skiplist)
+        assert list(skiplist) == sorted(values[1:] + [500])
+        with pytest.raises(ValueError):
+            SkipList.from_sorted([2, 1])
+        assert list(SkipList.from_sorted([])) == []
+
+
+class TestPerformanceSkipList:
+    @pytest.mark.performance
+    def test_versus_sorted_linked_list(self):
+        import timeit
+        from ofnodes.structures.singlylinkedlist import SinglyLinkedList
+        n = 5000
+        values = random.sample(range(10 * n), n)
+
+        def sorted_linked_list():
+            sllist = SinglyLinkedList()
+            for value in values:
+                node = sllist.head
+                if node is None or value < node.data:
+                    sllist.head = value
+                    continue
+                while node.next is not None and node.next.data < value:
+                    node = node.next
+                sllist.insert_after_target(node.data, value)
+            return sllist
+
+        skip_time = timeit.timeit(lambda: SkipList(values, seed=0), number=1)
+        bulk_time = timeit.timeit(lambda: SkipList.from_sorted(sorted(values), seed=0), number=1)
+        linked_time = timeit.timeit(sorted_linked_list, number=1)
+        skiplist = SkipList(values, seed=0)
+        lookup_time = timeit.timeit(lambda: [skiplist.search(value) for value in values], number=1)
+        print(f"\n{n} inserts: skip list {skip_time * 1e3:.0f} ms, from_sorted {bulk_time * 1e3:.0f} ms, "
+              f"sorted linked list {linked_time * 1e3:.0f} ms; {lookup_time / n * 1e6:.1f} us per search")
+        assert list(skiplist) == sorted(values)
@@ -0,0 +1,106 @@
+import pytest
+from ofnodes.structures.sparserandomaccessarray import SparseRandomAccessArray
+
+
+@pytest.fixture
+def sparse():
+    sparse = SparseRandomAccessArray(10 ** 9)
+    for index, value in ((500, 8), (3, 2), (10 ** 9 - 1, 6), (42, 4), (7, 5)):
+        sparse[index] = value
+    return sparse
+
+
+class TestSparseRandomAccessArray:
+
+    def test_init(self):
+        sparse = SparseRandomAccessArray(10 ** 12, default=0)
+        assert len(sparse) == 10 ** 12 and sparse.populated == 0
+        assert sparse[10 ** 11] == 0 and sparse.default == 0
+        with pytest.raises(ValueError):
+            SparseRandomAccessArray(-1)
+
+    def test_item_access(self, sparse):
+        assert sparse[500] == 8 and sparse[-1] == 6 and sparse[501] is None
+        assert sparse.populated == 5
+        with pytest.raises(IndexError):
+            sparse[10 ** 9]
+        with pytest.raises(IndexError):
+            sparse[-10 ** 9 - 1] = 1
+        assert sparse[2:8] == [None, 2, None, None, None, 5]
+
+    def test_default_writes_depopulate(self, sparse):
+        sparse[3] = None
+        del sparse[42]
+        del sparse[43]
+        assert sparse.populated == 3
+        assert sparse.indices() == [7, 500, 10 ** 9 - 1]
+
+    def test_iteration_in_index_order(self, sparse):
+        assert list(sparse.values()) == [2, 5, 4, 8, 6]
+        assert list(sparse.items()) == [(3, 2), (7, 5), (42, 4), (500, 8), (10 ** 9 - 1, 6)]
+        assert 4 in sparse and None in sparse and 9 not in sparse
+        small = SparseRandomAccessArray(4, default=0)
+        small[2] = 7
+        assert list(small) == [0, 0, 7, 0]
+
+    def test_order_follows_interleaved_writes(self, sparse):
+        assert sparse.indices() == [3, 7, 42, 500, 10 ** 9 - 1]
+        sparse[1] = 1
+        del sparse[500]
+        sparse[42] = 9
+        assert sparse.indices() == [1, 3, 7, 42, 10 ** 9 - 1]
+        values = sparse.values()
+        sparse[0] = 0
+        assert list(values) == [1, 2, 5, 9, 6]
+        assert list(sparse.values()) == [0, 1, 2, 5, 9, 6]
+
+    def test_sorts_keep_populated_indices(self, sparse):
+        sparse.bubble_sort()
+        assert list(sparse.values()) == [2, 4, 5, 6, 8]
+        assert sparse.indices() == [3, 7, 42, 500, 10 ** 9 - 1]
+        sparse.insertion_sort(ascending=False)
+        assert list(sparse.values()) == [8, 6, 5, 4, 2]
+        sparse.reverse_order()
+        assert list(sparse.values()) == [2, 4, 5, 6, 8]
+        sparse.sort(key=lambda x: -x)
+        assert sparse[3] == 8 and sparse[10 ** 9 - 1] == 2
+
+    def test_repr_and_str(self):
+        sparse = SparseRandomAccessArray(100, default=0)
+        sparse[9], sparse[1] = 'b', 'a'
+        assert repr(sparse) == "SparseRandomAccessArray({1: 'a', 9: 'b'}, size=100, default=0)"
+        assert str(sparse) == "[a, b]"
+
+
+class TestPerformanceSparseRandomAccessArray:
+    @pytest.mark.performance
+    def test_memory(self):
+        import random
+        import tracemalloc
+        n, populated = 10 ** 9, 100000
+        tracemalloc.start()
+        sparse = SparseRandomAccessArray(n)
+        for index in random.sample(range(n), populated):
+            sparse[index] = index
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"\n{current / 2 ** 20:.1f} MiB for {populated} of {n} slots, {current / populated:.0f} bytes per populated slot")
+        assert sparse.indices() == sorted(sparse.indices())
+
+    @pytest.mark.performance
+    def test_random_population(self):
+        import random
+        import time
+        n = 10 ** 9
+        for populated in (10 ** 6, 2 * 10 ** 6, 4 * 10 ** 6):
+            indices = random.sample(range(n), populated)
+            sparse = SparseRandomAccessArray(n)
+            start = time.perf_counter()
+            for index in indices:
+                sparse[index] = 1
+            populate = time.perf_counter() - start
+            start = time.perf_counter()
+            first = next(sparse.items())
+            order = time.perf_counter() - start
+            print(f"\n{populated} random slots: populate {populate:.2f} s, first ordered visit {order:.2f} s")
+            assert first == (min(indices), 1) and sparse.populated == populated
@@ -19,6 +19,8 @@ class TestStack:
         stack = Stack()
         dirr = [
             '__class__',
+            '__copy__',
+            '__deepcopy__',
             '__delattr__',
             '__dir__',
             '__doc__',
@@ -40,6 +42,7 @@ class TestStack:
             '__reduce_ex__',
             '__repr__',
             '__setattr__',
+            '__setstate__',
             '__sizeof__',
             '__slots__',
             '__str__',
@@ -54,6 +57,8 @@ class TestStack:
             'remove',
             'remove_head',
             'remove_tail',
+            'repr_edge_items',
+            'write_to',
         ]
         assert dir(stack) == dirr
         assert "__dict__" not in str(dir(stack))
@@ -115,3 +120,28 @@ class TestIsEmpty:
     assert not stack.is_empty()
     stack.pop()
     assert stack.is_empty()
+
+class TestSerialization:
+    def test_pickle_keeps_order(self):
+        import pickle
+        stack = Stack(range(10000))
+        restored = pickle.loads(pickle.dumps(stack))
+        assert restored.peek() == 9999
+        assert restored.pop().data == 9999 and restored.peek() == 9998
+
+    def test_copy(self):
+        import copy
+        stack = Stack([[1], 2])
+        assert repr(copy.copy(stack)) == 'Stack([2, [1]])'
+        deep = copy.deepcopy(stack)
+        assert repr(deep) == 'Stack([2, [1]])'
+        assert deep._head._next.data is not stack._head._next.data
+
+class TestBoundedRepresentation:
+    def test_truncated_repr(self):
+        stack = Stack(range(100))
+        assert repr(stack) == (
+            "Stack([99, 98, 97, 96, 95, 94, 93, 92, 91, 90, ..., "
+            "9, 8, 7, 6, 5, 4, 3, 2, 1, 0], len=100)"
+        )
+        assert str(stack).endswith("-> 1 -> 0 (100 nodes)")